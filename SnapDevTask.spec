@@ -12,7 +12,7 @@ a = Analysis(
         ('EsteLogo.png', '.'),
         ('tasks.db', '.'),
     ],
-    hiddenimports=[],
+    hiddenimports=['waitress', 'numpy'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
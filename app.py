@@ -1,11 +1,47 @@
 import os
+import argparse
+import json
+import logging
 import webbrowser
 import threading
 import sys
-from flask import Flask, render_template, jsonify, request, send_from_directory
-import webview
+import zlib
+from flask import Flask, Response, render_template, jsonify, request, send_from_directory
 import time
 
+try:
+    # Servidor WSGI de produção, em Python puro (empacotável com o PyInstaller)
+    import waitress
+except ImportError:
+    waitress = None
+
+from app.utils.task_import import normalize_task
+from app.utils.task_repository import POSITION_GAP, BoardChangedError, get_repository
+from app.utils.logging_config import setup_logging
+
+# Filho do logger "app" configurado por setup_logging (com __name__ o nome
+# seria "__main__" ao rodar este arquivo como script)
+logger = logging.getLogger("app.web")
+
+# Endereço e número de threads do servidor (também configuráveis pela linha
+# de comando)
+DEFAULT_HOST = os.environ.get("SNAPDEV_WEB_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.environ.get("SNAPDEV_WEB_PORT", "5000"))
+DEFAULT_THREADS = int(os.environ.get("SNAPDEV_WEB_THREADS", "4"))
+
+# Nível de compressão gzip de /api/load (1 = mais rápido, 9 = menor)
+COMPRESSION_LEVEL = 6
+
+# Nomes usados pela interface web para as colunas e prioridades do banco
+WEB_STATUS = {"to_do": "todo", "doing": "in-progress", "done": "done"}
+WEB_PRIORITY = {"Baixa": "low", "Média": "medium", "Alta": "high"}
+
+# Tempos do Pomodoro enviados à interface web
+DEFAULT_POMODORO = {"workTime": 25, "breakTime": 5}
+
+# Número de tarefas serializadas em cada bloco da resposta de /api/load
+LOAD_CHUNK_SIZE = 500
+
 # Verificar se estamos em modo de desenvolvimento ou executável
 if getattr(sys, 'frozen', False):
     # Estamos executando em um executável bundled (PyInstaller)
@@ -18,6 +54,11 @@ else:
     app = Flask(__name__)
     base_dir = os.path.abspath(os.path.dirname(__file__))
 
+# O servidor de desenvolvimento cria uma thread por requisição, então a
+# conexão com o banco é fechada ao final de cada uma; com o waitress as
+# threads são reaproveitadas e cada uma mantém a sua conexão
+app.config["CLOSE_DB_PER_REQUEST"] = True
+
 # Configurar rotas da aplicação
 @app.route('/')
 def index():
@@ -28,40 +69,180 @@ def favicon():
     return send_from_directory(os.path.join(app.root_path, 'static'),
                                'img/icon.png', mimetype='image/png')
 
+def board_etag():
+    """ETag (sem aspas) da versão atual do quadro"""
+    return get_repository().board_version()
+
+def etag_matches(etags, version):
+    """Verifica se o cabeçalho contém a versão, com ou sem compressão"""
+    return etags.contains_weak(version) or etags.contains_weak(f"{version}-gzip")
+
+def expected_versions(etags):
+    """Versões do quadro aceitas pelo cabeçalho If-Match (None para qualquer uma)"""
+    if not etags or etags.star_tag:
+        return None
+    return {etag.removesuffix("-gzip") for etag in etags.as_set(include_weak=True)}
+
+def release_connection():
+    if app.config["CLOSE_DB_PER_REQUEST"]:
+        get_repository().close_thread_connection()
+
+@app.teardown_request
+def release_request_connection(exc=None):
+    release_connection()
+
 # API para salvar dados
 @app.route('/api/save', methods=['POST'])
 def save_data():
-    data = request.json
-    # Em uma aplicação real, você salvaria em um arquivo ou banco de dados
-    # Para um exemplo simples, apenas retornamos sucesso
-    return jsonify({"success": True})
+    """Grava as alterações enviadas pela interface web.
+
+    Corpo: ``{"tasks": [tarefas criadas ou alteradas], "deleted": [ids]}``,
+    com cada tarefa completa, no formato de /api/load.
+    Apenas as tarefas enviadas são gravadas, em uma única transação. Com o
+    cabeçalho If-Match, as alterações são recusadas (412) se o quadro tiver
+    mudado desde a versão informada.
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({"success": False, "error": "corpo JSON inválido"}), 400
+
+    for key in ("tasks", "deleted"):
+        if data.get(key) is not None and not isinstance(data[key], list):
+            return jsonify({"success": False, "error": f"{key} deve ser uma lista"}), 400
+
+    tasks = []
+    for number, record in enumerate(data.get("tasks") or [], start=1):
+        try:
+            tasks.append(normalize_task(record))
+        except ValueError as e:
+            return jsonify({"success": False, "error": f"tarefa {number}: {e}"}), 400
+    deleted = []
+    for number, task_id in enumerate(data.get("deleted") or [], start=1):
+        if isinstance(task_id, bool) or not isinstance(task_id, (str, int)):
+            return jsonify({"success": False, "error": f"exclusão {number}: id inválido: {task_id!r}"}), 400
+        deleted.append(str(task_id))
+
+    repository = get_repository()
+
+    # Tarefas sem posição ficam onde estão ou vão para o fim da nova coluna
+    unplaced = [task for task in tasks if "position" not in task]
+    if unplaced:
+        locations = repository.task_locations(task["id"] for task in unplaced)
+        next_positions = {
+            column: (position or 0.0) + POSITION_GAP
+            for column, position in repository.max_positions().items()
+        }
+        for task in unplaced:
+            column, position = locations.get(task["id"], (None, None))
+            if column != task["column"]:
+                position = next_positions.get(task["column"], POSITION_GAP)
+                next_positions[task["column"]] = position + POSITION_GAP
+            task["position"] = position
+
+    changes = {task["id"]: ("save", task) for task in tasks}
+    changes.update((task_id, ("delete", None)) for task_id in deleted)
+    try:
+        missing = repository.apply_changes(changes, expected_versions(request.if_match))
+    except BoardChangedError:
+        return jsonify({"success": False, "error": "o quadro foi alterado"}), 412
+
+    response = jsonify({
+        "success": True,
+        "saved": [task["id"] for task in tasks],
+        "deleted": [task_id for task_id in deleted if task_id not in missing]
+    })
+    response.set_etag(board_etag())
+    return response
+
+def web_task(row):
+    """Converte a linha do banco no formato da interface web"""
+    task_id, title, description, priority, column_id, position = row
+    return {
+        "id": task_id,
+        "title": title,
+        "description": description or "",
+        "status": WEB_STATUS.get(column_id, column_id),
+        "priority": WEB_PRIORITY.get(priority, "low"),
+        "position": position
+    }
+
+def stream_board():
+    """Gera o JSON do quadro em blocos, direto do cursor do banco"""
+    repository = get_repository()
+    try:
+        yield '{"tasks": ['
+        separator = ""
+        chunk = []
+        for row in repository.iter_tasks():
+            chunk.append(web_task(row))
+            if len(chunk) >= LOAD_CHUNK_SIZE:
+                # Um json.dumps por bloco (sem os colchetes) custa metade de
+                # um por tarefa
+                yield separator + json.dumps(chunk, ensure_ascii=False, separators=(",", ":"))[1:-1]
+                separator, chunk = ",", []
+        if chunk:
+            yield separator + json.dumps(chunk, ensure_ascii=False, separators=(",", ":"))[1:-1]
+        yield '], "pomodoro": ' + json.dumps(DEFAULT_POMODORO) + '}'
+    finally:
+        release_connection()
+
+def gzip_stream(chunks, level=COMPRESSION_LEVEL):
+    """Compacta em gzip os blocos de texto à medida que são gerados"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
 
 # API para carregar dados
 @app.route('/api/load', methods=['GET'])
 def load_data():
-    # Em uma aplicação real, você carregaria de um arquivo ou banco de dados
-    # Este é um exemplo de dados de demonstração
-    return jsonify({
-        "tasks": [
-            {"id": 1, "title": "Criar documentação", "description": "Escrever documentação completa", "status": "todo", "priority": "medium"},
-            {"id": 2, "title": "Implementar API", "description": "Desenvolver endpoints RESTful", "status": "in-progress", "priority": "high"},
-            {"id": 3, "title": "Corrigir bug #123", "description": "Resolver problema na tela de login", "status": "done", "priority": "high"}
-        ],
-        "pomodoro": {
-            "workTime": 25,
-            "breakTime": 5
-        }
-    })
+    """Retorna o quadro, ou 304 se a versão em cache do cliente ainda vale"""
+    version = board_etag()
+    compress = "gzip" in request.accept_encodings
+    # A versão compactada tem um ETag próprio, como exige o HTTP
+    etag = f"{version}-gzip" if compress else version
+    if etag_matches(request.if_none_match, version):
+        response = Response(status=304)
+    else:
+        # A versão é lida antes das tarefas: se o quadro mudar durante o
+        # envio, o cliente recebe dados mais novos que o ETag e apenas
+        # baixa o quadro de novo na próxima vez
+        if compress:
+            response = Response(gzip_stream(stream_board()), mimetype="application/json")
+            response.headers["Content-Encoding"] = "gzip"
+        else:
+            response = Response(stream_board(), mimetype="application/json")
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    response.vary.add("Accept-Encoding")
+    return response
+
+def start_server(host=DEFAULT_HOST, port=DEFAULT_PORT, threads=DEFAULT_THREADS, server="waitress"):
+    """Serve a aplicação; bloqueia até o servidor ser encerrado"""
+    if server == "waitress" and waitress is None:
+        logger.warning("waitress não está instalado; usando o servidor de desenvolvimento")
+        server = "dev"
 
-def start_server():
-    app.run(port=5000, debug=False)
+    if server == "waitress":
+        app.config["CLOSE_DB_PER_REQUEST"] = False
+        logger.info("Servidor waitress em http://%s:%d com %d threads", host, port, threads)
+        waitress.serve(app, host=host, port=port, threads=threads, ident="SnapDevTask")
+    else:
+        app.config["CLOSE_DB_PER_REQUEST"] = True
+        logger.info("Servidor de desenvolvimento em http://%s:%d", host, port)
+        app.run(host=host, port=port, debug=False, threaded=True)
+
+def open_webview(url):
+    # O pywebview só é necessário para abrir a janela
+    import webview
 
-def open_webview():
     # Esperar o servidor iniciar
     time.sleep(1)
     # Abrir a janela webview
     webview.create_window("SnapDev Task - Sistema Kanban", 
-                          "http://localhost:5000",
+                          url,
                           width=1200, 
                           height=800,
                           min_size=(800, 600), 
@@ -70,14 +251,38 @@ def open_webview():
     # Encerrar o aplicativo quando a janela for fechada
     os._exit(0)
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="SnapDev Task - versão web")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"endereço do servidor (padrão: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"porta do servidor (padrão: {DEFAULT_PORT})")
+    parser.add_argument("--threads", type=int, default=DEFAULT_THREADS,
+                        help=f"threads que atendem as requisições (padrão: {DEFAULT_THREADS})")
+    parser.add_argument("--server", choices=("waitress", "dev"), default="waitress",
+                        help="waitress (padrão) ou o servidor de desenvolvimento do Flask")
+    parser.add_argument("--serve-only", action="store_true",
+                        help="apenas o servidor, sem abrir a janela (para acessar pelo navegador)")
+    return parser.parse_args(argv)
+
 if __name__ == '__main__':
+    args = parse_args()
+    setup_logging()
+
+    if args.serve_only:
+        try:
+            start_server(args.host, args.port, args.threads, args.server)
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
     # Iniciar o servidor Flask em uma thread separada
-    server_thread = threading.Thread(target=start_server)
+    server_thread = threading.Thread(
+        target=start_server, args=(args.host, args.port, args.threads, args.server)
+    )
     server_thread.daemon = True
     server_thread.start()
     
     # Iniciar a aplicação webview
-    webview_thread = threading.Thread(target=open_webview)
+    webview_thread = threading.Thread(target=open_webview, args=(f"http://localhost:{args.port}",))
     webview_thread.start()
     
     try:
@@ -0,0 +1,348 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+from datetime import date
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QComboBox
+from PySide6.QtCore import Qt, QPointF, QRectF
+from PySide6.QtGui import QColor, QFont, QPainter, QPen, QPolygonF
+
+from app.components.task_model import CARD_ACCENT_COLORS
+from app.utils.flow_metrics import PERCENTILES, flow_metrics
+from app.utils.style import PRIMARY_COLOR, ACCENT_COLOR
+from app.utils.task_repository import get_repository
+from app.utils.write_queue import get_write_queue
+
+logger = logging.getLogger(__name__)
+
+# Períodos oferecidos, em dias (None para todo o histórico)
+ANALYTICS_PERIODS = (
+    ("Últimos 30 dias", 30),
+    ("Últimos 90 dias", 90),
+    ("Último ano", 365),
+    ("Todo o histórico", None)
+)
+
+# Nomes das colunas nas legendas, de baixo para cima no fluxo cumulativo
+FLOW_BANDS = (
+    ("done", "Concluído"),
+    ("doing", "Em Andamento"),
+    ("to_do", "A Fazer")
+)
+
+# Maior número de dias exibido no histograma de cycle time; as conclusões
+# mais demoradas ficam na última barra
+MAX_HISTOGRAM_DAYS = 60
+
+
+class ChartWidget(QWidget):
+    """Base dos gráficos da aba de análise: título, eixos e área de desenho"""
+
+    MARGINS = (48, 34, 16, 28)  # esquerda, topo, direita, base
+
+    def __init__(self, title, parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.title_font = QFont("Arial", 11, QFont.Weight.Bold)
+        self.label_font = QFont("Arial", 8)
+        self.axis_color = QColor("#9e9e9e")
+        self.grid_color = QColor("#eeeeee")
+        self.text_color = QColor("#404040")
+        self.setMinimumHeight(220)
+
+    def plot_rect(self):
+        left, top, right, bottom = self.MARGINS
+        return QRectF(left, top, max(1, self.width() - left - right), max(1, self.height() - top - bottom))
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.fillRect(self.rect(), QColor("#FFFFFF"))
+
+        painter.setPen(self.text_color)
+        painter.setFont(self.title_font)
+        painter.drawText(QRectF(8, 4, self.width() - 16, 24), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         self.title)
+
+        rect = self.plot_rect()
+        maximum = self.maximum()
+        if maximum is None:
+            painter.setFont(self.label_font)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, "Sem dados no período")
+            painter.end()
+            return
+
+        self.draw_grid(painter, rect, maximum)
+        self.draw_chart(painter, rect, maximum)
+
+        painter.setPen(QPen(self.axis_color, 1))
+        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+        painter.drawLine(rect.bottomLeft(), rect.topLeft())
+        painter.end()
+
+    def draw_grid(self, painter, rect, maximum):
+        """Linhas horizontais e rótulos do eixo vertical"""
+        painter.setFont(self.label_font)
+        steps = 4
+        for step in range(steps + 1):
+            y = rect.bottom() - rect.height() * step / steps
+            if step:
+                painter.setPen(QPen(self.grid_color, 1))
+                painter.drawLine(QPointF(rect.left(), y), QPointF(rect.right(), y))
+            painter.setPen(self.text_color)
+            painter.drawText(QRectF(0, y - 8, rect.left() - 6, 16),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                             f"{maximum * step / steps:.0f}")
+
+    def draw_x_labels(self, painter, rect, labels):
+        """Rótulos do eixo horizontal: ``(fração da largura, texto)``"""
+        painter.setFont(self.label_font)
+        painter.setPen(self.text_color)
+        for fraction, text in labels:
+            # Centralizado no ponto, sem passar das bordas do widget
+            x = rect.left() + rect.width() * fraction
+            left = min(max(x - 40, 0), self.width() - 80)
+            painter.drawText(QRectF(left, rect.bottom() + 4, 80, 16), Qt.AlignmentFlag.AlignCenter, text)
+
+    def maximum(self):
+        """Maior valor do eixo vertical, ou None sem dados"""
+        return None
+
+    def draw_chart(self, painter, rect, maximum):
+        pass
+
+
+class CumulativeFlowChart(ChartWidget):
+    """Diagrama de fluxo cumulativo: tarefas em cada coluna ao fim de cada dia, empilhadas"""
+
+    def __init__(self, parent=None):
+        super().__init__("Fluxo cumulativo", parent)
+        self.days = []
+        self.columns = {}
+        self.setMinimumHeight(260)
+
+    def set_data(self, days, columns):
+        self.days = days
+        self.columns = columns
+        self.update()
+
+    def maximum(self):
+        if not self.days:
+            return None
+        top = max(sum(self.columns[column_id][index] for column_id, _ in FLOW_BANDS)
+                  for index in range(len(self.days)))
+        return max(top, 1)
+
+    def draw_chart(self, painter, rect, maximum):
+        count = len(self.days)
+        # Um ponto por pixel é suficiente: períodos longos são amostrados
+        step = max(1, count // max(1, int(rect.width())))
+        indexes = list(range(0, count, step))
+        if indexes[-1] != count - 1:
+            indexes.append(count - 1)
+
+        def x_of(index):
+            return rect.left() + (rect.width() * index / (count - 1) if count > 1 else rect.width() / 2)
+
+        def y_of(value):
+            return rect.bottom() - rect.height() * value / maximum
+
+        base = [0] * len(indexes)
+        legend_x = rect.right()
+        painter.setFont(self.label_font)
+        for column_id, name in FLOW_BANDS:
+            values = self.columns[column_id]
+            top = [base[i] + values[index] for i, index in enumerate(indexes)]
+            polygon = QPolygonF(
+                [QPointF(x_of(index), y_of(top[i])) for i, index in enumerate(indexes)]
+                + [QPointF(x_of(index), y_of(base[i])) for i, index in reversed(list(enumerate(indexes)))]
+            )
+            color = QColor(CARD_ACCENT_COLORS[column_id])
+            fill = QColor(color)
+            fill.setAlpha(170)
+            painter.setPen(QPen(color, 1))
+            painter.setBrush(fill)
+            painter.drawPolygon(polygon)
+            base = top
+
+            # Legenda, da direita para a esquerda acima do gráfico
+            width = painter.fontMetrics().horizontalAdvance(name) + 18
+            legend_x -= width
+            painter.fillRect(QRectF(legend_x, 12, 10, 10), color)
+            painter.setPen(self.text_color)
+            painter.drawText(QRectF(legend_x + 13, 8, width, 18), Qt.AlignmentFlag.AlignVCenter, name)
+            legend_x -= 8
+
+        labels = [(0.0, self.days[0].strftime("%d/%m/%y"))]
+        if count > 1:
+            labels.append((0.5, self.days[count // 2].strftime("%d/%m/%y")))
+            labels.append((1.0, self.days[-1].strftime("%d/%m/%y")))
+        self.draw_x_labels(painter, rect, labels)
+
+
+class BarChart(ChartWidget):
+    """Gráfico de barras verticais com rótulos no eixo horizontal"""
+
+    def __init__(self, title, parent=None):
+        super().__init__(title, parent)
+        self.values = []
+        self.labels = []
+        self.markers = []
+        self.bar_color = QColor(PRIMARY_COLOR)
+        self.marker_color = QColor(ACCENT_COLOR)
+
+    def set_data(self, values, labels, markers=()):
+        """``labels`` são ``(índice, texto)``; ``markers`` são ``(índice, texto)`` de linhas verticais"""
+        self.values = values
+        self.labels = labels
+        self.markers = list(markers)
+        self.update()
+
+    def maximum(self):
+        if not self.values or not any(self.values):
+            return None
+        return max(self.values)
+
+    def draw_chart(self, painter, rect, maximum):
+        count = len(self.values)
+        slot = rect.width() / count
+        gap = min(4.0, slot * 0.2)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.bar_color)
+        for index, value in enumerate(self.values):
+            if value:
+                height = rect.height() * value / maximum
+                painter.drawRect(QRectF(rect.left() + slot * index + gap / 2, rect.bottom() - height,
+                                        max(1.0, slot - gap), height))
+
+        painter.setFont(self.label_font)
+        for index, text in self.markers:
+            x = rect.left() + slot * (index + 0.5)
+            painter.setPen(QPen(self.marker_color, 1, Qt.PenStyle.DashLine))
+            painter.drawLine(QPointF(x, rect.top()), QPointF(x, rect.bottom()))
+            painter.setPen(self.marker_color)
+            painter.drawText(QRectF(x + 3, rect.top(), 60, 14), Qt.AlignmentFlag.AlignLeft, text)
+
+        self.draw_x_labels(painter, rect, [((index + 0.5) / count, text) for index, text in self.labels])
+
+
+class AnalyticsView(QWidget):
+    """Aba de análise do fluxo: fluxo cumulativo, vazão semanal e cycle time.
+
+    Os dados são lidos dos agregados diários do banco quando a aba é exibida
+    e apenas se o quadro ou o período mudaram desde a última leitura.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._loaded_key = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(15, 15, 15, 15)
+        layout.setSpacing(12)
+
+        # Cabeçalho com o período
+        header_layout = QHBoxLayout()
+        title = QLabel("Análise do fluxo")
+        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        header_layout.addWidget(title)
+        header_layout.addStretch()
+
+        self.period_combo = QComboBox()
+        for name, days in ANALYTICS_PERIODS:
+            self.period_combo.addItem(name, days)
+        self.period_combo.setCurrentIndex(1)
+        self.period_combo.currentIndexChanged.connect(lambda index: self.refresh())
+        header_layout.addWidget(self.period_combo)
+
+        refresh_button = QPushButton("Atualizar")
+        refresh_button.clicked.connect(lambda: self.refresh(force=True))
+        header_layout.addWidget(refresh_button)
+        layout.addLayout(header_layout)
+
+        # Resumo em texto
+        summary_layout = QHBoxLayout()
+        self.cycle_label = QLabel()
+        self.lead_label = QLabel()
+        self.throughput_label = QLabel()
+        for label in (self.cycle_label, self.lead_label, self.throughput_label):
+            label.setFont(QFont("Arial", 10))
+            label.setTextFormat(Qt.TextFormat.RichText)
+            summary_layout.addWidget(label, 1)
+        layout.addLayout(summary_layout)
+
+        # Gráficos
+        self.flow_chart = CumulativeFlowChart()
+        layout.addWidget(self.flow_chart, 3)
+
+        bottom_layout = QHBoxLayout()
+        bottom_layout.setSpacing(12)
+        self.throughput_chart = BarChart("Vazão por semana")
+        self.cycle_chart = BarChart("Cycle time (dias)")
+        bottom_layout.addWidget(self.throughput_chart, 1)
+        bottom_layout.addWidget(self.cycle_chart, 1)
+        layout.addLayout(bottom_layout, 2)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+
+    def refresh(self, force=False):
+        """Relê as métricas do período, se o quadro mudou desde a última leitura"""
+        try:
+            if force:
+                # Incluir as alterações que ainda estão na fila de gravação
+                get_write_queue().flush()
+            repository = get_repository()
+            days = self.period_combo.currentData()
+            key = (repository.board_version(), days, date.today())
+            if not force and key == self._loaded_key:
+                return
+            self.show_metrics(flow_metrics(repository, days))
+            self._loaded_key = key
+        except Exception:
+            logger.exception("Erro ao carregar as métricas de fluxo")
+
+    def show_metrics(self, metrics):
+        """Atualiza o resumo e os gráficos"""
+        self.flow_chart.set_data(metrics["days"], metrics["columns"])
+
+        throughput = metrics["throughput"]
+        labels = []
+        if throughput:
+            labels.append((0, throughput[0][0].strftime("%d/%m")))
+            if len(throughput) > 1:
+                labels.append((len(throughput) - 1, throughput[-1][0].strftime("%d/%m")))
+        self.throughput_chart.set_data([count for _, count in throughput], labels)
+
+        cycle_time = metrics["cycle_time"]
+        histogram = cycle_time["histogram"]
+        values = []
+        if histogram:
+            last = min(max(histogram), MAX_HISTOGRAM_DAYS)
+            values = [0] * last
+            for elapsed, count in histogram.items():
+                values[min(elapsed, last) - 1] += count
+        markers = [
+            (value - 1, f"{percentile}%")
+            for percentile, value in cycle_time["percentiles"].items()
+            if value is not None and value <= len(values)
+        ]
+        labels = [(0, "1")] + ([(len(values) - 1, str(len(values)))] if len(values) > 1 else [])
+        self.cycle_chart.set_data(values, labels, markers)
+
+        self.cycle_label.setText(self.percentiles_text("Cycle time", cycle_time))
+        self.lead_label.setText(self.percentiles_text("Lead time", metrics["lead_time"]))
+        weeks = len(throughput) or 1
+        completed = sum(count for _, count in throughput)
+        self.throughput_label.setText(
+            f"<b>Vazão</b><br>{completed} concluídas, {completed / weeks:.1f} por semana"
+        )
+
+    @staticmethod
+    def percentiles_text(title, metric):
+        if not metric["count"]:
+            return f"<b>{title}</b><br>sem conclusões no período"
+        parts = ", ".join(f"{percentile}% em até {metric['percentiles'][percentile]} d" for percentile in PERCENTILES)
+        return f"<b>{title}</b> ({metric['count']} tarefas)<br>{parts}"
@@ -2,74 +2,177 @@
 # -*- coding: utf-8 -*-
 
 import json
-import os
-import time
+import logging
 import sys
-import sqlite3
+import threading
+import time
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QDialog, QLineEdit,
-    QFormLayout, QTextEdit, QComboBox, QMessageBox, QMenu, QSizePolicy
+    QTableView, QHeaderView, QAbstractItemView, QDialog, QLineEdit,
+    QFormLayout, QTextEdit, QComboBox, QMessageBox, QMenu, QSizePolicy,
+    QFileDialog, QPlainTextEdit
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QDateTime, QSize, QPoint
-from PySide6.QtGui import QColor, QFont, QIcon
+from PySide6.QtCore import Qt, Signal, QDateTime, QPoint, QTimer
+from PySide6.QtGui import QFont, QIcon, QKeySequence, QShortcut
 
 from app.utils.style import (
     KANBAN_STYLE, DIALOG_STYLE, 
     HIGH_PRIORITY_COLOR, MEDIUM_PRIORITY_COLOR, LOW_PRIORITY_COLOR,
     TODO_COLOR, IN_PROGRESS_COLOR, DONE_COLOR,
-    PRIMARY_COLOR
+    PRIMARY_COLOR, COLUMN_LIST_STYLES
 )
+from app.components.task_model import TaskStore, TaskListModel, TaskItemDelegate, CARD_HEIGHT, TASK_FIELDS
+from app.utils.task_repository import COLUMNS, PAGE_SIZE, POSITION_GAP, get_repository
+from app.utils.write_queue import get_write_queue
+from app.utils.startup_profiler import startup_phase
+from app.utils.task_ids import new_task_id, new_task_ids
+from app.utils.task_import import parse_task_lines
+from app.utils.task_export import export_tasks
+from app.utils.task_search import SearchWorker
+from app.utils.forecast import forecast
 
-# Configurações
-DB_FILE = "tasks.db"
+logger = logging.getLogger(__name__)
 
-# Colunas do Kanban
-COLUMNS = {
-    "to_do": {"name": "A Fazer", "color": "#2196f3"},
-    "doing": {"name": "Em Andamento", "color": "#ffc107"},
-    "done": {"name": "Concluído", "color": "#4caf50"}
-}
+class TaskLinesEdit(QPlainTextEdit):
+    """Editor de texto que aceita também arquivos de texto soltos sobre ele"""
+    
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+        else:
+            super().dragEnterEvent(event)
+    
+    def dragMoveEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+        else:
+            super().dragMoveEvent(event)
+    
+    def dropEvent(self, event):
+        """Insere o conteúdo dos arquivos soltos no lugar dos seus caminhos"""
+        paths = [url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()]
+        if not paths:
+            super().dropEvent(event)
+            return
+        for path in paths:
+            try:
+                with open(path, "r", encoding="utf-8-sig", errors="replace") as stream:
+                    text = stream.read()
+            except OSError as e:
+                logger.error("Erro ao ler %s: %s", path, e)
+                continue
+            if self.toPlainText() and not self.toPlainText().endswith("\n"):
+                self.appendPlainText("")
+            self.insertPlainText(text)
+        event.acceptProposedAction()
+
+
+class QuickAddDialog(QDialog):
+    """Diálogo da adição rápida: uma tarefa por linha do texto colado"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Adição rápida")
+        self.setMinimumWidth(550)
+        self.setMinimumHeight(480)
+        self.setStyleSheet(DIALOG_STYLE)
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(12)
+        
+        hint = QLabel(
+            "Cole ou digite uma tarefa por linha, ou solte um arquivo de texto aqui.\n"
+            "Use !alta ou !media na linha para definir a prioridade."
+        )
+        hint.setWordWrap(True)
+        layout.addWidget(hint)
+        
+        self.text_input = TaskLinesEdit()
+        self.text_input.setPlaceholderText("Revisar o contrato !alta\nAtualizar a documentação\nResponder os e-mails !media")
+        self.text_input.setFont(QFont("Arial", 11))
+        self.text_input.textChanged.connect(self.update_count)
+        layout.addWidget(self.text_input, 1)
+        
+        button_layout = QHBoxLayout()
+        self.count_label = QLabel()
+        button_layout.addWidget(self.count_label)
+        button_layout.addStretch()
+        
+        cancel_button = QPushButton("Cancelar")
+        cancel_button.setMinimumHeight(40)
+        cancel_button.setMinimumWidth(120)
+        cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_button)
+        
+        self.add_button = QPushButton("Adicionar")
+        self.add_button.setMinimumHeight(40)
+        self.add_button.setMinimumWidth(120)
+        self.add_button.clicked.connect(self.accept)
+        button_layout.addWidget(self.add_button)
+        
+        layout.addLayout(button_layout)
+        self.update_count()
+    
+    def update_count(self):
+        """Mostra quantas tarefas serão criadas"""
+        count = len(self.get_tasks())
+        self.count_label.setText(f"{count} tarefa(s)")
+        self.add_button.setEnabled(count > 0)
+    
+    def get_tasks(self):
+        """Tarefas do texto, sem id, coluna e posição"""
+        return parse_task_lines(self.text_input.toPlainText())
 
-# Classe personalizada para QListWidget que força atualização visual após drag and drop
-class CustomListWidget(QListWidget):
+
+# Visão das tarefas de uma coluna, exibidas como uma lista de uma única coluna.
+#
+# É uma QTableView com os cabeçalhos ocultos e altura de linha fixa, e não uma
+# QListView, porque a QListView refaz o layout de todas as linhas a cada
+# inserção ou remoção: em uma coluna com milhares de cartões cada drop custava
+# dezenas de milissegundos. Na tabela a altura das linhas fica no cabeçalho
+# vertical e inserir ou remover uma linha não percorre as demais.
+#
+# O drop é tratado pelo modelo: a coluna de origem recebe rowsRemoved e a de
+# destino rowsInserted, então apenas essas linhas e os dois contadores são
+# atualizados, sem percorrer as outras colunas.
+class CustomListView(QTableView):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAcceptDrops(True)
         self.setDragEnabled(True)
-    
-    def dropEvent(self, event):
-        # Executa o comportamento padrão
-        super().dropEvent(event)
-        
-        # Força atualização visual de todos os itens após soltar
-        for i in range(self.count()):
-            item = self.item(i)
-            if item:
-                item.setBackground(QColor("#FFFFFF"))
-        
-        # Notificar outras colunas para atualizar também
-        if self.parent() and hasattr(self.parent(), "parent") and self.parent().parent():
-            board = self.parent().parent()
-            if hasattr(board, "columns"):
-                for column_id, column in board.columns.items():
-                    column.update_all_items_appearance()
+        
+        # Aparência de lista: sem cabeçalhos, grade ou rolagem horizontal
+        self.horizontalHeader().hide()
+        self.horizontalHeader().setStretchLastSection(True)
+        self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(CARD_HEIGHT)
+        self.setShowGrid(False)
+        self.setCornerButtonEnabled(False)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        
+        # Soltar sobre um cartão insere antes dele, em vez de sobrescrevê-lo
+        self.setDragDropOverwriteMode(False)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
     
     def update_all_items(self):
         """Atualiza todos os itens na lista"""
-        for i in range(self.count()):
-            item = self.item(i)
-            if item:
-                if isinstance(item, TaskItem):
-                    item.update_display()
-                # Forçar fundo branco para todos os itens
-                item.setBackground(QColor("#FFFFFF"))
+        self.viewport().update()
     
-    def update(self):
+    def update(self, *args):
         """Sobrescreve o método update para compatibilidade com chamadas sem argumentos"""
-        # Chamar o método repaint para atualizar a renderização
-        self.repaint()
+        if args:
+            super().update(*args)
+        else:
+            self.viewport().update()
+
+# Distância (em pixels) do fim da lista a partir da qual a próxima página é carregada
+LOAD_MORE_THRESHOLD = 200
+
+# Espera (em ms) após a última tecla antes de executar a busca
+SEARCH_DEBOUNCE_MS = 150
 
 # Estilos para itens de tarefa baseados na coluna
 TASK_ITEM_STYLES = {
@@ -78,28 +181,8 @@ TASK_ITEM_STYLES = {
     "done": "background-color: white; border-left: 5px solid #4caf50; border-top: 1px solid #e0e0e0; border-right: 1px solid #e0e0e0; border-bottom: 1px solid #e0e0e0; border-radius: 3px; padding: 8px; min-height: 60px;"
 }
 
-# Função para inicializar o banco de dados
-def init_db():
-    # Criar ou conectar ao banco de dados
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    
-    # Criar tabela de tarefas se não existir
-    cursor.execute('''
-    CREATE TABLE IF NOT EXISTS tasks (
-        id TEXT PRIMARY KEY,
-        title TEXT NOT NULL,
-        description TEXT,
-        priority TEXT,
-        column_id TEXT
-    )
-    ''')
-    
-    conn.commit()
-    conn.close()
-
-# Inicializar banco de dados
-init_db()
+# O banco de dados não é aberto ao importar este módulo: o repositório cria a
+# pasta de dados e aplica as migrações na primeira vez que é usado
 
 
 class TaskDialog(QDialog):
@@ -370,7 +453,7 @@ class TaskDialog(QDialog):
             
             return task_data
         except Exception as e:
-            print(f"Erro ao obter dados da tarefa: {e}")
+            logger.error("Erro ao obter dados da tarefa: %s", e)
             return {"title": "Tarefa sem título", "description": "", "priority": "Baixa"}
         
     # Permitir mover a janela quando clicar e arrastar no cabeçalho
@@ -404,122 +487,28 @@ class TaskDialog(QDialog):
             self.move(x, y)
 
 
-class TaskItem(QListWidgetItem):
-    """Item de tarefa personalizado para o Kanban"""
-    
-    TASK_DATA_ROLE = Qt.ItemDataRole.UserRole + 1
-    
-    def __init__(self, task_data, parent=None):
-        super().__init__(parent)
-        
-        # Criar uma cópia simples do dicionário com apenas os dados essenciais
-        safe_data = {}
-        
-        # Copiar apenas campos conhecidos e valores primitivos
-        for field in ["title", "description", "priority", "column", "id"]:
-            if field in task_data:
-                safe_data[field] = task_data[field]
-        
-        # Garantir que todos os campos obrigatórios existam
-        if "title" not in safe_data:
-            safe_data["title"] = "Tarefa sem título"
-        if "description" not in safe_data:
-            safe_data["description"] = ""
-        if "priority" not in safe_data:
-            safe_data["priority"] = "Baixa"
-            
-        # Armazenar a cópia dos dados
-        self.setData(self.TASK_DATA_ROLE, safe_data)
-        
-        # Definir altura mínima para a tarefa
-        self.setSizeHint(QSize(0, 80))
-        
-        # Atualizar a aparência
-        self._update_display()
-        
-        # Garantir que o item seja sempre visível com fundo branco
-        self.ensure_visible()
-    
-    def ensure_visible(self):
-        """Garante que o item seja sempre visível com fundo branco"""
-        # Aplicar cores explicitamente
-        self.setBackground(QColor("#FFFFFF"))
-        self.setForeground(QColor("#000000"))
-        
-        # Definir tamanho mínimo para garantir altura adequada
-        current_size = self.sizeHint()
-        if current_size.height() < 80:
-            self.setSizeHint(QSize(current_size.width(), 80))
-        
-        # Definir flags específicas para garantir visibilidade
-        self.setFlags(Qt.ItemFlag.ItemIsSelectable | 
-                     Qt.ItemFlag.ItemIsEnabled | 
-                     Qt.ItemFlag.ItemIsDragEnabled | 
-                     Qt.ItemFlag.ItemNeverHasChildren)
-    
-    def _update_display(self):
-        """Atualiza a aparência visual do item"""
-        try:
-            # Obter os dados da tarefa
-            task = self.data(self.TASK_DATA_ROLE)
-            
-            # Verificar se temos dados
-            if not task:
-                return
-            
-            # Extrair informações
-            title = task.get("title", "Tarefa sem título")
-            priority = task.get("priority", "Baixa")
-            
-            # Configurar texto e tooltip
-            priority_indicator = ""
-            tooltip_text = title
-            
-            if priority == "Alta":
-                priority_indicator = " ●"
-                tooltip_text += " - Prioridade Alta"
-            elif priority == "Média":
-                priority_indicator = " ○"
-                tooltip_text += " - Prioridade Média"
-            
-            # Adicionar descrição ao tooltip
-            description = task.get('description', '').strip()
-            if description:
-                tooltip_text += f"\n\n{description}"
-            
-            # Definir texto e aparência
-            self.setText(title + priority_indicator)
-            self.setBackground(QColor("#FFFFFF"))
-            self.setForeground(QColor("#333333"))
-            
-            # Definir fonte em negrito
-            font = self.font()
-            font.setBold(True)
-            self.setFont(font)
-            
-            # Definir tooltip
-            self.setToolTip(tooltip_text)
-        except Exception as e:
-            print(f"Erro ao atualizar exibição: {str(e)}")
-            import traceback
-            traceback.print_exc()
-    
-    def update_display(self):
-        """Método público para atualizar a exibição"""
-        self._update_display()
-        self.ensure_visible()
-
-
 class KanbanColumn(QWidget):
     """Uma coluna do quadro Kanban"""
     
     task_moved = Signal(dict, str)  # tarefa, nova_coluna
     
-    def __init__(self, column_id, title, parent=None):
+    def __init__(self, column_id, title, parent=None, store=None):
         super().__init__(parent)
         self.column_id = column_id
         self.title = title
         
+        # Modelo com os ids das tarefas da coluna; os dados ficam no repositório compartilhado
+        self.model = TaskListModel(column_id, store if store is not None else TaskStore(), self)
+        
+        # Tarefas da coluna que ainda não foram carregadas do banco
+        self.unloaded_count = 0
+        
+        # Resultados da busca: modelo exibido no lugar do da coluna enquanto
+        # há uma busca ativa, e o total encontrado na coluna
+        self.search_model = None
+        self.searching = False
+        self.search_count = 0
+        
         # Aplicar estilo da coluna baseado na cor correspondente
         self.setStyleSheet(f"""
             QWidget {{ 
@@ -540,11 +529,11 @@ class KanbanColumn(QWidget):
         header_layout.setContentsMargins(0, 0, 0, 0)
         
         # Título à esquerda com texto preto simples
-        header_label = QLabel(title)
-        header_label.setProperty("column_header", column_id)
-        header_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        header_label.setStyleSheet("color: black; background-color: transparent; border: none;")
-        header_layout.addWidget(header_label)
+        self.header_label = QLabel(title)
+        self.header_label.setProperty("column_header", column_id)
+        self.header_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        self.header_label.setStyleSheet("color: black; background-color: transparent; border: none;")
+        header_layout.addWidget(self.header_label)
         
         # Espaçador para empurrar o botão para a direita
         header_layout.addStretch()
@@ -571,72 +560,63 @@ class KanbanColumn(QWidget):
                 }}
             """)
             add_button.clicked.connect(self.add_task)
+            
+            # Adição rápida de várias tarefas, uma por linha
+            quick_add_button = QPushButton("Colar lista")
+            quick_add_button.setObjectName("quick_add_button")
+            quick_add_button.setToolTip("Criar uma tarefa para cada linha de um texto colado")
+            quick_add_button.setFixedSize(110, 35)
+            quick_add_button.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+            quick_add_button.setStyleSheet(f"""
+                QPushButton {{
+                    background-color: white;
+                    color: {PRIMARY_COLOR};
+                    border: 1px solid {PRIMARY_COLOR};
+                    border-radius: 4px;
+                    font-weight: bold;
+                    padding: 2px 10px;
+                }}
+                QPushButton:hover {{
+                    background-color: #e3f2fd;
+                }}
+                QPushButton:pressed {{
+                    background-color: #bbdefb;
+                }}
+            """)
+            quick_add_button.clicked.connect(self.quick_add_tasks)
+            header_layout.addWidget(quick_add_button)
             header_layout.addWidget(add_button)
         
         # Adicionar o cabeçalho ao layout principal
         layout.addWidget(header_widget)
         
-        # Lista de tarefas
-        self.task_list = CustomListWidget(self)
+        # Lista de tarefas: os cartões são desenhados pelo delegate, sem um objeto por tarefa
+        self.task_list = CustomListView(self)
+        self.task_list.setModel(self.model)
+        self.task_list.setItemDelegate(TaskItemDelegate(column_id, self.task_list))
+        self.task_list.setMouseTracking(True)
         self.task_list.setProperty("column", column_id)
         self.task_list.setDragEnabled(True)
         self.task_list.setAcceptDrops(True)
         self.task_list.setDropIndicatorShown(True)
-        self.task_list.setDragDropMode(QListWidget.DragDropMode.DragDrop)
+        self.task_list.setDragDropMode(QAbstractItemView.DragDropMode.DragDrop)
         self.task_list.setDefaultDropAction(Qt.DropAction.MoveAction)
-        self.task_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
+        self.task_list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.task_list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
         self.task_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.task_list.customContextMenuRequested.connect(self.show_context_menu)
-        self.task_list.itemDoubleClicked.connect(self.on_item_double_clicked)
-        self.task_list.setSpacing(8)
+        self.task_list.doubleClicked.connect(self.on_item_double_clicked)
         self.task_list.setWordWrap(True)
         
-        # Definir estilo da lista baseado na coluna e evitar cor de seleção feia
-        list_style = f"""
-            QListWidget {{ 
-                background-color: {("#bbdefb" if column_id == "to_do" else "#fff9c4" if column_id == "doing" else "#c8e6c9")};
-                border: 1px solid #e0e0e0;
-                border-radius: 5px;
-            }}
-            
-            QListWidget::item {{
-                background-color: white !important;
-                border: 1px solid #e0e0e0;
-                border-left: 5px solid {("#2196f3" if column_id == "to_do" else "#ffc107" if column_id == "doing" else "#4caf50")};
-                border-radius: 4px;
-                padding: 8px;
-                margin: 5px;
-                min-height: 80px;
-                color: #333333;
-            }}
-            
-            QListWidget::item:selected {{ 
-                background-color: white !important;
-                border: 1px solid #bbbbbb;
-                border-left: 5px solid {("#2196f3" if column_id == "to_do" else "#ffc107" if column_id == "doing" else "#4caf50")};
-                color: #333333;
-            }}
-            
-            QListWidget::item:focus {{ 
-                background-color: white !important;
-                outline: none;
-                border: 1px solid #bbbbbb;
-                border-left: 5px solid {("#2196f3" if column_id == "to_do" else "#ffc107" if column_id == "doing" else "#4caf50")};
-                color: #333333;
-            }}
-            
-            QListWidget::item:hover {{
-                background-color: white !important;
-                border: 1px solid #bbbbbb;
-                border-left: 5px solid {("#2196f3" if column_id == "to_do" else "#ffc107" if column_id == "doing" else "#4caf50")};
-                color: #333333;
-            }}
-        """
-        
-        self.task_list.setStyleSheet(list_style)
+        # Estilo da lista da coluna, aplicado apenas aqui (os cartões são desenhados pelo delegate)
+        self.task_list.setStyleSheet(COLUMN_LIST_STYLES.get(column_id, COLUMN_LIST_STYLES["done"]))
         
         # Conectar eventos
-        self.task_list.model().rowsInserted.connect(self.on_rows_inserted)
+        self.model.rowsInserted.connect(self.on_rows_inserted)
+        self.model.rowsMoved.connect(self.on_rows_moved)
+        self.model.rowsInserted.connect(self.update_header)
+        self.model.rowsRemoved.connect(self.update_header)
+        self.task_list.verticalScrollBar().valueChanged.connect(self.on_scroll)
         
         # Definir largura mínima
         self.setMinimumWidth(300)
@@ -648,68 +628,47 @@ class KanbanColumn(QWidget):
         if self.parent() and hasattr(self.parent(), "add_task"):
             self.parent().add_task()
     
+    def quick_add_tasks(self):
+        # Delegar para o método quick_add_tasks do KanbanBoard
+        if self.parent() and hasattr(self.parent(), "quick_add_tasks"):
+            self.parent().quick_add_tasks()
+    
     def save_task_to_db(self, task_data):
         """Salva uma tarefa no banco de dados"""
         try:
-            # Debug info
-            print(f"Salvando tarefa no banco: id={task_data.get('id')}, coluna={task_data.get('column')}")
+            logger.debug("Salvando tarefa no banco: id=%s, coluna=%s", task_data.get("id"), task_data.get("column"))
             
-            conn = sqlite3.connect(DB_FILE)
-            cursor = conn.cursor()
+            repository = get_repository()
             
-            # Verificar se a tarefa já existe
-            cursor.execute("SELECT id FROM tasks WHERE id = ?", (task_data["id"],))
-            exists = cursor.fetchone() is not None
+            # Fora do modo de verificação, a gravação é feita em segundo plano
+            if not repository.verify:
+                get_write_queue().enqueue_save(task_data)
+                return True
             
-            if exists:
-                # Atualizar tarefa existente
-                cursor.execute(
-                    "UPDATE tasks SET title = ?, description = ?, priority = ?, column_id = ? WHERE id = ?",
-                    (
-                        task_data["title"],
-                        task_data["description"],
-                        task_data["priority"],
-                        task_data["column"],
-                        task_data["id"]
-                    )
-                )
-                print(f"Tarefa atualizada no banco - ID: {task_data['id']}")
+            # Inserir ou atualizar a tarefa
+            if repository.save_task(task_data):
+                logger.debug("Tarefa atualizada no banco - ID: %s", task_data["id"])
             else:
-                # Inserir nova tarefa
-                cursor.execute(
-                    "INSERT INTO tasks (id, title, description, priority, column_id) VALUES (?, ?, ?, ?, ?)",
-                    (
-                        task_data["id"],
-                        task_data["title"],
-                        task_data["description"],
-                        task_data["priority"],
-                        task_data["column"]
-                    )
-                )
-                print(f"Nova tarefa {task_data['id']} criada na coluna {task_data['column']}")
+                logger.debug("Nova tarefa %s criada na coluna %s", task_data["id"], task_data["column"])
             
-            conn.commit()
-            
-            # Verificar se a operação foi bem-sucedida
-            verify_cursor = conn.cursor()
-            verify_cursor.execute("SELECT column_id FROM tasks WHERE id = ?", (task_data["id"],))
-            result = verify_cursor.fetchone()
-            if result:
-                print(f"Verificação: tarefa {task_data['id']} está agora na coluna {result[0]}")
+            # Reler a tarefa para conferência
+            result = repository.get_column(task_data["id"])
+            if result is not None:
+                logger.debug("Verificação: tarefa %s está agora na coluna %s", task_data["id"], result)
             else:
-                print(f"ERRO: Tarefa não encontrada após salvar")
+                logger.error("Tarefa %s não encontrada após salvar", task_data["id"])
             
-            conn.close()
             return True
         except Exception as e:
-            print(f"Erro ao salvar tarefa no banco: {str(e)}")
+            logger.error("Erro ao salvar tarefa no banco: %s", e)
             return False
     
     def show_context_menu(self, position):
         """Exibe o menu de contexto para uma tarefa"""
-        item = self.task_list.itemAt(position)
-        if not item:
+        index = self.task_list.indexAt(position)
+        if not index.isValid():
             return
+        task_id = index.data(TaskListModel.TASK_ID_ROLE)
         
         context_menu = QMenu(self)
         # Aplicar estilo ao menu
@@ -754,23 +713,25 @@ class KanbanColumn(QWidget):
         
         # Processar ação selecionada
         if action == edit_action:
-            self.edit_task(item)
+            self.edit_task(task_id)
         elif action == delete_action:
-            self.delete_task(item)
+            self.delete_task(task_id)
         else:
             # Verificar se é uma ação de movimentação
             for col_id, col_info in COLUMNS.items():
                 if action.text() == col_info["name"]:
-                    self.move_task(item, col_id)
+                    self.move_task(task_id, col_id)
                     break
     
-    def edit_task(self, task_item):
+    def edit_task(self, task_id):
         """Edita uma tarefa existente"""
         # Obter dados atuais
-        current_task = task_item.data(TaskItem.TASK_DATA_ROLE)
+        current_task = self.model.store.get(task_id)
+        if current_task is None:
+            return
         
         # Criar diálogo de edição
-        dialog = TaskDialog(self, current_task)
+        dialog = TaskDialog(self, dict(current_task))
         
         if dialog.exec():
             # Obter novos dados
@@ -780,47 +741,46 @@ class KanbanColumn(QWidget):
             new_data["id"] = current_task.get("id", "")
             new_data["column"] = current_task.get("column", self.column_id)
             
-            # Atualizar o item
-            task_item.setData(TaskItem.TASK_DATA_ROLE, new_data)
-            task_item.update_display()
+            # Atualizar a tarefa e o cartão
+            current_task.update(new_data)
+            self.task_changed(task_id)
             
             # Salvar no banco de dados
-            self.save_task_to_db(new_data)
+            self.save_task_to_db(current_task)
     
-    def delete_task(self, task_item):
+    def delete_task(self, task_id):
         """Exclui uma tarefa"""
+        task_data = self.model.store.get(task_id)
+        if task_data is None:
+            return
+        
         confirm = QMessageBox.question(
             self, "Confirmar exclusão",
-            f"Tem certeza que deseja excluir a tarefa '{task_item.data(TaskItem.TASK_DATA_ROLE)['title']}'?",
+            f"Tem certeza que deseja excluir a tarefa '{task_data['title']}'?",
             QMessageBox.Yes | QMessageBox.No
         )
         
         if confirm == QMessageBox.Yes:
-            task_data = task_item.data(TaskItem.TASK_DATA_ROLE)
-            task_id = task_data.get("id")
-            
             # Remover do banco de dados
             if task_id:
                 try:
-                    conn = sqlite3.connect(DB_FILE)
-                    cursor = conn.cursor()
-                    cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-                    conn.commit()
-                    conn.close()
+                    get_write_queue().enqueue_delete(task_id)
                 except Exception as e:
-                    print(f"Erro ao excluir tarefa do banco: {str(e)}")
-            
-            # Remover da lista
-            row = self.task_list.row(task_item)
-            self.task_list.takeItem(row)
-            
-            # Atualizar a aparência das tarefas restantes
-            self.update_all_items_appearance()
+                    logger.error("Erro ao excluir tarefa do banco: %s", e)
+            
+            # Remover da lista (ou do total, se a tarefa foi encontrada pela
+            # busca sem estar carregada) e dos resultados da busca
+            if not self.model.remove_task(task_id) and self.unloaded_count:
+                self.unloaded_count -= 1
+            self.remove_search_result(task_id)
+            self.model.store.discard(task_id)
     
-    def move_task(self, task_item, new_column):
+    def move_task(self, task_id, new_column):
         """Move uma tarefa para outra coluna"""
         # Obter dados da tarefa
-        task_data = task_item.data(TaskItem.TASK_DATA_ROLE)
+        task_data = self.model.store.get(task_id)
+        if task_data is None:
+            return
         
         # Atualizar coluna
         task_data["column"] = new_column
@@ -828,193 +788,377 @@ class KanbanColumn(QWidget):
         # Salvar no banco de dados
         self.save_task_to_db(task_data)
         
-        # Remover da lista atual
-        row = self.task_list.row(task_item)
-        self.task_list.takeItem(row)
-        
-        # Forçar atualização das tarefas restantes
-        self.update_all_items_appearance()
+        # Remover da lista atual (ou do total, se a tarefa foi encontrada pela
+        # busca sem estar carregada) e dos resultados da busca
+        if not self.model.remove_task(task_id) and self.unloaded_count:
+            self.unloaded_count -= 1
+        self.remove_search_result(task_id)
         
         # Emitir sinal para adicionar na nova coluna
-        self.task_moved.emit(task_data, new_column)
+        self.task_moved.emit(dict(task_data), new_column)
     
-    def update_all_items_appearance(self):
-        """Atualiza a aparência de todos os itens da lista"""
-        # Primeiro aplicar fundo branco a todos os itens
-        for i in range(self.task_list.count()):
-            item = self.task_list.item(i)
-            if item:
-                # Garantir fundo branco
-                item.setBackground(QColor("#FFFFFF"))
-                item.setForeground(QColor("#000000"))
-                
-                # Tentar atualizar usando o método próprio, se disponível
-                if isinstance(item, TaskItem):
-                    item.update_display()
-                    if hasattr(item, 'ensure_visible'):
-                        item.ensure_visible()
-            
-            # Definir altura mínima para todos os itens
-            current_size = item.sizeHint()
-            if current_size.height() < 70:
-                item.setSizeHint(QSize(current_size.width(), 70))
-        
-        # Forçar atualização visual - usando repaint() em vez de update()
-        self.task_list.repaint()
-        
-        # Aplicar estilo novamente
-        # Recriar e replicar o estilo
-        list_style = f"""
-            QListWidget {{ 
-                background-color: {("#bbdefb" if self.column_id == "to_do" else "#fff9c4" if self.column_id == "doing" else "#c8e6c9")};
-                border: 1px solid #e0e0e0;
-                border-radius: 5px;
-            }}
-            
-            QListWidget::item {{
-                background-color: white !important;
-                border: 1px solid #e0e0e0;
-                border-left: 5px solid {("#2196f3" if self.column_id == "to_do" else "#ffc107" if self.column_id == "doing" else "#4caf50")};
-                border-radius: 4px;
-                padding: 8px;
-                margin: 5px;
-                min-height: 80px;
-                color: #333333;
-            }}
-            
-            QListWidget::item:selected {{ 
-                background-color: white !important;
-                border: 1px solid #bbbbbb;
-                border-left: 5px solid {("#2196f3" if self.column_id == "to_do" else "#ffc107" if self.column_id == "doing" else "#4caf50")};
-                color: #333333;
-            }}
-            
-            QListWidget::item:focus {{ 
-                background-color: white !important;
-                outline: none;
-                border: 1px solid #bbbbbb;
-                border-left: 5px solid {("#2196f3" if self.column_id == "to_do" else "#ffc107" if self.column_id == "doing" else "#4caf50")};
-                color: #333333;
-            }}
-            
-            QListWidget::item:hover {{
-                background-color: white !important;
-                border: 1px solid #bbbbbb;
-                border-left: 5px solid {("#2196f3" if self.column_id == "to_do" else "#ffc107" if self.column_id == "doing" else "#4caf50")};
-                color: #333333;
-            }}
+    def update_all_items_appearance(self, task_ids=None):
+        """Redesenha os cartões das tarefas informadas, ou a área visível da lista.
+
+        O estilo da lista é aplicado uma única vez na construção da coluna;
+        aqui apenas os cartões alterados são marcados para redesenho.
         """
-        
-        # Aplicar o estilo novamente
-        self.task_list.setStyleSheet(list_style)
+        if task_ids is None:
+            self.task_list.viewport().update()
+            return
+        for task_id in task_ids:
+            self.task_changed(task_id)
     
     def get_all_tasks(self):
         """Retorna todas as tarefas da coluna"""
         tasks = []
-        for i in range(self.task_list.count()):
-            item = self.task_list.item(i)
-            if item:
-                task_data = item.data(TaskItem.TASK_DATA_ROLE)
-                if task_data:
-                    # Criar cópia dos dados
-                    task_copy = {}
-                    for key, value in task_data.items():
-                        if isinstance(value, (str, int, float, bool)) or value is None:
-                            task_copy[key] = value
-                    tasks.append(task_copy)
+        for row in range(self.model.rowCount()):
+            task_data = self.model.task_at(row)
+            if task_data:
+                # Criar cópia dos dados
+                task_copy = {}
+                for key, value in task_data.items():
+                    if isinstance(value, (str, int, float, bool)) or value is None:
+                        task_copy[key] = value
+                tasks.append(task_copy)
         return tasks
     
-    def on_item_double_clicked(self, item):
+    def on_item_double_clicked(self, index):
         """Manipula o duplo clique em uma tarefa"""
         # Obter dados da tarefa
-        task_data = item.data(TaskItem.TASK_DATA_ROLE)
+        task_id = index.data(TaskListModel.TASK_ID_ROLE)
+        task_data = self.model.store.get(task_id)
+        if task_data is None:
+            return
         
         # Abrir diálogo de visualização
-        dialog = TaskDialog(self, task_data, view_only=True)
+        dialog = TaskDialog(self, dict(task_data), view_only=True)
         
-        # Salvar referência ao item atual
-        self.current_edited_item = item
+        # Salvar referência à tarefa atual
+        self.current_edited_id = task_id
         
         dialog.exec()
     
     def edit_task_result(self, task_data):
         """Manipula o resultado da edição de tarefa após visualização"""
-        if hasattr(self, 'current_edited_item') and self.current_edited_item:
-            # Obter dados atuais
-            current_data = self.current_edited_item.data(TaskItem.TASK_DATA_ROLE)
-            
+        current_data = self.model.store.get(getattr(self, 'current_edited_id', None))
+        if current_data:
             # Preservar dados importantes
             task_data["column"] = current_data.get("column", self.column_id)
             task_data["id"] = current_data.get("id", "")
             
-            # Atualizar o item
-            self.current_edited_item.setData(TaskItem.TASK_DATA_ROLE, task_data)
-            self.current_edited_item.update_display()
+            # Atualizar a tarefa e o cartão
+            current_data.update(task_data)
+            self.task_changed(task_data["id"])
             
             # Salvar no banco de dados
-            self.save_task_to_db(task_data)
+            self.save_task_to_db(current_data)
     
     def on_rows_inserted(self, parent, first, last):
         """Manipula quando novas linhas são inseridas (tarefas arrastadas)"""
         try:
-            # Para debug
-            print(f"Linhas inseridas na coluna '{self.column_id}': de {first} até {last}")
+            # As mensagens por tarefa só são geradas com o nível DEBUG
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("Linhas inseridas na coluna '%s': de %d até %d", self.column_id, first, last)
+            
+            # Posições para as linhas inseridas, calculadas apenas se necessário
+            positions = None
+            
+            # Tarefas cujos dados mudaram e precisam ser redesenhadas
+            changed = []
             
             # Atualizar coluna de todas as tarefas inseridas
             for row in range(first, last + 1):
-                item = self.task_list.item(row)
-                if item:
-                    task_data = item.data(TaskItem.TASK_DATA_ROLE)
-                    if task_data:
-                        old_column = task_data.get("column", "")
+                task_data = self.model.task_at(row)
+                if task_data:
+                    old_column = task_data.get("column", "")
+                    
+                    # Tarefas já posicionadas nesta coluna (carregadas do banco) não mudam
+                    if old_column == self.column_id and task_data.get("position") is not None:
+                        continue
+                    
+                    if positions is None:
+                        positions = self.positions_between(first - 1, last + 1, last - first + 1)
+                        if positions is None:
+                            # Sem espaço entre as vizinhas: renumerar a coluna inteira
+                            self.renumber_positions()
+                            break
+                    
+                    # Atualizar coluna e posição da tarefa
+                    task_data["column"] = self.column_id
+                    task_data["position"] = positions[row - first]
+                    changed.append(task_data["id"])
+                    
+                    # Verificar se a coluna mudou
+                    if old_column != self.column_id:
+                        if debug:
+                            logger.debug("Atualizando coluna da tarefa %s de '%s' para '%s'",
+                                         task_data.get("id"), old_column, self.column_id)
                         
-                        # Verificar se a coluna mudou
-                        if old_column != self.column_id:
-                            print(f"Atualizando coluna da tarefa {task_data.get('id')} de '{old_column}' para '{self.column_id}'")
-                            
-                            # Atualizar a coluna no objeto em memória
-                            task_data["column"] = self.column_id
-                            item.setData(TaskItem.TASK_DATA_ROLE, task_data)
-                            
-                            # Salvar no banco de dados
-                            self.save_task_to_db(task_data)
-                            
-                            # Notificar a coluna de origem para atualizar suas tarefas
-                            if self.parent() and hasattr(self.parent(), 'columns') and old_column in self.parent().columns:
-                                old_column_widget = self.parent().columns[old_column]
-                                old_column_widget.update_all_items_appearance()
-                        else:
-                            print(f"Tarefa {task_data.get('id')} já está na coluna '{self.column_id}', nenhuma atualização necessária")
+                        # Salvar no banco de dados (a coluna de origem já removeu a
+                        # linha e atualizou o contador ao receber rowsRemoved)
+                        self.save_task_to_db(task_data)
             
-            # Garantir que todos os itens nessa coluna estejam corretamente atualizados
-            self.update_all_items_appearance()
+            # Redesenhar apenas as tarefas atualizadas
+            self.update_all_items_appearance(changed)
             
+        except Exception:
+            logger.exception("Erro ao processar linhas inseridas")
+
+    def on_rows_moved(self, parent, start, end, destination, row):
+        """Manipula a reordenação de tarefas dentro da própria coluna"""
+        try:
+            count = end - start + 1
+            first = row - count if row > start else row
+            
+            # Apenas as tarefas movidas recebem uma nova posição entre as vizinhas
+            positions = self.positions_between(first - 1, first + count, count)
+            if positions is None:
+                self.renumber_positions()
+                return
+            
+            for offset, position in enumerate(positions):
+                task_data = self.model.task_at(first + offset)
+                if task_data:
+                    task_data["column"] = self.column_id
+                    task_data["position"] = position
+                    self.save_task_to_db(task_data)
+        except Exception:
+            logger.exception("Erro ao processar reordenação")
+
+    def position_at(self, row):
+        """Retorna a posição gravada na tarefa da linha informada, se houver"""
+        task_data = self.model.task_at(row)
+        return task_data.get("position") if task_data else None
+
+    def key_at(self, row):
+        """Retorna a chave de ordenação (position, id) da tarefa na linha informada"""
+        task_data = self.model.task_at(row)
+        if not task_data or task_data.get("position") is None:
+            return None
+        return (task_data["position"], task_data.get("id", ""))
+
+    def insertion_slot(self):
+        """Linha e posição para uma tarefa nova ou movida para esta coluna.
+
+        Com a coluna toda carregada a tarefa vai para o final; caso contrário,
+        vai para o topo, que está sempre carregado, mantendo a ordem da lista
+        igual à ordem do banco.
+        """
+        row, positions = self.insertion_slots(1)
+        return row, positions[0]
+
+    def insertion_slots(self, count):
+        """Linha e ``count`` posições crescentes para tarefas novas, como em ``insertion_slot``"""
+        if not self.unloaded_count:
+            row = self.model.rowCount()
+            last = self.position_at(row - 1)
+            start = 0.0 if last is None else last
+            return row, [start + POSITION_GAP * (i + 1) for i in range(count)]
+        first = self.position_at(0)
+        end = POSITION_GAP * (count + 1) if first is None else first
+        return 0, [end - POSITION_GAP * (count - i) for i in range(count)]
+
+    def load_more(self, limit=PAGE_SIZE):
+        """Carrega a próxima página de tarefas da coluna a partir do banco"""
+        try:
+            # A página vem do banco: gravar antes as mudanças ainda na fila,
+            # para que tarefas movidas ou excluídas não voltem com o estado antigo
+            get_write_queue().flush()
+            rows = get_repository().fetch_column_page(
+                self.column_id, self.key_at(self.model.rowCount() - 1), limit
+            )
+            # Inserir a página inteira de uma vez no modelo. Tarefas já
+            # carregadas (em qualquer coluna) ficam com os dados do quadro
+            self.model.add_tasks([
+                {
+                    "id": task_id,
+                    "title": title,
+                    "description": description,
+                    "priority": priority,
+                    "column": column_id,
+                    "position": position
+                }
+                for task_id, title, description, priority, column_id, position in rows
+                if self.model.store.get(task_id) is None
+            ])
+            self.unloaded_count = max(0, self.unloaded_count - len(rows))
+            if len(rows) < limit:
+                self.unloaded_count = 0
+            self.update_header()
+            return len(rows)
         except Exception as e:
-            print(f"Erro ao processar linhas inseridas: {str(e)}")
+            logger.error("Erro ao carregar tarefas da coluna '%s': %s", self.column_id, e)
+            return 0
+
+    def load_all(self):
+        """Carrega todas as tarefas restantes da coluna"""
+        while self.unloaded_count and self.load_more():
+            pass
+
+    def on_scroll(self, value):
+        """Carrega mais tarefas quando a rolagem se aproxima do fim da lista"""
+        if self.unloaded_count and value >= self.task_list.verticalScrollBar().maximum() - LOAD_MORE_THRESHOLD:
+            if not self.searching:
+                self.load_more()
+
+    def update_header(self, *args):
+        """Atualiza o total de tarefas exibido no cabeçalho"""
+        total = self.model.rowCount() + self.unloaded_count
+        if self.searching:
+            self.header_label.setText(f"{self.title} ({self.search_count} de {total})")
+        else:
+            self.header_label.setText(f"{self.title} ({total})")
+
+    def set_search_results(self, task_ids, count=0):
+        """Exibe apenas as tarefas encontradas pela busca (``task_ids`` None encerra a busca).
+
+        Os resultados ficam em um modelo próprio, exibido no lugar do modelo
+        da coluna, que continua com as páginas já carregadas; assim a busca
+        não precisa carregar a coluna inteira. Os dados das tarefas devem
+        estar no repositório compartilhado. Durante a busca não é possível
+        arrastar tarefas.
+        """
+        if task_ids is None:
+            if self.search_model is not None:
+                self.search_model.set_task_ids([])
+            self.show_model(self.model)
+        else:
+            if self.search_model is None:
+                self.search_model = TaskListModel(self.column_id, self.model.store, self, register=False)
+            self.search_model.set_task_ids(task_ids)
+            self.show_model(self.search_model)
+        self.search_count = count
+        self.update_header()
 
-    def add_task_item(self, task):
-        """Adiciona um item de tarefa existente à coluna"""
+    def show_model(self, model):
+        """Troca o modelo exibido pela lista"""
+        self.searching = model is not self.model
+        if self.task_list.model() is model:
+            return
+        selection = self.task_list.selectionModel()
+        self.task_list.setModel(model)
+        if selection is not None:
+            selection.deleteLater()
+        self.task_list.setDragEnabled(not self.searching)
+        self.task_list.setAcceptDrops(not self.searching)
+
+    def add_search_result(self, task_id, row=None):
+        """Inclui nos resultados da busca uma tarefa encontrada que mudou para esta coluna"""
+        if self.searching:
+            self.search_model.insert_tasks(self.search_model.rowCount() if row is None else row, [task_id])
+            self.search_count += 1
+            self.update_header()
+
+    def remove_search_result(self, task_id):
+        """Retira a tarefa dos resultados da busca, se estiver neles"""
+        if self.search_model is not None and self.search_model.remove_task(task_id):
+            self.search_count = max(0, self.search_count - 1)
+        self.update_header()
+
+    def task_changed(self, task_id):
+        """Redesenha o cartão da tarefa, na coluna e nos resultados da busca"""
+        self.model.task_changed(task_id)
+        if self.search_model is not None:
+            self.search_model.task_changed(task_id)
+
+    def positions_between(self, before_row, after_row, count):
+        """Calcula ``count`` posições crescentes entre as linhas vizinhas.
+
+        Retorna None quando não há espaço entre as posições das vizinhas.
+        """
+        before = self.position_at(before_row)
+        after = self.position_at(after_row)
+        
+        # Depois da última tarefa carregada, o limite é a primeira tarefa ainda não carregada
+        if after is None and self.unloaded_count and after_row >= self.model.rowCount():
+            key = self.key_at(before_row)
+            if key is not None:
+                after = get_repository().next_position(self.column_id, key)
+        
+        if before is None and after is None:
+            before = 0.0
+            step = POSITION_GAP
+        elif after is None:
+            step = POSITION_GAP
+        elif before is None:
+            step = POSITION_GAP
+            before = after - step * (count + 1)
+        else:
+            step = (after - before) / (count + 1)
+        
+        positions = [before + step * (i + 1) for i in range(count)]
+        if after is not None and not all(before < p < after for p in positions):
+            return None
+        return positions
+
+    def renumber_positions(self):
+        """Renumera todas as tarefas da coluna com o espaçamento padrão"""
+        # A renumeração precisa de todas as tarefas para manter a ordem do banco
+        self.load_all()
+        for row in range(self.model.rowCount()):
+            task_data = self.model.task_at(row)
+            if task_data:
+                task_data["column"] = self.column_id
+                task_data["position"] = POSITION_GAP * (row + 1)
+                self.save_task_to_db(task_data)
+
+    def add_task_items(self, tasks, row=None):
+        """Adiciona várias tarefas à coluna de uma vez, com a lista sem redesenhar"""
         try:
-            # Criar item simples
-            item = TaskItem(task)
+            row = self.model.rowCount() if row is None else row
+            self.task_list.setUpdatesEnabled(False)
+            try:
+                self.model.add_tasks(tasks, row)
+            finally:
+                self.task_list.setUpdatesEnabled(True)
             
-            # Adicionar à lista
-            self.task_list.addItem(item)
+            if not self.searching:
+                self.task_list.scrollTo(self.model.index(row))
+            return True
+        except Exception:
+            logger.exception("Erro ao adicionar itens de tarefa")
+            return False
+
+    def add_task_item(self, task, row=None):
+        """Adiciona um item de tarefa existente à coluna (ao final, se row for None)"""
+        try:
+            # Adicionar ao modelo
+            row = self.model.rowCount() if row is None else row
+            self.model.add_tasks([task], row)
             
             # Garantir que o item fique visível
-            self.task_list.scrollToItem(item)
+            if not self.searching:
+                self.task_list.scrollTo(self.model.index(row))
             
             return True
-        except Exception as e:
-            print(f"ERRO ao adicionar item de tarefa: {str(e)}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Erro ao adicionar item de tarefa")
             return False
 
 
 class KanbanBoard(QWidget):
     """Quadro Kanban completo"""
     
+    # Resultado da exportação (dicionário de export_tasks ou a exceção),
+    # emitido pela thread da exportação
+    export_finished = Signal(object)
+    
+    # Resultado de uma busca (sequência, texto, resultado de search_board ou a
+    # exceção), emitido pela thread da busca
+    search_finished = Signal(int, str, object)
+    
+    # Resultado da previsão de conclusão (dicionário de forecast() ou a
+    # exceção), emitido pela thread da previsão
+    forecast_finished = Signal(object)
+    
+    # Filtros de arquivo do diálogo de exportação
+    EXPORT_FILTERS = (
+        "JSON (*.json);;CSV (*.csv);;NDJSON (*.ndjson);;"
+        "JSON compactado (*.json.gz);;CSV compactado (*.csv.gz);;NDJSON compactado (*.ndjson.gz)"
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         
@@ -1029,16 +1173,16 @@ class KanbanBoard(QWidget):
         self.main_layout.setContentsMargins(10, 10, 10, 10)
         self.main_layout.setSpacing(15)
         
-        # Adicionar botão de salvar no topo
+        # Adicionar botão de salvar e a caixa de busca no topo
         self.add_save_button()
+        self.add_search_box()
         
         # Inicializar colunas e carregar tarefas
-        self.load_columns()
+        with startup_phase("KanbanBoard.load_columns"):
+            self.load_columns()
         
-        # Configurar um temporizador para garantir que todas as tarefas mantenham a aparência correta
-        self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self.refresh_all_tasks)
-        self.refresh_timer.start(2000)  # Atualizar a cada 2 segundos
+        # Não há atualização periódica: cada alteração de tarefa avisa o modelo
+        # (TaskListModel.task_changed) e apenas a linha alterada é redesenhada
         
         # Flag para controlar mudanças não salvas
         self.unsaved_changes = False
@@ -1057,11 +1201,115 @@ class KanbanBoard(QWidget):
         save_button.setObjectName("save_button")  # Definir ID para aplicar estilo CSS
         save_button.clicked.connect(self.save_button_clicked)
         
-        # Adicionar o botão ao layout
+        # Criar o botão de exportar, com um menu para escolher as colunas
+        self.export_button = QPushButton("Exportar")
+        self.export_button.setObjectName("export_button")
+        export_menu = QMenu(self.export_button)
+        export_menu.addAction("Todas as tarefas", lambda: self.export_button_clicked())
+        export_menu.addSeparator()
+        for column_id, column_info in COLUMNS.items():
+            export_menu.addAction(
+                f"Coluna \"{column_info['name']}\"",
+                lambda column_id=column_id: self.export_button_clicked([column_id])
+            )
+        self.export_button.setMenu(export_menu)
+        self.export_finished.connect(self.on_export_finished)
+        
+        # Criar o botão de previsão de conclusão das tarefas de "A Fazer"
+        self.forecast_button = QPushButton("Previsão")
+        self.forecast_button.setObjectName("forecast_button")
+        self.forecast_button.setToolTip("Quando as tarefas de \"A Fazer\" devem estar concluídas, pela vazão recente")
+        self.forecast_button.clicked.connect(self.forecast_button_clicked)
+        self.forecast_finished.connect(self.on_forecast_finished)
+        
+        # Adicionar os botões ao layout
+        button_layout.addWidget(self.forecast_button)
+        button_layout.addWidget(self.export_button)
         button_layout.addWidget(save_button)
         
         # Adicionar o layout ao layout principal
         self.main_layout.addLayout(button_layout)
+        self.toolbar_layout = button_layout
+    
+    def add_search_box(self):
+        """Adiciona a caixa de busca, que filtra as tarefas de todas as colunas"""
+        self.search_box = QLineEdit()
+        self.search_box.setObjectName("search_box")
+        self.search_box.setPlaceholderText("Buscar tarefas...")
+        self.search_box.setClearButtonEnabled(True)
+        self.search_box.setMinimumWidth(300)
+        self.search_box.textChanged.connect(self.on_search_text_changed)
+        self.toolbar_layout.insertWidget(0, self.search_box)
+        QShortcut(QKeySequence(QKeySequence.StandardKey.Find), self, self.search_box.setFocus)
+        
+        # A busca só é executada quando a digitação pausa, em outra thread
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.run_search)
+        self.search_worker = None
+        self.search_sequence = None
+        self.search_finished.connect(self.on_search_finished)
+        
+        # Ids exibidos nos resultados da busca, e os das tarefas que foram lidas
+        # do banco apenas para os resultados (não estão carregadas nas colunas)
+        self.search_ids = set()
+        self.search_only_ids = set()
+    
+    def on_search_text_changed(self, text):
+        """Agenda a busca, ou volta a exibir todas as tarefas se o texto ficou vazio"""
+        if text.strip():
+            self.search_timer.start()
+            return
+        self.search_timer.stop()
+        self.search_sequence = None
+        for column in self.columns.values():
+            column.set_search_results(None)
+        self.search_ids = set()
+        self.release_search_tasks()
+    
+    def run_search(self):
+        """Envia o texto atual para a thread da busca"""
+        if self.search_worker is None:
+            self.search_worker = SearchWorker(self.search_finished.emit)
+        self.search_sequence = self.search_worker.submit(self.search_box.text())
+    
+    def on_search_finished(self, sequence, text, result):
+        """Aplica o resultado da busca às colunas (na thread da interface)"""
+        # Resultados de textos que já foram alterados são descartados
+        if sequence != self.search_sequence:
+            return
+        if isinstance(result, Exception) or result is None:
+            return
+        
+        found = set()
+        for column_id, column in self.columns.items():
+            task_ids = []
+            for row in result["rows"].get(column_id, ()):
+                task_id = row[0]
+                # Tarefas já carregadas mantêm os dados da memória, que podem ter
+                # alterações ainda não gravadas
+                if self.store.get(task_id) is None:
+                    self.store.put(dict(zip(TASK_FIELDS, row)))
+                    self.search_only_ids.add(task_id)
+                task_ids.append(task_id)
+            found.update(task_ids)
+            column.set_search_results(task_ids, result["counts"].get(column_id, 0))
+        self.search_ids = found
+        self.release_search_tasks()
+    
+    def release_search_tasks(self):
+        """Descarta os dados lidos apenas para resultados que não são mais exibidos"""
+        if not self.search_only_ids:
+            return
+        loaded = set()
+        for column in self.columns.values():
+            loaded.update(column.model.task_ids())
+        # Tarefas carregadas nas colunas desde a busca passam a pertencer a elas
+        self.search_only_ids -= loaded
+        for task_id in self.search_only_ids - self.search_ids:
+            self.store.discard(task_id)
+        self.search_only_ids &= self.search_ids
     
     def save_button_clicked(self):
         """Manipula o clique no botão de salvar"""
@@ -1074,15 +1322,128 @@ class KanbanBoard(QWidget):
         else:
             QMessageBox.warning(self, "Erro ao Salvar", "Ocorreu um erro ao salvar as tarefas. Por favor, tente novamente.")
     
+    def export_button_clicked(self, columns=None):
+        """Pergunta o arquivo e exporta as tarefas (das ``columns``, ou todas)"""
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Exportar Tarefas", "tarefas.json", self.EXPORT_FILTERS
+        )
+        if not path:
+            return
+        
+        # Completar a extensão pelo filtro escolhido, se o usuário não a digitou.
+        # A compactação vem do filtro: com um filtro .gz e o nome "tarefas.json"
+        # falta apenas o .gz
+        extension = selected_filter[selected_filter.find("*") + 1:-1]
+        if not path.endswith(extension):
+            base = extension[:-3] if extension.endswith(".gz") else extension
+            path += ".gz" if base != extension and path.endswith(base) else extension
+        
+        # A exportação lê o banco: gravar antes as alterações ainda na fila
+        if not self.flush_pending_writes("Exportar Tarefas", "no arquivo exportado"):
+            return
+        
+        # Exportar em outra thread para não travar a interface em quadros grandes
+        self.export_button.setEnabled(False)
+        threading.Thread(
+            target=self._run_export, args=(path, columns), name="task-export", daemon=True
+        ).start()
+    
+    def _run_export(self, path, columns):
+        """Executa a exportação (na thread da exportação)"""
+        try:
+            result = export_tasks(path, columns=columns)
+            result["path"] = path
+        except Exception as e:
+            logger.exception("Erro ao exportar as tarefas para %s", path)
+            result = e
+        finally:
+            # A conexão desta thread não será mais usada
+            get_repository().close_thread_connection()
+        self.export_finished.emit(result)
+    
+    def on_export_finished(self, result):
+        """Mostra o resultado da exportação (na thread da interface)"""
+        self.export_button.setEnabled(True)
+        if isinstance(result, Exception):
+            QMessageBox.warning(self, "Erro ao Exportar", f"Não foi possível exportar as tarefas:\n{result}")
+        else:
+            QMessageBox.information(
+                self, "Exportação",
+                f"{result['count']} tarefas exportadas para {result['path']}."
+            )
+    
+    def forecast_button_clicked(self):
+        """Calcula em segundo plano quando as tarefas de "A Fazer" devem estar concluídas"""
+        column = self.columns.get("to_do") if hasattr(self, "columns") else None
+        if column is None:
+            return
+        items = column.model.rowCount() + column.unloaded_count
+        
+        # A previsão lê o histórico do banco: gravar antes as alterações ainda na fila
+        if not self.flush_pending_writes("Previsão", "na previsão"):
+            return
+        
+        # Simular em outra thread para não travar a interface
+        self.forecast_button.setEnabled(False)
+        threading.Thread(
+            target=self._run_forecast, args=(items,), name="task-forecast", daemon=True
+        ).start()
+    
+    def _run_forecast(self, items):
+        """Executa a previsão (na thread da previsão)"""
+        try:
+            result = forecast(items)
+        except Exception as e:
+            logger.exception("Erro ao calcular a previsão de %d tarefas", items)
+            result = e
+        finally:
+            # A conexão desta thread não será mais usada
+            get_repository().close_thread_connection()
+        self.forecast_finished.emit(result)
+    
+    def on_forecast_finished(self, result):
+        """Mostra a previsão (na thread da interface)"""
+        self.forecast_button.setEnabled(True)
+        if isinstance(result, Exception):
+            QMessageBox.warning(self, "Previsão", f"Não foi possível calcular a previsão:\n{result}")
+            return
+        
+        if not result["items"]:
+            QMessageBox.information(self, "Previsão", "Não há tarefas em \"A Fazer\".")
+            return
+        
+        trials = f"{result['trials']:,}".replace(",", ".")
+        history_days = (result["history_end"] - result["history_start"]).days + 1
+        lines = [
+            f"{result['items']} tarefas em \"A Fazer\", {trials} simulações com a vazão dos "
+            f"últimos {history_days} dias ({result['throughput_mean']:.1f} conclusões por dia).",
+            ""
+        ]
+        if all(value is None for value in result["dates"].values()):
+            lines.append("Sem previsão: não há conclusões suficientes no histórico recente.")
+        else:
+            for percentile, day in result["dates"].items():
+                if day is None:
+                    lines.append(f"{percentile}% de chance: sem data")
+                else:
+                    lines.append(f"{percentile}% de chance: até {day.strftime('%d/%m/%Y')} "
+                                 f"({result['days'][percentile]} dias)")
+        
+        for title, key in (("Cycle time", "cycle_time"), ("Lead time", "lead_time")):
+            percentiles = result[key]
+            if any(value is not None for value in percentiles.values()):
+                parts = ", ".join(f"{percentile}% em até {value} dias" for percentile, value in percentiles.items())
+                lines.append("")
+                lines.append(f"{title}: {parts}")
+        
+        QMessageBox.information(self, "Previsão", "\n".join(lines))
+    
     def handle_task_moved(self, task, new_column):
         """Manipula o evento de tarefa movida entre colunas"""
         try:
-            # Log para depuração 
-            print(f"Tarefa sendo movida para coluna {new_column}: {task.get('id')}")
-            
             # Verificar se a tarefa é válida
             if not isinstance(task, dict) or "id" not in task:
-                print(f"Erro: Tarefa inválida recebida para movimentação: {type(task)}")
+                logger.error("Tarefa inválida recebida para movimentação: %s", type(task))
                 return
             
             # Criar uma cópia da tarefa para evitar modificações em cascata
@@ -1092,156 +1453,112 @@ class KanbanBoard(QWidget):
             old_column = task_copy.get("column", "")
             task_copy["column"] = new_column
             
-            print(f"Mudança de coluna: Tarefa {task_copy.get('id')} - de '{old_column}' para '{new_column}'")
+            logger.debug("Mudança de coluna: tarefa %s - de '%s' para '%s'", task_copy["id"], old_column, new_column)
             
             # Verificar se a coluna de destino existe
             if new_column not in self.columns:
-                print(f"Erro: Coluna de destino '{new_column}' não existe")
+                logger.error("Coluna de destino '%s' não existe", new_column)
                 return
             
             # Adicionar na nova coluna
-            self.columns[new_column].add_task_item(task_copy)
+            row, task_copy["position"] = self.columns[new_column].insertion_slot()
+            self.columns[new_column].add_task_item(task_copy, row)
+            
+            # Uma tarefa encontrada pela busca continua visível na nova coluna
+            if task_copy["id"] in self.search_ids:
+                self.columns[new_column].add_search_result(task_copy["id"], 0 if row == 0 else None)
             
             # Sincronizar com o banco de dados
             try:
-                conn = sqlite3.connect(DB_FILE)
-                cursor = conn.cursor()
-                
-                # Verificar a coluna atual no banco
-                check_cursor = conn.cursor()
-                check_cursor.execute("SELECT column_id FROM tasks WHERE id = ?", (task_copy["id"],))
-                result = check_cursor.fetchone()
-                if result:
-                    current_column = result[0]
-                    print(f"Coluna atual no banco: {current_column}")
+                repository = get_repository()
                 
-                # Atualizar no banco
-                cursor.execute(
-                    "UPDATE tasks SET column_id = ? WHERE id = ?",
-                    (new_column, task_copy["id"])
-                )
-                
-                conn.commit()
-                
-                # Verificar se a atualização funcionou
-                verify_cursor = conn.cursor()
-                verify_cursor.execute("SELECT column_id FROM tasks WHERE id = ?", (task_copy["id"],))
-                result = verify_cursor.fetchone()
-                if result:
-                    print(f"Verificação de movimento: tarefa {task_copy['id']} está agora na coluna {result[0]}")
+                if not repository.verify:
+                    # Enfileirar a mudança de coluna para gravação em segundo plano
+                    get_write_queue().enqueue_move(task_copy["id"], new_column, task_copy["position"])
                 else:
-                    print(f"ERRO: Tarefa não encontrada após mover")
-                
-                conn.close()
-                
-                # Atualizar a aparência de todas as tarefas em todas as colunas
-                for column_id, column in self.columns.items():
-                    column.update_all_items_appearance()
+                    # Verificar a coluna atual no banco
+                    current_column = repository.get_column(task_copy["id"])
+                    if current_column is not None:
+                        logger.debug("Coluna atual no banco: %s", current_column)
+                    
+                    # Atualizar no banco com um único UPDATE
+                    affected = repository.move_task(task_copy["id"], new_column, task_copy["position"])
+                    if affected != 1:
+                        logger.error("Tarefa %s não encontrada no banco ao mover (%d linhas afetadas)",
+                                     task_copy["id"], affected)
+                    
+                    # Reler a tarefa para conferência
+                    result = repository.get_column(task_copy["id"])
+                    if result is not None:
+                        logger.debug("Verificação de movimento: tarefa %s está agora na coluna %s", task_copy["id"], result)
+                    else:
+                        logger.error("Tarefa %s não encontrada após mover", task_copy["id"])
                 
-            except Exception as e:
-                print(f"Erro ao atualizar coluna após mover: {str(e)}")
-                import traceback
-                traceback.print_exc()
-        except Exception as e:
-            print(f"Erro global ao mover tarefa: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            except Exception:
+                logger.exception("Erro ao atualizar coluna após mover")
+        except Exception:
+            logger.exception("Erro global ao mover tarefa")
     
     def load_tasks(self):
-        """Carrega tarefas do banco de dados"""
+        """Carrega todas as tarefas do banco de dados.
+
+        As colunas do quadro não usam este método: elas carregam as tarefas
+        em páginas, conforme a rolagem (ver ``KanbanColumn.load_more``).
+        """
         try:
-            # Verificar se o banco de dados existe
-            if not os.path.exists(DB_FILE):
-                self.initialize_db()
-                print(f"Banco de dados criado em {DB_FILE}")
-                return []
-            
-            conn = sqlite3.connect(DB_FILE)
-            cursor = conn.cursor()
+            # O repositório cria o banco na primeira conexão, se necessário
+            repository = get_repository()
             
-            # Mostrar estrutura da tabela para debug
-            try:
-                cursor.execute("PRAGMA table_info(tasks)")
-                columns = cursor.fetchall()
-                print("Estrutura da tabela tasks:")
-                for col in columns:
-                    print(f"  {col}")
-            except Exception as e:
-                print(f"Erro ao verificar estrutura da tabela: {str(e)}")
+            # Corrigir tarefas com coluna inválida antes de carregar
+            fixed = repository.fix_invalid_columns(list(COLUMNS), "to_do")
+            if fixed:
+                logger.warning("%d tarefas tinham coluna inválida. Corrigindo para 'to_do'", fixed)
             
-            # Buscar todas as tarefas
-            cursor.execute("SELECT id, title, description, priority, column_id FROM tasks")
+            # Buscar as tarefas de cada coluna, já na ordem gravada
             tasks = []
             
-            # Log para debug - mostrar as tarefas carregadas
-            print("\nTarefas encontradas no banco de dados:")
+            # As mensagens por tarefa só são geradas com o nível DEBUG
+            debug = logger.isEnabledFor(logging.DEBUG)
             
-            for row in cursor.fetchall():
-                task_id, title, description, priority, column_id = row
-                
-                # Verificar se a coluna é válida, caso contrário, corrigir
-                if column_id not in ["to_do", "doing", "done"]:
-                    print(f"ERRO: Tarefa {task_id} tem coluna inválida: '{column_id}'. Corrigindo para 'to_do'")
-                    column_id = "to_do"
+            for column in COLUMNS:
+                for row in repository.fetch_column(column):
+                    task_id, title, description, priority, column_id, position = row
                     
-                    # Atualizar no banco
-                    update_cursor = conn.cursor()
-                    update_cursor.execute(
-                        "UPDATE tasks SET column_id = ? WHERE id = ?",
-                        (column_id, task_id)
-                    )
-                    conn.commit()
-                
-                task = {
-                    "id": task_id,
-                    "title": title,
-                    "description": description,
-                    "priority": priority,
-                    "column": column_id  # Usar o column_id diretamente do banco
-                }
-                
-                print(f"  ID: {task_id}, Título: {title}, Coluna: {column_id}")
-                tasks.append(task)
+                    task = {
+                        "id": task_id,
+                        "title": title,
+                        "description": description,
+                        "priority": priority,
+                        "column": column_id,  # Usar o column_id diretamente do banco
+                        "position": position
+                    }
+                    
+                    if debug:
+                        logger.debug("Tarefa carregada - ID: %s, Título: %s, Coluna: %s", task_id, title, column_id)
+                    tasks.append(task)
             
-            conn.close()
-            print(f"Total de {len(tasks)} tarefas carregadas do banco\n")
+            logger.info("Total de %d tarefas carregadas do banco", len(tasks))
             return tasks
             
         except Exception as e:
-            print(f"Erro ao carregar tarefas: {str(e)}")
+            logger.error("Erro ao carregar tarefas: %s", e)
             # Em caso de erro, inicializar o banco
             self.initialize_db()
             return []
     
     def initialize_db(self):
-        # Criar ou conectar ao banco de dados
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        
         # Criar tabela de tarefas se não existir
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS tasks (
-            id TEXT PRIMARY KEY,
-            title TEXT NOT NULL,
-            description TEXT,
-            priority TEXT,
-            column_id TEXT
-        )
-        ''')
-        
-        conn.commit()
-        conn.close()
+        get_repository().init_schema()
 
     def load_columns(self):
         """Inicializa as colunas e carrega as tarefas para cada uma"""
-        print("\nInicializando colunas do Kanban...")
+        logger.debug("Inicializando colunas do Kanban")
         
         # Dicionário para armazenar as referências das colunas
         self.columns = {}
         
-        # Carregar todas as tarefas do banco de dados primeiro
-        tasks = self.load_tasks()
-        print(f"Carregadas {len(tasks)} tarefas no total.")
+        # Dados das tarefas carregadas, compartilhados pelos modelos das colunas
+        self.store = TaskStore()
         
         # Criar colunas com os respectivos títulos
         column_layout = QHBoxLayout()
@@ -1255,96 +1572,38 @@ class KanbanBoard(QWidget):
             "done": "Concluído"
         }
         
-        # Aplicar estilo do Kanban primeiro
-        self.setStyleSheet(KANBAN_STYLE)
-        
         # Criar cada coluna e adicionar ao layout
         for column_id, title in titles.items():
-            print(f"Criando coluna '{column_id}' ({title})")
-            column = KanbanColumn(column_id, title, self)
+            logger.debug("Criando coluna '%s' (%s)", column_id, title)
+            column = KanbanColumn(column_id, title, self, self.store)
             column.task_moved.connect(self.handle_task_moved)
             column.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
             self.columns[column_id] = column
             column_layout.addWidget(column, 1)
         
-        # Agora distribua as tarefas nas colunas corretas
-        task_count_by_column = {"to_do": 0, "doing": 0, "done": 0}
-        print("\nDistribuindo tarefas para colunas:")
-        
-        for task in tasks:
-            column_id = task.get("column", "to_do")
+        # Carregar apenas a primeira página de cada coluna
+        try:
+            repository = get_repository()
             
-            # Verificar se a coluna existe
-            if column_id not in self.columns:
-                print(f"Aviso: Coluna '{column_id}' não existe. Movendo tarefa {task['id']} para 'to_do'")
-                column_id = "to_do"
-                task["column"] = "to_do"
-                
-                # Atualizar no banco
-                try:
-                    conn = sqlite3.connect(DB_FILE)
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        "UPDATE tasks SET column_id = ? WHERE id = ?",
-                        (column_id, task["id"])
-                    )
-                    conn.commit()
-                    conn.close()
-                    print(f"Banco atualizado: Tarefa {task['id']} movida para coluna 'to_do'")
-                except Exception as e:
-                    print(f"Erro ao atualizar coluna no banco: {str(e)}")
+            # Corrigir tarefas com coluna inválida antes de carregar
+            fixed = repository.fix_invalid_columns(list(self.columns), "to_do")
+            if fixed:
+                logger.warning("%d tarefas tinham coluna inválida e foram movidas para 'to_do'", fixed)
             
-            # Adicionar a tarefa à coluna correta
-            print(f"Adicionando tarefa {task['id']} na coluna '{column_id}'")
-            self.columns[column_id].add_task_item(task)
-            task_count_by_column[column_id] += 1
-        
-        print(f"\nDistribuição final de tarefas:")
-        for col_id, count in task_count_by_column.items():
-            print(f"  {titles[col_id]}: {count} tarefas")
+            for column_id, column in self.columns.items():
+                # O total vem de uma contagem, sem carregar todas as tarefas
+                column.unloaded_count = repository.count_column(column_id)
+                loaded = column.load_more()
+                logger.info("%s: %d de %d tarefas carregadas", titles[column_id], loaded, loaded + column.unloaded_count)
+        except Exception as e:
+            logger.error("Erro ao carregar tarefas: %s", e)
         
         # Adicionar o layout de colunas ao layout principal
         self.main_layout.addLayout(column_layout)
         
-        # Garantir que o estilo seja aplicado a todos os componentes
-        self.refresh_style()
-        
-        # Aplicar fundo branco manualmente a todos os itens de todas as colunas
-        self.apply_white_background_to_all_items()
-        
-        # Código especial para garantir o fundo branco na primeira tarefa da coluna "done" (verde)
-        if "done" in self.columns and self.columns["done"].task_list.count() > 0:
-            # Forçar fundo branco para o primeiro item da coluna "concluído"
-            first_item = self.columns["done"].task_list.item(0)
-            if first_item:
-                first_item.setBackground(QColor("#FFFFFF"))
-                if hasattr(first_item, 'update_display'):
-                    first_item.update_display()
-                    first_item.ensure_visible()
-        
-        # Agendar uma atualização atrasada para garantir que todos os itens tenham fundo branco
-        QTimer.singleShot(200, self.apply_white_background_to_all_items)
-        QTimer.singleShot(500, self.apply_white_background_to_all_items)
-        QTimer.singleShot(1000, self.apply_white_background_to_all_items)
-    
-    def apply_white_background_to_all_items(self):
-        """Aplica fundo branco a todos os itens de todas as colunas"""
-        if not hasattr(self, 'columns'):
-            return
-            
-        for column_id, column in self.columns.items():
-            if hasattr(column, 'task_list') and column.task_list:
-                for i in range(column.task_list.count()):
-                    item = column.task_list.item(i)
-                    if item:
-                        item.setBackground(QColor("#FFFFFF"))
-                        if hasattr(item, 'update_display'):
-                            item.update_display()
-                        if hasattr(item, 'ensure_visible'):
-                            item.ensure_visible()
-                        
-                # Força uma atualização visual
-                column.task_list.repaint()
+        # O estilo do quadro (KANBAN_STYLE) já foi aplicado no construtor e o de
+        # cada lista na criação da coluna; os cartões são desenhados pelo
+        # TaskItemDelegate, então não é preciso reaplicar estilos após a carga
     
     def refresh_style(self):
         """Atualiza o estilo de todas as colunas e tarefas"""
@@ -1354,54 +1613,7 @@ class KanbanBoard(QWidget):
         # Atualizar cada coluna
         for column_id, column in self.columns.items():
             # Força a atualização da aparência de todos os itens
-            for i in range(column.task_list.count()):
-                item = column.task_list.item(i)
-                if item:
-                    item.update_display() 
-    
-    def refresh_all_tasks(self):
-        """Atualiza a aparência de todas as tarefas em todas as colunas"""
-        try:
-            if hasattr(self, 'columns'):
-                for column_id, column in self.columns.items():
-                    if hasattr(column, 'update_all_items_appearance'):
-                        for i in range(column.task_list.count()):
-                            item = column.task_list.item(i)
-                            if item:
-                                # Simplesmente garantir que todos os itens tenham fundo branco
-                                item.setBackground(QColor("#FFFFFF"))
-                                
-                # Especial para a primeira tarefa da coluna 'done'
-                self.fix_done_column_first_item()
-                
-        except Exception as e:
-            # Silenciosamente ignorar erros durante a atualização automática
-            pass
-    
-    def fix_done_column_first_item(self):
-        """Solução específica para o problema da primeira tarefa na coluna 'done'"""
-        try:
-            if hasattr(self, 'columns') and 'done' in self.columns:
-                done_column = self.columns['done']
-                if done_column.task_list.count() > 0:
-                    # Garantir que o primeiro item tenha cor de fundo branca
-                    first_item = done_column.task_list.item(0)
-                    if first_item:
-                        # Aplicar fundo branco e texto preto
-                        first_item.setBackground(QColor("#FFFFFF"))
-                        first_item.setForeground(QColor("#000000"))
-                        
-                        # Se for TaskItem, atualizar a aparência também
-                        if isinstance(first_item, TaskItem):
-                            first_item.update_display()
-                            if hasattr(first_item, 'ensure_visible'):
-                                first_item.ensure_visible()
-                        
-                        # Forçar atualização visual
-                        done_column.task_list.repaint()
-        except Exception:
-            # Ignorar silenciosamente qualquer erro
-            pass
+            column.task_list.viewport().update()
     
     def save_all_tasks_to_db(self):
         """Salva todas as tarefas de todas as colunas no banco de dados"""
@@ -1409,71 +1621,48 @@ class KanbanBoard(QWidget):
             if not hasattr(self, 'columns'):
                 return False
             
-            # Conectar ao banco de dados
-            conn = sqlite3.connect(DB_FILE)
+            # Gravar antes as alterações que ainda estão na fila; se alguma
+            # foi descartada, o salvamento não é informado como bem-sucedido
+            flushed = get_write_queue().flush()
             
-            # Contador de tarefas salvas
-            saved_count = 0
-            
-            # Para cada coluna, salvar suas tarefas
+            # Reunir as tarefas de todas as colunas
+            tasks_to_save = []
             for column_id, column in self.columns.items():
                 if hasattr(column, 'get_all_tasks'):
-                    tasks = column.get_all_tasks()
-                    for task in tasks:
+                    for task in column.get_all_tasks():
                         if 'id' in task:
                             # Garantir que a coluna no task seja a mesma do banco
                             task['column'] = column_id
-                            
-                            # Verificar se a tarefa já existe no banco
-                            cursor = conn.cursor()
-                            cursor.execute("SELECT id FROM tasks WHERE id = ?", (task["id"],))
-                            exists = cursor.fetchone() is not None
-                            
-                            if exists:
-                                # Atualizar tarefa existente
-                                cursor.execute(
-                                    "UPDATE tasks SET title = ?, description = ?, priority = ?, column_id = ? WHERE id = ?",
-                                    (
-                                        task.get("title", ""),
-                                        task.get("description", ""),
-                                        task.get("priority", "Baixa"),
-                                        task.get("column", column_id),
-                                        task["id"]
-                                    )
-                                )
-                            else:
-                                # Inserir nova tarefa
-                                cursor.execute(
-                                    "INSERT INTO tasks (id, title, description, priority, column_id) VALUES (?, ?, ?, ?, ?)",
-                                    (
-                                        task["id"],
-                                        task.get("title", ""),
-                                        task.get("description", ""),
-                                        task.get("priority", "Baixa"),
-                                        task.get("column", column_id)
-                                    )
-                                )
-                            
-                            saved_count += 1
+                            tasks_to_save.append(task)
             
-            # Commit das alterações
-            conn.commit()
-            conn.close()
+            # Salvar em uma única transação apenas o que mudou
+            saved_count = get_repository().save_tasks(tasks_to_save)
             
-            print(f"Total de {saved_count} tarefas salvas no banco de dados.")
-            return True
+            logger.info("Total de %d de %d tarefas salvas no banco de dados", saved_count, len(tasks_to_save))
+            if not flushed:
+                logger.error("Alterações da fila de gravação não puderam ser gravadas no banco")
+            return flushed
             
         except Exception as e:
-            print(f"Erro ao salvar todas as tarefas no banco: {str(e)}")
-            # Tentar reverter a transação se falhar
-            try:
-                if conn:
-                    conn.rollback()
-                    conn.close()
-            except:
-                pass
+            logger.error("Erro ao salvar todas as tarefas no banco: %s", e)
             return False
     
+    def flush_pending_writes(self, title, target):
+        """Grava as alterações ainda na fila antes de ler o banco.
+
+        Se alguma não pôde ser gravada, pergunta se o usuário quer continuar
+        sem ela (``target`` completa a mensagem). Retorna se deve continuar.
+        """
+        if get_write_queue().flush():
+            return True
+        reply = QMessageBox.question(
+            self, title,
+            f"Algumas alterações não puderam ser gravadas no banco e não aparecerão {target}.\n"
+            "Deseja continuar mesmo assim?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        return reply == QMessageBox.Yes
+    
     def save_all_tasks(self):
         """Salva todas as tarefas de todas as colunas"""
         # Chamar o método de salvamento no banco de dados
@@ -1492,21 +1681,60 @@ class KanbanBoard(QWidget):
                 
                 # Adicionar ID único se não existir
                 if "id" not in task_data:
-                    task_data["id"] = f"task_{int(time.time() * 1000)}"
+                    task_data["id"] = new_task_id()
                 
                 # Definir coluna inicial como "to_do"
                 task_data["column"] = "to_do"
                 
                 # Adicionar a tarefa à coluna "to_do"
                 if "to_do" in self.columns:
-                    self.columns["to_do"].add_task_item(task_data)
+                    row, task_data["position"] = self.columns["to_do"].insertion_slot()
+                    self.columns["to_do"].add_task_item(task_data, row)
                     self.unsaved_changes = True
                     return True
                 else:
-                    print("Erro: Coluna 'to_do' não encontrada")
-        except Exception as e:
-            print(f"Erro ao adicionar tarefa: {e}")
-            import traceback
-            traceback.print_exc()
+                    logger.error("Coluna 'to_do' não encontrada")
+        except Exception:
+            logger.exception("Erro ao adicionar tarefa")
         
-        return False 
\ No newline at end of file
+        return False 
+    def quick_add_tasks(self):
+        """Adicionar várias tarefas de uma vez, uma por linha de um texto colado"""
+        try:
+            dialog = QuickAddDialog(self)
+            if dialog.exec_():
+                return self.add_tasks_from_text(dialog.text_input.toPlainText()) > 0
+        except Exception:
+            logger.exception("Erro na adição rápida de tarefas")
+        return False
+    
+    def add_tasks_from_text(self, text):
+        """Cria uma tarefa na coluna "A Fazer" para cada linha do texto.
+
+        As tarefas são gravadas no banco em uma única transação e inseridas na
+        coluna de uma só vez. Retorna o número de tarefas criadas.
+        """
+        column = self.columns.get("to_do") if hasattr(self, "columns") else None
+        if column is None:
+            logger.error("Coluna 'to_do' não encontrada")
+            return 0
+        
+        tasks = parse_task_lines(text)
+        if not tasks:
+            return 0
+        
+        start = time.perf_counter()
+        row, positions = column.insertion_slots(len(tasks))
+        for task, task_id, position in zip(tasks, new_task_ids(len(tasks)), positions):
+            task["id"] = task_id
+            task["column"] = "to_do"
+            task["position"] = position
+        
+        # Uma única transação para todas as tarefas; a fotografia é guardada
+        # para que o próximo "Salvar" não as grave de novo
+        get_repository().insert_tasks(tasks, remember=True)
+        column.add_task_items(tasks, row)
+        
+        logger.info("Adição rápida: %d tarefas criadas em %.1f ms",
+                    len(tasks), (time.perf_counter() - start) * 1000)
+        return len(tasks)
@@ -11,7 +11,10 @@ from PySide6.QtGui import QIcon, QFont, QPixmap
 
 from app.components.kanban_board import KanbanBoard
 from app.components.pomodoro_timer import PomodoroTimer
+from app.components.analytics_view import AnalyticsView
 from app.utils.style import MAIN_STYLE, KANBAN_STYLE, DIALOG_STYLE
+from app.utils.startup_profiler import startup_phase
+from app.utils.write_queue import close_write_queue
 
 
 class MainWindow(QMainWindow):
@@ -26,7 +29,8 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(800, 600)
         
         # Aplicar estilos
-        self.setStyleSheet(MAIN_STYLE)
+        with startup_phase("MainWindow: estilo"):
+            self.setStyleSheet(MAIN_STYLE)
         
         # Criar e definir o widget central
         self.central_widget = QWidget()
@@ -46,10 +50,11 @@ class MainWindow(QMainWindow):
         # Logo (maior)
         logo_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'EsteLogo.png')
         if os.path.exists(logo_path):
-            logo_label = QLabel()
-            pixmap = QPixmap(logo_path)
-            pixmap = pixmap.scaled(120, 120, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-            logo_label.setPixmap(pixmap)
+            with startup_phase("MainWindow: logo"):
+                logo_label = QLabel()
+                pixmap = QPixmap(logo_path)
+                pixmap = pixmap.scaled(120, 120, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                logo_label.setPixmap(pixmap)
             header_layout.addWidget(logo_label)
         
         # Título
@@ -98,13 +103,20 @@ class MainWindow(QMainWindow):
         content_layout.addWidget(self.tabs)
         
         # Aba Kanban
-        self.kanban_board = KanbanBoard(self)
+        with startup_phase("KanbanBoard"):
+            self.kanban_board = KanbanBoard(self)
         self.tabs.addTab(self.kanban_board, "Quadro Kanban")
         
         # Aba Pomodoro
-        self.pomodoro_timer = PomodoroTimer()
+        with startup_phase("PomodoroTimer"):
+            self.pomodoro_timer = PomodoroTimer()
         self.tabs.addTab(self.pomodoro_timer, "Pomodoro")
         
+        # Aba de análise (os dados são lidos apenas quando ela é exibida)
+        with startup_phase("AnalyticsView"):
+            self.analytics_view = AnalyticsView()
+        self.tabs.addTab(self.analytics_view, "Analytics")
+        
         self.layout.addWidget(content_widget)
         
         # Barra de status
@@ -154,4 +166,8 @@ class MainWindow(QMainWindow):
             event.accept()
         else:
             # Cancelar fechamento
-            event.ignore() 
\ No newline at end of file
+            event.ignore()
+        
+        # Gravar as alterações que ainda estão na fila antes de sair
+        if event.isAccepted():
+            close_write_queue()
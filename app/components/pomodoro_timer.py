@@ -12,6 +12,8 @@ from PySide6.QtGui import QFont, QColor, QPalette
 from PySide6.QtMultimedia import QSoundEffect
 from PySide6.QtCore import QUrl
 
+from app.utils.startup_profiler import startup_phase
+
 class CircularProgressBar(QProgressBar):
     """Barra de progresso circular personalizada para o Pomodoro"""
     
@@ -94,11 +96,12 @@ class PomodoroTimer(QWidget):
         self.timer.timeout.connect(self.update_timer)
         
         # Configuração do som de alarme
-        self.alarm_sound = QSoundEffect()
-        alarm_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'alarme.wav')
-        if os.path.exists(alarm_path):
-            self.alarm_sound.setSource(QUrl.fromLocalFile(alarm_path))
-            self.alarm_sound.setVolume(0.8)
+        with startup_phase("PomodoroTimer: som"):
+            self.alarm_sound = QSoundEffect()
+            alarm_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'alarme.wav')
+            if os.path.exists(alarm_path):
+                self.alarm_sound.setSource(QUrl.fromLocalFile(alarm_path))
+                self.alarm_sound.setVolume(0.8)
         
         # Estilo personalizado para o Pomodoro
         self.setStyleSheet(f"""
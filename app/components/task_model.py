@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QMimeData, QSize, QRectF
+from PySide6.QtGui import QColor, QFont, QPen, QTextOption
+
+# Tipo MIME usado para arrastar tarefas entre as colunas: leva apenas os ids
+TASK_MIME_TYPE = "application/x-snapdev-task-ids"
+
+# Campos guardados para cada tarefa
+TASK_FIELDS = ("id", "title", "description", "priority", "column", "position")
+
+# Altura fixa de cada cartão
+CARD_HEIGHT = 80
+
+# Cores da borda esquerda dos cartões de cada coluna
+CARD_ACCENT_COLORS = {
+    "to_do": "#2196f3",
+    "doing": "#ffc107",
+    "done": "#4caf50"
+}
+
+
+class TaskStore:
+    """Armazena os dados de todas as tarefas carregadas no quadro.
+
+    Cada tarefa é guardada uma única vez, indexada pelo id; os modelos das
+    colunas mantêm apenas a lista de ids das suas linhas.
+    """
+
+    def __init__(self):
+        self.tasks = {}
+        self.models = {}
+
+    def put(self, task_data):
+        """Guarda (ou substitui) os dados de uma tarefa e retorna o id"""
+        task = {field: task_data[field] for field in TASK_FIELDS if field in task_data}
+        task.setdefault("title", "Tarefa sem título")
+        task.setdefault("description", "")
+        task.setdefault("priority", "Baixa")
+        self.tasks[task["id"]] = task
+        return task["id"]
+
+    def get(self, task_id):
+        return self.tasks.get(task_id)
+
+    def discard(self, task_id):
+        self.tasks.pop(task_id, None)
+
+    def register(self, model):
+        """Registra o modelo de uma coluna, para que as outras o encontrem ao soltar tarefas"""
+        self.models[model.column_id] = model
+
+
+class TaskListModel(QAbstractListModel):
+    """Modelo com as tarefas de uma coluna do Kanban"""
+
+    TASK_DATA_ROLE = Qt.ItemDataRole.UserRole + 1
+    TASK_ID_ROLE = Qt.ItemDataRole.UserRole + 2
+
+    def __init__(self, column_id, store, parent=None, register=True):
+        super().__init__(parent)
+        self.column_id = column_id
+        self.store = store
+        self._ids = []
+        # Modelos auxiliares (como o dos resultados da busca) não são
+        # registrados, para não substituir o modelo da coluna no repositório
+        if register:
+            store.register(self)
+
+    # Interface de QAbstractListModel
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._ids):
+            return None
+        task = self.store.get(self._ids[index.row()])
+        if task is None:
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return task_display_text(task)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return task_tooltip(task)
+        if role == self.TASK_ID_ROLE:
+            return task["id"]
+        if role == self.TASK_DATA_ROLE:
+            return dict(task)
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        return (Qt.ItemFlag.ItemIsSelectable |
+                Qt.ItemFlag.ItemIsEnabled |
+                Qt.ItemFlag.ItemIsDragEnabled |
+                Qt.ItemFlag.ItemNeverHasChildren)
+
+    def supportedDropActions(self):
+        return Qt.DropAction.MoveAction
+
+    def supportedDragActions(self):
+        return Qt.DropAction.MoveAction
+
+    def mimeTypes(self):
+        return [TASK_MIME_TYPE]
+
+    def mimeData(self, indexes):
+        rows = sorted({index.row() for index in indexes if index.isValid()})
+        mime = QMimeData()
+        payload = {"column": self.column_id, "ids": [self._ids[row] for row in rows]}
+        mime.setData(TASK_MIME_TYPE, json.dumps(payload).encode("utf-8"))
+        return mime
+
+    def canDropMimeData(self, data, action, row, column, parent):
+        return data.hasFormat(TASK_MIME_TYPE)
+
+    def dropMimeData(self, data, action, row, column, parent):
+        """Move as tarefas soltas para esta coluna, sem recriar os dados"""
+        if action == Qt.DropAction.IgnoreAction:
+            return True
+        if not data.hasFormat(TASK_MIME_TYPE):
+            return False
+
+        payload = json.loads(bytes(data.data(TASK_MIME_TYPE)).decode("utf-8"))
+        source = self.store.models.get(payload.get("column"))
+        if source is None:
+            return False
+
+        # Soltar sobre um cartão insere antes dele; fora dos cartões, no final
+        if row < 0:
+            row = parent.row() if parent.isValid() else len(self._ids)
+
+        for task_id in payload.get("ids", []):
+            if source is self:
+                row = self.move_row(task_id, row) + 1
+            elif source.remove_task(task_id):
+                self.insert_tasks(row, [task_id])
+                row += 1
+        return True
+
+    # Operações usadas pela coluna
+
+    def task_id_at(self, row):
+        return self._ids[row] if 0 <= row < len(self._ids) else None
+
+    def task_at(self, row):
+        """Retorna o dicionário da tarefa na linha (o próprio, não uma cópia)"""
+        task_id = self.task_id_at(row)
+        return self.store.get(task_id) if task_id is not None else None
+
+    def row_of(self, task_id):
+        try:
+            return self._ids.index(task_id)
+        except ValueError:
+            return -1
+
+    def task_ids(self):
+        return list(self._ids)
+
+    def insert_tasks(self, row, task_ids):
+        """Insere tarefas já presentes no repositório a partir da linha informada"""
+        if not task_ids:
+            return
+        row = max(0, min(row, len(self._ids)))
+        self.beginInsertRows(QModelIndex(), row, row + len(task_ids) - 1)
+        self._ids[row:row] = task_ids
+        self.endInsertRows()
+
+    def add_tasks(self, tasks, row=None):
+        """Guarda os dados das tarefas no repositório e as insere na coluna"""
+        task_ids = [self.store.put(task) for task in tasks]
+        self.insert_tasks(len(self._ids) if row is None else row, task_ids)
+
+    def set_task_ids(self, task_ids):
+        """Substitui todas as linhas do modelo"""
+        self.beginResetModel()
+        self._ids = list(task_ids)
+        self.endResetModel()
+
+    def remove_task(self, task_id):
+        """Remove a tarefa da coluna (os dados continuam no repositório)"""
+        row = self.row_of(task_id)
+        if row < 0:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._ids[row]
+        self.endRemoveRows()
+        return True
+
+    def move_row(self, task_id, row):
+        """Move a tarefa para antes da linha informada. Retorna a nova linha."""
+        source = self.row_of(task_id)
+        if source < 0:
+            return row - 1
+        if source == row or source + 1 == row:
+            return source
+        self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), row)
+        del self._ids[source]
+        destination = row - 1 if row > source else row
+        self._ids.insert(destination, task_id)
+        self.endMoveRows()
+        return destination
+
+    def task_changed(self, task_id):
+        """Avisa a visão que os dados da tarefa mudaram"""
+        row = self.row_of(task_id)
+        if row >= 0:
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
+
+def task_display_text(task):
+    """Texto exibido no cartão: título e indicador de prioridade"""
+    title = task.get("title", "Tarefa sem título")
+    priority = task.get("priority", "Baixa")
+    if priority == "Alta":
+        return title + " ●"
+    if priority == "Média":
+        return title + " ○"
+    return title
+
+
+def task_tooltip(task):
+    """Tooltip do cartão: título, prioridade e descrição"""
+    tooltip_text = task.get("title", "Tarefa sem título")
+    priority = task.get("priority", "Baixa")
+    if priority == "Alta":
+        tooltip_text += " - Prioridade Alta"
+    elif priority == "Média":
+        tooltip_text += " - Prioridade Média"
+
+    description = (task.get("description") or "").strip()
+    if description:
+        tooltip_text += f"\n\n{description}"
+    return tooltip_text
+
+
+class TaskItemDelegate(QStyledItemDelegate):
+    """Desenha os cartões de tarefa de uma coluna"""
+
+    def __init__(self, column_id, parent=None):
+        super().__init__(parent)
+        self.accent = QColor(CARD_ACCENT_COLORS.get(column_id, "#2196f3"))
+        self.border = QColor("#e0e0e0")
+        self.active_border = QColor("#bbbbbb")
+        self.text_color = QColor("#333333")
+        self.font = QFont("Arial", 10)
+        self.font.setBold(True)
+        self.text_option = QTextOption()
+        self.text_option.setWrapMode(QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere)
+        self.text_option.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), CARD_HEIGHT)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+
+        rect = QRectF(option.rect).adjusted(5, 5, -5, -5)
+        active = option.state & (QStyle.StateFlag.State_Selected | QStyle.StateFlag.State_MouseOver)
+
+        # Cartão branco com borda
+        painter.setPen(QPen(self.active_border if active else self.border, 1))
+        painter.setBrush(QColor("#FFFFFF"))
+        painter.drawRoundedRect(rect, 4, 4)
+
+        # Borda esquerda com a cor da coluna
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.accent)
+        painter.drawRoundedRect(QRectF(rect.left(), rect.top(), 5, rect.height()), 2, 2)
+
+        # Texto
+        painter.setPen(self.text_color)
+        painter.setFont(self.font)
+        text_rect = rect.adjusted(13, 8, -8, -8)
+        painter.setClipRect(text_rect)
+        painter.drawText(text_rect, index.data(Qt.ItemDataRole.DisplayRole) or "", self.text_option)
+
+        painter.restore()
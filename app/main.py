@@ -1,28 +1,99 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import argparse
 import sys
 import os
-from PySide6.QtWidgets import QApplication
-from PySide6.QtGui import QIcon
-from app.components.main_window import MainWindow
+
+# Este módulo não importa o Qt nem a aplicação ao ser carregado: main() as
+# importa depois de ligar o registro da inicialização (com --profile-startup),
+# para medir também a importação do PySide6
+from app.utils.startup_profiler import profiler, startup_phase
+
+
+def parse_args(argv):
+    """Lê as opções da aplicação; as demais são repassadas ao Qt"""
+    parser = argparse.ArgumentParser(prog="SnapDevTask", description="SnapDev Task")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="mostra o tempo de cada fase da inicialização até o primeiro frame")
+    parser.add_argument("--profile-trace", metavar="ARQUIVO",
+                        help="grava as fases da inicialização em JSON no formato Chrome trace")
+    parser.add_argument("--profile-cprofile", metavar="ARQUIVO",
+                        help="grava o cProfile da inicialização (abrir com pstats ou snakeviz)")
+    parser.add_argument("--profile-quit", action="store_true",
+                        help="encerra a aplicação logo após o primeiro frame")
+    args, qt_args = parser.parse_known_args(argv)
+    if args.profile_trace or args.profile_cprofile or args.profile_quit:
+        args.profile_startup = True
+    return args, qt_args
+
+
+def report_startup(args, app):
+    """Exibe a tabela de fases e grava os arquivos pedidos"""
+    profiler.mark("Primeiro frame")
+    profiler.stop()
+
+    report = profiler.report()
+    if sys.stderr is not None:
+        print("\nInicialização:\n" + report, file=sys.stderr)
+
+    if args.profile_trace:
+        profiler.write_chrome_trace(args.profile_trace)
+    if args.profile_cprofile:
+        profiler.write_cprofile(args.profile_cprofile)
+
+    if args.profile_quit:
+        # exit() em vez de quit(): quit() fecharia as janelas, e o closeEvent
+        # da MainWindow perguntaria se as tarefas devem ser salvas
+        app.exit(0)
 
 
 def main():
     """Função principal da aplicação"""
-    app = QApplication(sys.argv)
-    app.setStyle('Fusion')  # Estilo consistente em todas as plataformas
+    args, qt_args = parse_args(sys.argv[1:])
+    if args.profile_startup:
+        profiler.start(cprofile=bool(args.profile_cprofile))
+    
+    with startup_phase("Importar PySide6"):
+        from PySide6.QtWidgets import QApplication
+        from PySide6.QtGui import QIcon
+    
+    with startup_phase("Importar módulos da aplicação"):
+        from app.components.main_window import MainWindow
+        from app.utils.logging_config import setup_logging
+        from app.utils.task_repository import get_repository
+        from app.utils.write_queue import close_write_queue
+    
+    setup_logging()
+    
+    with startup_phase("QApplication"):
+        app = QApplication(sys.argv[:1] + qt_args)
+        app.setStyle('Fusion')  # Estilo consistente em todas as plataformas
     
     # Configurar ícone da aplicação
     icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'icon.png')
     if os.path.exists(icon_path):
         app.setWindowIcon(QIcon(icon_path))
     
-    window = MainWindow()
-    window.show()
+    with startup_phase("MainWindow"):
+        window = MainWindow()
+    
+    if args.profile_startup:
+        from app.utils.first_frame import FirstFrameWatcher
+        # Guardado na janela enquanto ela existir
+        window.first_frame_watcher = FirstFrameWatcher(window, lambda: report_startup(args, app))
+    
+    with startup_phase("window.show"):
+        window.show()
+    
+    exit_code = app.exec()
+    
+    # Gravar as alterações pendentes e fechar as conexões com o banco de dados
+    close_write_queue()
+    get_repository().close()
     
-    sys.exit(app.exec())
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
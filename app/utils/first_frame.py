@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Aviso do primeiro frame da janela, usado por ``--profile-startup``.
+
+Fica fora de app.main para que o Qt só seja importado depois de o registro
+da inicialização começar (ver ``app.main.main``).
+"""
+
+from PySide6.QtCore import QObject, QEvent, QTimer
+
+
+class FirstFrameWatcher(QObject):
+    """Chama ``callback`` quando a janela recebe o primeiro evento de pintura"""
+
+    def __init__(self, window, callback):
+        super().__init__(window)
+        self.window = window
+        self.callback = callback
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if obj is self.window and event.type() == QEvent.Type.Paint:
+            self.window.removeEventFilter(self)
+            # Depois que a pintura em andamento terminar
+            QTimer.singleShot(0, self.callback)
+        return False
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Métricas de fluxo do quadro: diagrama de fluxo cumulativo, vazão semanal e
+percentis de cycle time e lead time.
+
+Os números vêm dos agregados diários do banco (``flow_daily`` e
+``cycle_time_daily``), atualizados pelos triggers a cada evento das
+tarefas. Montar as métricas de um período lê apenas as linhas dos dias
+pedidos (algumas por dia), sem percorrer o histórico de eventos.
+"""
+
+import logging
+import math
+import time
+from datetime import date, timedelta
+
+from app.utils.task_repository import COLUMNS, get_repository
+
+logger = logging.getLogger(__name__)
+
+# Percentis exibidos para cycle time e lead time
+PERCENTILES = (50, 85, 95)
+
+
+def nearest_rank(percentile, total):
+    """Posição (a partir de 1) do percentil entre ``total`` valores ordenados, pelo posto mais próximo"""
+    return max(1, math.ceil(percentile / 100 * total))
+
+
+def histogram_percentiles(histogram, percentiles=PERCENTILES):
+    """Percentis (pelo posto mais próximo) de um histograma ``{valor: quantidade}``.
+
+    Retorna ``{percentil: valor}``, com None para um histograma vazio.
+    """
+    total = sum(histogram.values())
+    result = dict.fromkeys(percentiles)
+    if not total:
+        return result
+    items = sorted(histogram.items())
+    for percentile in percentiles:
+        rank = nearest_rank(percentile, total)
+        running = 0
+        for value, count in items:
+            running += count
+            if running >= rank:
+                result[percentile] = value
+                break
+    return result
+
+
+def week_start(day):
+    """Segunda-feira da semana do dia"""
+    return day - timedelta(days=day.weekday())
+
+
+def flow_metrics(repository=None, days=90, today=None):
+    """Métricas dos últimos ``days`` dias até ``today`` (None para todo o histórico).
+
+    Retorna um dicionário com:
+
+    - ``days``: os dias do período, em ordem;
+    - ``columns``: o número de tarefas em cada coluna ao fim de cada dia;
+    - ``throughput``: ``(início da semana, conclusões)`` de cada semana;
+    - ``cycle_time`` e ``lead_time``: o histograma ``{dias: conclusões}``,
+      os ``percentiles`` e o total (``count``) das conclusões do período;
+    - ``seconds``: o tempo gasto.
+    """
+    repository = repository or get_repository()
+    today = today or date.today()
+    start_time = time.perf_counter()
+
+    if days is None:
+        first = repository.first_flow_day()
+        start = date.fromisoformat(first) if first else today
+    else:
+        start = today - timedelta(days=days - 1)
+    start = min(start, today)
+    start_text, end_text = start.isoformat(), today.isoformat()
+
+    # Total de cada coluna no início do período e variação de cada dia
+    totals = dict.fromkeys(COLUMNS, 0)
+    for column_id, count in repository.flow_totals_before(start_text).items():
+        if column_id in totals:
+            totals[column_id] = count
+    changes = {}
+    for day, column_id, arrivals, departures in repository.flow_days(start_text, end_text):
+        if column_id in totals:
+            changes.setdefault(day, []).append((column_id, arrivals - departures))
+
+    period = [start + timedelta(days=offset) for offset in range((today - start).days + 1)]
+    columns = {column_id: [] for column_id in COLUMNS}
+    for day in period:
+        for column_id, change in changes.get(day.isoformat(), ()):
+            totals[column_id] += change
+        for column_id in COLUMNS:
+            columns[column_id].append(totals[column_id])
+
+    # Conclusões: vazão por semana e histogramas de cycle time e lead time
+    histograms = {"cycle": {}, "lead": {}}
+    for metric, elapsed, count in repository.completion_histogram(start_text, end_text):
+        if metric in histograms:
+            histograms[metric][elapsed] = count
+    weekly = {}
+    for day, count in repository.completions_per_day(start_text, end_text):
+        week = week_start(date.fromisoformat(day))
+        weekly[week] = weekly.get(week, 0) + count
+
+    throughput = []
+    week = week_start(start)
+    while week <= today:
+        throughput.append((week, weekly.get(week, 0)))
+        week += timedelta(days=7)
+
+    seconds = time.perf_counter() - start_time
+    logger.debug("Métricas de fluxo de %s a %s em %.1f ms", start_text, end_text, seconds * 1000)
+    return {
+        "days": period,
+        "columns": columns,
+        "throughput": throughput,
+        "cycle_time": {
+            "histogram": histograms["cycle"],
+            "percentiles": histogram_percentiles(histograms["cycle"]),
+            "count": sum(histograms["cycle"].values())
+        },
+        "lead_time": {
+            "histogram": histograms["lead"],
+            "percentiles": histogram_percentiles(histograms["lead"]),
+            "count": sum(histograms["lead"].values())
+        },
+        "seconds": seconds
+    }
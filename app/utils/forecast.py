@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Previsão de conclusão das tarefas por simulação de Monte Carlo.
+
+A vazão diária do histórico (quantas tarefas foram concluídas em cada dia,
+incluindo os dias sem conclusões) é lida dos agregados diários do banco para
+um array do NumPy. Cada simulação sorteia, com reposição, a vazão de cada
+dia futuro até somar as tarefas pendentes; todas as simulações avançam
+juntas, em blocos de dias, com operações sobre matrizes. Os percentis do
+número de dias dão as datas com 50%, 85% e 95% de chance de conclusão.
+
+Requer o NumPy (``pip install numpy``).
+"""
+
+import logging
+import math
+import time
+from datetime import date, timedelta
+
+try:
+    import numpy as np
+except ImportError:  # o restante do aplicativo funciona sem o NumPy
+    np = None
+
+from app.utils.flow_metrics import PERCENTILES, histogram_percentiles, nearest_rank
+from app.utils.task_repository import get_repository
+
+logger = logging.getLogger(__name__)
+
+# Número de simulações de cada previsão
+FORECAST_TRIALS = 10000
+
+# Dias do histórico usados por padrão (None para todo o histórico)
+HISTORY_DAYS = 90
+
+# As simulações que não terminam neste número de dias são consideradas sem data
+MAX_FORECAST_DAYS = 3650
+
+# Limite de valores sorteados de uma vez (simulações x dias do bloco), para
+# que a memória usada não cresça com o número de tarefas
+MAX_BLOCK_CELLS = 4_000_000
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("a previsão requer o NumPy (pip install numpy)")
+
+
+def daily_throughput(repository, start, end):
+    """Array com o número de conclusões em cada dia de ``start`` a ``end`` (datas)"""
+    _require_numpy()
+    count = (end - start).days + 1
+    throughput = np.zeros(max(count, 0), dtype=np.int64)
+    rows = repository.completions_per_day(start.isoformat(), end.isoformat())
+    if rows and count > 0:
+        days = np.array([day for day, _ in rows], dtype="datetime64[D]")
+        offsets = (days - np.datetime64(start.isoformat(), "D")).astype(np.int64)
+        throughput[offsets] = [completed for _, completed in rows]
+    return throughput
+
+
+def simulate_days(throughput, items, trials=FORECAST_TRIALS, seed=None, max_days=MAX_FORECAST_DAYS):
+    """Número de dias até concluir ``items`` tarefas em cada uma das ``trials`` simulações.
+
+    A vazão de cada dia é sorteada de ``throughput``. Retorna um array de
+    inteiros, com -1 nas simulações que não terminam em ``max_days`` dias.
+    """
+    _require_numpy()
+    samples = np.asarray(throughput, dtype=np.int64)
+    result = np.full(trials, -1, dtype=np.int64)
+    if items <= 0:
+        result[:] = 0
+        return result
+    if not samples.size or not samples.any():
+        return result
+
+    rng = np.random.default_rng(seed)
+    # Blocos com dias suficientes para a maioria das simulações terminar no
+    # primeiro, dentro do limite de memória
+    block_days = math.ceil(1.5 * items / samples.mean())
+    block_days = int(max(16, min(block_days, max_days, MAX_BLOCK_CELLS // trials)))
+    completed = np.zeros(trials, dtype=np.int64)
+    pending = np.arange(trials)
+    elapsed = 0
+    while pending.size and elapsed < max_days:
+        block = rng.choice(samples, size=(pending.size, block_days))
+        totals = np.cumsum(block, axis=1)
+        totals += completed[pending, None]
+        finished = totals[:, -1] >= items
+        # Primeiro dia do bloco em que o total atinge as tarefas pendentes
+        first_day = np.argmax(totals[finished] >= items, axis=1)
+        result[pending[finished]] = elapsed + first_day + 1
+        completed[pending] = totals[:, -1]
+        pending = pending[~finished]
+        elapsed += block_days
+    result[result > max_days] = -1
+    return result
+
+
+def forecast(items, repository=None, history_days=HISTORY_DAYS, trials=FORECAST_TRIALS, today=None, seed=None):
+    """Previsão de conclusão de ``items`` tarefas a partir de hoje.
+
+    A vazão é a dos ``history_days`` dias anteriores a hoje (None para todo
+    o histórico). Retorna um dicionário com os dias (``days``) e as datas
+    (``dates``) de cada percentil (None se as simulações não terminam), os
+    percentis de cycle time e lead time do mesmo período, a vazão média e
+    o tempo gasto.
+    """
+    _require_numpy()
+    repository = repository or get_repository()
+    today = today or date.today()
+    start_time = time.perf_counter()
+
+    # O dia de hoje ainda está em andamento e não entra no histórico
+    end = today - timedelta(days=1)
+    if history_days is None:
+        first = repository.first_flow_day()
+        start = date.fromisoformat(first) if first else end
+    else:
+        start = today - timedelta(days=history_days)
+    start = min(start, end)
+
+    throughput = daily_throughput(repository, start, end)
+    simulated = simulate_days(throughput, items, trials, seed)
+
+    # Percentis pelo posto mais próximo; as simulações que não terminam ficam
+    # no fim da ordenação e deixam sem data os percentis que as alcançam.
+    # O dia 1 da simulação é hoje.
+    ordered = np.sort(np.where(simulated < 0, MAX_FORECAST_DAYS + 1, simulated))
+    days, dates = {}, {}
+    for percentile in PERCENTILES:
+        value = int(ordered[nearest_rank(percentile, trials) - 1])
+        if value > MAX_FORECAST_DAYS:
+            days[percentile] = dates[percentile] = None
+        else:
+            days[percentile] = value
+            dates[percentile] = today + timedelta(days=max(value - 1, 0))
+
+    histograms = {"cycle": {}, "lead": {}}
+    for metric, elapsed, count in repository.completion_histogram(start.isoformat(), end.isoformat()):
+        if metric in histograms:
+            histograms[metric][elapsed] = count
+
+    seconds = time.perf_counter() - start_time
+    logger.info("Previsão de %d tarefas com %d simulações e %d dias de histórico em %.1f ms",
+                items, trials, throughput.size, seconds * 1000)
+    return {
+        "items": items,
+        "trials": trials,
+        "history_start": start,
+        "history_end": end,
+        "throughput_mean": float(throughput.mean()) if throughput.size else 0.0,
+        "days": days,
+        "dates": dates,
+        "cycle_time": histogram_percentiles(histograms["cycle"]),
+        "lead_time": histogram_percentiles(histograms["lead"]),
+        "seconds": seconds
+    }
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+import logging.handlers
+import os
+import sys
+
+# Logger raiz da aplicação; cada módulo usa logging.getLogger(__name__)
+APP_LOGGER = "app"
+
+# Nível padrão. As mensagens por tarefa são DEBUG e, com o nível padrão, não
+# chegam a ser formatadas. Pode ser alterado com SNAPDEV_LOG_LEVEL=DEBUG.
+DEFAULT_LOG_LEVEL = "INFO"
+
+# Arquivo de log opcional (SNAPDEV_LOG_FILE), com rotação por tamanho
+LOG_FILE_MAX_BYTES = 1024 * 1024  # 1 MB
+LOG_FILE_BACKUPS = 3
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+def setup_logging(level=None, log_file=None):
+    """Configura o logger da aplicação.
+
+    ``level`` e ``log_file`` têm como padrão as variáveis de ambiente
+    SNAPDEV_LOG_LEVEL e SNAPDEV_LOG_FILE. As mensagens vão para o stderr,
+    quando existe (no executável sem console ele é None), e para o arquivo
+    de log, se configurado. Chamar novamente substitui a configuração.
+    """
+    level = level or os.environ.get("SNAPDEV_LOG_LEVEL") or DEFAULT_LOG_LEVEL
+    log_file = log_file or os.environ.get("SNAPDEV_LOG_FILE")
+
+    logger = logging.getLogger(APP_LOGGER)
+    if isinstance(level, str):
+        level = logging.getLevelName(level.upper())
+        if not isinstance(level, int):
+            level = logging.getLevelName(DEFAULT_LOG_LEVEL)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    if sys.stderr is not None:
+        stream_handler = logging.StreamHandler(sys.stderr)
+        stream_handler.setFormatter(formatter)
+        logger.addHandler(stream_handler)
+
+    if log_file:
+        try:
+            directory = os.path.dirname(os.path.abspath(log_file))
+            os.makedirs(directory, exist_ok=True)
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUPS, encoding="utf-8"
+            )
+            file_handler.setFormatter(formatter)
+            logger.addHandler(file_handler)
+        except OSError as e:
+            logger.warning("Não foi possível abrir o arquivo de log %s: %s", log_file, e)
+
+    if not logger.handlers:
+        logger.addHandler(logging.NullHandler())
+
+    return logger
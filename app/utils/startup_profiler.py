@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Registro das fases da inicialização da aplicação.
+
+Este módulo não importa o Qt, para que possa ser carregado antes dele e medir
+também o tempo de importação do PySide6. O registro fica desligado até que
+``profiler.start()`` seja chamado (o que ``app.main.main()`` faz com
+--profile-startup, antes de importar o Qt); com ele desligado,
+``startup_phase()`` não registra nada.
+"""
+
+import cProfile
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """Guarda o início e o fim de cada fase da inicialização"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.active = False
+        self.phases = []  # (nome, início, fim, profundidade)
+        self._depth = 0
+        self._cprofile = None
+        self._thread_id = threading.get_ident()
+
+    def start(self, cprofile=False):
+        """Passa a registrar as fases, opcionalmente com o cProfile ativo"""
+        self.origin = time.perf_counter()
+        self.active = True
+        self.phases = []
+        if cprofile and self._cprofile is None:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stop(self):
+        """Para de registrar fases (as já registradas continuam disponíveis)"""
+        self.active = False
+        if self._cprofile is not None:
+            self._cprofile.disable()
+
+    @contextmanager
+    def phase(self, name):
+        """Registra o tempo do bloco como uma fase da inicialização"""
+        if not self.active or threading.get_ident() != self._thread_id:
+            yield
+            return
+        depth = self._depth
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depth = depth
+            self.phases.append((name, start, time.perf_counter(), depth))
+
+    def mark(self, name):
+        """Registra um instante (fase sem duração), como o primeiro frame"""
+        if self.active:
+            now = time.perf_counter()
+            self.phases.append((name, now, now, self._depth))
+
+    def ordered_phases(self):
+        """Fases na ordem em que começaram"""
+        return sorted(self.phases, key=lambda phase: (phase[1], phase[3]))
+
+    def report(self):
+        """Retorna a tabela com o início e a duração de cada fase, em ms"""
+        rows = [(("  " * depth) + name, (start - self.origin) * 1000, (end - start) * 1000)
+                for name, start, end, depth in self.ordered_phases()]
+        width = max([len("Fase")] + [len(row[0]) for row in rows])
+        lines = [f"{'Fase':<{width}}  {'Início (ms)':>12}  {'Duração (ms)':>12}",
+                 "-" * (width + 28)]
+        for name, start, duration in rows:
+            lines.append(f"{name:<{width}}  {start:>12.1f}  {duration:>12.1f}")
+        if self.phases:
+            total = (max(end for _, _, end, _ in self.phases) - self.origin) * 1000
+            lines.append("-" * (width + 28))
+            lines.append(f"{'Total':<{width}}  {'':>12}  {total:>12.1f}")
+        return "\n".join(lines)
+
+    def write_chrome_trace(self, path):
+        """Grava as fases no formato Trace Event (chrome://tracing, Perfetto)"""
+        pid = os.getpid()
+        events = []
+        for name, start, end, depth in self.ordered_phases():
+            event = {
+                "name": name,
+                "cat": "startup",
+                "ph": "X" if end > start else "i",
+                "ts": round((start - self.origin) * 1e6, 1),
+                "pid": pid,
+                "tid": 1
+            }
+            if end > start:
+                event["dur"] = round((end - start) * 1e6, 1)
+            else:
+                event["s"] = "g"
+            events.append(event)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, indent=1)
+
+    def write_cprofile(self, path):
+        """Grava as estatísticas do cProfile (abrir com pstats ou snakeviz)"""
+        if self._cprofile is None:
+            return False
+        self._cprofile.disable()
+        self._cprofile.dump_stats(path)
+        return True
+
+
+# Instância usada por toda a aplicação
+profiler = StartupProfiler()
+
+
+def startup_phase(name):
+    """Atalho para ``profiler.phase(name)``"""
+    return profiler.phase(name)
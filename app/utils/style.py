@@ -12,6 +12,26 @@ TODO_COLOR = "#bbdefb"  # Azul claro para "A Fazer"
 IN_PROGRESS_COLOR = "#fff9c4"  # Amarelo claro para "Em Progresso"
 DONE_COLOR = "#c8e6c9"  # Verde claro para "Concluído"
 
+# Cor de fundo da lista de tarefas de cada coluna
+COLUMN_BACKGROUND_COLORS = {
+    "to_do": TODO_COLOR,
+    "doing": IN_PROGRESS_COLOR,
+    "done": DONE_COLOR
+}
+
+# Estilo da lista de tarefas de cada coluna, montado uma única vez
+COLUMN_LIST_STYLES = {
+    column_id: f"""
+    QTableView {{
+        background-color: {color};
+        border: 1px solid #e0e0e0;
+        border-radius: 5px;
+        selection-background-color: transparent;
+    }}
+"""
+    for column_id, color in COLUMN_BACKGROUND_COLORS.items()
+}
+
 # Prioridades
 HIGH_PRIORITY_COLOR = "#f44336"  # Vermelho
 MEDIUM_PRIORITY_COLOR = "#ff9800"  # Laranja
@@ -126,50 +146,28 @@ KANBAN_STYLE = f"""
     }}
     
     /* Estilo das listas para as diferentes colunas */
-    QListWidget[column="to_do"] {{
+    QTableView[column="to_do"] {{
         background-color: {TODO_COLOR};
         border: 1px solid #e0e0e0;
         border-radius: 6px;
         padding: 5px;
     }}
     
-    QListWidget[column="doing"] {{
+    QTableView[column="doing"] {{
         background-color: {IN_PROGRESS_COLOR};
         border: 1px solid #e0e0e0;
         border-radius: 6px;
         padding: 5px;
     }}
     
-    QListWidget[column="done"] {{
+    QTableView[column="done"] {{
         background-color: {DONE_COLOR};
         border: 1px solid #e0e0e0;
         border-radius: 6px;
         padding: 5px;
     }}
     
-    /* Estilo dos itens */
-    QListWidget::item {{
-        background-color: white;
-        margin: 5px;
-        padding: 12px;
-        min-height: 80px;
-        border-radius: 5px;
-        border: 1px solid #e0e0e0;
-        color: #333333;
-    }}
-    
-    /* Borda esquerda para os itens em cada coluna */
-    QListWidget[column="to_do"]::item {{
-        border-left: 5px solid #2196f3;
-    }}
-    
-    QListWidget[column="doing"]::item {{
-        border-left: 5px solid #ffc107;
-    }}
-    
-    QListWidget[column="done"]::item {{
-        border-left: 5px solid #4caf50;
-    }}
+    /* Os cartões das tarefas são desenhados pelo TaskItemDelegate */
     
     /* Estilo dos cabeçalhos de coluna - garantindo transparência */
     QLabel[column_header] {{
@@ -201,6 +199,48 @@ KANBAN_STYLE = f"""
         font-size: 11pt;
     }}
     
+    /* Caixa de busca */
+    QLineEdit#search_box {{
+        background-color: white;
+        color: #333333;
+        border: 1px solid #d0d0d0;
+        border-radius: 4px;
+        padding: 8px 10px;
+        font-size: 11pt;
+    }}
+    
+    QLineEdit#search_box:focus {{
+        border: 1px solid {PRIMARY_COLOR};
+    }}
+    
+    /* Estilo para o botão Exportar */
+    QPushButton#export_button {{
+        background-color: {PRIMARY_COLOR};
+        color: white;
+        font-weight: bold;
+        padding: 10px 25px;
+        border-radius: 4px;
+        font-size: 11pt;
+    }}
+    
+    QPushButton#export_button:disabled {{
+        background-color: {SECONDARY_COLOR};
+    }}
+    
+    /* Estilo para o botão Previsão */
+    QPushButton#forecast_button {{
+        background-color: {PRIMARY_COLOR};
+        color: white;
+        font-weight: bold;
+        padding: 10px 25px;
+        border-radius: 4px;
+        font-size: 11pt;
+    }}
+    
+    QPushButton#forecast_button:disabled {{
+        background-color: {SECONDARY_COLOR};
+    }}
+    
     /* Estilo para menus de contexto */
     QMenu {{
         background-color: white;
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Exportação das tarefas para JSON, CSV ou NDJSON.
+
+As linhas são lidas do banco pelo cursor, em blocos, e escritas no arquivo à
+medida que chegam, de modo que a memória usada não depende do tamanho do
+quadro. O arquivo é escrito com outro nome e renomeado ao final, para que
+uma exportação interrompida não deixe um arquivo pela metade. Os arquivos
+gerados podem ser importados novamente com app.utils.task_import.
+
+Uso:
+    python -m app.utils.task_export tarefas.json
+    python -m app.utils.task_export tarefas.csv.gz --column to_do --priority Alta
+    python -m app.utils.task_export - --format ndjson
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import logging
+import os
+import sys
+import time
+
+from app.utils.task_repository import COLUMNS, PRIORITIES, TaskRepository, get_repository
+
+logger = logging.getLogger(__name__)
+
+# Formatos suportados
+EXPORT_FORMATS = ("json", "csv", "ndjson")
+
+# Campos exportados, na ordem das colunas do CSV (os mesmos do tasks.json antigo
+# e a posição da tarefa na coluna)
+EXPORT_FIELDS = ("id", "title", "description", "priority", "column", "position")
+
+
+def detect_format(path):
+    """Formato pela extensão do arquivo (ignorando .gz); JSON por padrão"""
+    name = path[:-3] if path.endswith(".gz") else path
+    extension = os.path.splitext(name)[1].lower().lstrip(".")
+    return extension if extension in EXPORT_FORMATS else "json"
+
+
+def iter_records(repository, columns=None, priorities=None):
+    """Tarefas do banco como dicionários com os campos exportados"""
+    for row in repository.iter_tasks(columns=columns, priorities=priorities):
+        yield dict(zip(EXPORT_FIELDS, row))
+
+
+def write_json(records, stream):
+    """Escreve um array JSON, um objeto por linha"""
+    count = 0
+    stream.write("[")
+    for record in records:
+        stream.write(",\n" if count else "\n")
+        stream.write(json.dumps(record, ensure_ascii=False))
+        count += 1
+    stream.write("\n]\n" if count else "]\n")
+    return count
+
+
+def write_ndjson(records, stream):
+    """Escreve um objeto JSON por linha"""
+    count = 0
+    for record in records:
+        stream.write(json.dumps(record, ensure_ascii=False))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(records, stream):
+    """Escreve um CSV com cabeçalho"""
+    writer = csv.DictWriter(stream, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    count = 0
+    for record in records:
+        writer.writerow(record)
+        count += 1
+    return count
+
+
+WRITERS = {
+    "json": write_json,
+    "csv": write_csv,
+    "ndjson": write_ndjson
+}
+
+
+def _open_output(path, compress):
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def export_tasks(path, repository=None, fmt=None, compress=None, columns=None, priorities=None):
+    """Exporta as tarefas para ``path`` ("-" para a saída padrão).
+
+    ``compress`` tem como padrão a extensão .gz do arquivo. Retorna um
+    dicionário com o número de tarefas, o tempo e as linhas/s.
+    """
+    repository = repository or get_repository()
+    fmt = fmt or detect_format(path)
+    if fmt not in WRITERS:
+        raise ValueError(f"formato desconhecido: {fmt}")
+    if compress is None:
+        compress = path.endswith(".gz")
+
+    start = time.perf_counter()
+    records = iter_records(repository, columns, priorities)
+    if path == "-":
+        if compress:
+            with gzip.open(sys.stdout.buffer, "wt", encoding="utf-8", newline="") as stream:
+                count = WRITERS[fmt](records, stream)
+        else:
+            count = WRITERS[fmt](records, sys.stdout)
+    else:
+        temp_path = f"{path}.tmp{os.getpid()}"
+        try:
+            with _open_output(temp_path, compress) as stream:
+                count = WRITERS[fmt](records, stream)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    seconds = time.perf_counter() - start
+    logger.info("Exportação para %s: %d tarefas em %.2f s", path, count, seconds)
+    return {
+        "count": count,
+        "seconds": seconds,
+        "rows_per_second": count / seconds if seconds > 0 else 0.0
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m app.utils.task_export",
+        description="Exporta as tarefas do banco para JSON, CSV ou NDJSON"
+    )
+    parser.add_argument("path", help="arquivo de saída (.json, .csv, .ndjson, opcionalmente .gz) ou - para a saída padrão")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, help="formato (padrão: pela extensão)")
+    parser.add_argument("--gzip", action="store_true", help="compacta a saída (padrão: se o arquivo terminar em .gz)")
+    parser.add_argument("--column", action="append", choices=list(COLUMNS),
+                        help="exporta apenas esta coluna (pode ser repetido)")
+    parser.add_argument("--priority", action="append", choices=list(PRIORITIES),
+                        help="exporta apenas esta prioridade (pode ser repetido)")
+    parser.add_argument("--db", help="arquivo do banco (padrão: o banco do usuário)")
+    args = parser.parse_args(argv)
+
+    repository = TaskRepository(args.db) if args.db else get_repository()
+    try:
+        result = export_tasks(args.path, repository, fmt=args.format, compress=args.gzip or None,
+                              columns=args.column, priorities=args.priority)
+    except (OSError, ValueError) as e:
+        print(f"Erro ao exportar para {args.path}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        repository.close()
+
+    print(f"{result['count']} tarefas exportadas em {result['seconds']:.2f} s "
+          f"({result['rows_per_second']:,.0f} linhas/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
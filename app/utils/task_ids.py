@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Geração de ids de tarefas únicos e ordenados pelo momento da criação.
+
+Os ids seguem o formato ULID, com o prefixo das tarefas: 48 bits com o
+timestamp em milissegundos seguidos de 80 bits aleatórios, em base32 de
+Crockford (26 caracteres). Dentro do mesmo milissegundo a parte aleatória é
+incrementada em vez de sorteada de novo, então ids gerados em sequência,
+mesmo em massa, são sempre distintos e crescentes. Como a ordem dos ids
+acompanha a criação, as inserções caem no fim do índice da chave primária.
+"""
+
+import base64
+import os
+import threading
+import time
+
+# Prefixo dos ids de tarefa (o mesmo dos ids antigos, "task_<milissegundos>")
+TASK_ID_PREFIX = "task_"
+
+# Alfabeto base32 de Crockford, usado pelo ULID (sem I, L, O e U)
+CROCKFORD_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+# Conversão do base32 da RFC 4648 (usado por base64.b32encode) para o de Crockford
+_RFC4648_TO_CROCKFORD = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ234567", CROCKFORD_ALPHABET)
+
+_RANDOM_BITS = 80
+_RANDOM_MAX = (1 << _RANDOM_BITS) - 1
+
+
+def _encode_timestamp(ms):
+    """Codifica o timestamp de 48 bits nos 10 primeiros caracteres"""
+    chars = []
+    for _ in range(10):
+        chars.append(CROCKFORD_ALPHABET[ms & 31])
+        ms >>= 5
+    return "".join(reversed(chars))
+
+
+def _encode_random(value):
+    """Codifica os 80 bits aleatórios nos 16 últimos caracteres"""
+    return base64.b32encode(value.to_bytes(10, "big")).decode("ascii").translate(_RFC4648_TO_CROCKFORD)
+
+
+class TaskIdGenerator:
+    """Gerador monotônico de ids; seguro para uso entre threads"""
+
+    def __init__(self, prefix=TASK_ID_PREFIX, clock=time.time):
+        self.prefix = prefix
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+        self._timestamp_text = ""
+
+    def _next(self):
+        """Próximo (timestamp, aleatório); deve ser chamado com o lock"""
+        ms = int(self.clock() * 1000)
+        if ms > self._last_ms:
+            self._last_ms = ms
+            self._last_random = int.from_bytes(os.urandom(10), "big")
+            self._timestamp_text = _encode_timestamp(ms)
+        elif self._last_random < _RANDOM_MAX:
+            # Mesmo milissegundo (ou relógio voltando): continuar a sequência
+            self._last_random += 1
+        else:
+            # Parte aleatória esgotada: avançar o timestamp
+            self._last_ms += 1
+            self._last_random = 0
+            self._timestamp_text = _encode_timestamp(self._last_ms)
+        return self._timestamp_text, self._last_random
+
+    def new_id(self):
+        """Retorna um novo id"""
+        with self._lock:
+            timestamp_text, random_part = self._next()
+        return self.prefix + timestamp_text + _encode_random(random_part)
+
+    def new_ids(self, count):
+        """Retorna uma lista com ``count`` ids novos, em ordem crescente"""
+        with self._lock:
+            parts = [self._next() for _ in range(count)]
+        prefix = self.prefix
+        return [prefix + timestamp_text + _encode_random(random_part)
+                for timestamp_text, random_part in parts]
+
+
+def task_id_timestamp(task_id):
+    """Retorna o momento da criação (em segundos) codificado no id.
+
+    Aceita também os ids antigos (``task_<milissegundos>``). Retorna None
+    se o id não tiver um timestamp reconhecível.
+    """
+    if not isinstance(task_id, str) or not task_id.startswith(TASK_ID_PREFIX):
+        return None
+    body = task_id[len(TASK_ID_PREFIX):]
+    if body.isdigit():
+        return int(body) / 1000
+    if len(body) != 26:
+        return None
+    ms = 0
+    for char in body[:10].upper():
+        index = CROCKFORD_ALPHABET.find(char)
+        if index < 0:
+            return None
+        ms = (ms << 5) | index
+    return ms / 1000
+
+
+# Gerador compartilhado pela aplicação
+_generator = TaskIdGenerator()
+
+
+def new_task_id():
+    """Retorna um novo id de tarefa"""
+    return _generator.new_id()
+
+
+def new_task_ids(count):
+    """Retorna ``count`` ids de tarefa novos, para criação em massa"""
+    return _generator.new_ids(count)
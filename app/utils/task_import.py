@@ -0,0 +1,366 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Importação de tarefas a partir de arquivos JSON, NDJSON ou CSV.
+
+Os arquivos são lidos registro a registro, sem carregar o arquivo inteiro
+na memória, e gravados no banco em lotes, cada lote em uma transação. Aceita
+o formato do tasks.json antigo (lista de objetos com ``column``, ``id``,
+``priority``, ``title`` e ``description``) e também arquivos .gz. Textos
+com uma tarefa por linha, colados na adição rápida do quadro, são
+convertidos por ``parse_task_lines()``.
+
+Uso:
+    python -m app.utils.task_import tasks.json
+    python -m app.utils.task_import export.csv --batch-size 10000 --replace
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import logging
+import math
+import os
+import sys
+import time
+
+from app.utils.task_ids import new_task_id
+from app.utils.task_repository import COLUMNS, PRIORITIES, POSITION_GAP, TaskRepository, get_repository
+
+logger = logging.getLogger(__name__)
+
+# Número de tarefas gravadas em cada transação
+IMPORT_BATCH_SIZE = 5000
+
+# Tamanho dos blocos lidos de arquivos JSON
+JSON_CHUNK_SIZE = 64 * 1024
+
+# Tamanho máximo (em caracteres) de um objeto de um arquivo JSON. Acima dele
+# o arquivo é considerado inválido, em vez de continuar lendo blocos à
+# procura do fim do objeto
+MAX_JSON_RECORD_SIZE = 16 * 1024 * 1024
+
+# Quantos registros rejeitados são detalhados no relatório
+MAX_REPORTED_ERRORS = 20
+
+# Nomes alternativos aceitos para colunas e prioridades (por exemplo, os usados
+# pela versão web: "todo", "in-progress", "high")
+COLUMN_ALIASES = {
+    "todo": "to_do",
+    "a fazer": "to_do",
+    "in-progress": "doing",
+    "in_progress": "doing",
+    "em andamento": "doing",
+    "concluído": "done",
+    "concluido": "done"
+}
+PRIORITY_ALIASES = {
+    "baixa": "Baixa",
+    "low": "Baixa",
+    "média": "Média",
+    "media": "Média",
+    "medium": "Média",
+    "alta": "Alta",
+    "high": "Alta"
+}
+
+# Marcadores de lista ignorados no início das linhas de um texto colado
+LINE_BULLETS = ("-", "*", "•")
+
+
+def open_text(path):
+    """Abre o arquivo como texto, descompactando arquivos .gz"""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8-sig", newline="")
+    return open(path, "r", encoding="utf-8-sig", newline="")
+
+
+def detect_format(path):
+    """Formato do arquivo pela extensão (ignorando .gz)"""
+    name = path[:-3] if path.endswith(".gz") else path
+    extension = os.path.splitext(name)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    return "json"
+
+
+def iter_json_records(stream, chunk_size=JSON_CHUNK_SIZE, max_record_size=MAX_JSON_RECORD_SIZE):
+    """Lê os objetos de um array JSON (ou de um arquivo NDJSON) um a um.
+
+    Apenas um bloco do arquivo fica na memória por vez, além do objeto que
+    está sendo lido. No array, cada objeto deve ser seguido de "," ou "]",
+    e depois do "]" só pode haver espaços, como no ``json.load``. Lança
+    ValueError, com a posição no arquivo, para um arquivo inválido ou um
+    objeto maior que ``max_record_size`` caracteres.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = "", 0, False
+    # Posição no arquivo do início do buffer
+    offset = 0
+    # None até o primeiro caractere; True para um array, False para NDJSON
+    array = None
+    # Dentro do array: "first" (após o "["), "value" (após uma vírgula),
+    # "separator" (após um objeto) ou "closed" (após o "]")
+    state = "first"
+
+    def read_more():
+        nonlocal buffer, pos, eof, offset
+        chunk = stream.read(chunk_size)
+        offset += pos
+        buffer, pos = buffer[pos:] + chunk, 0
+        eof = not chunk
+
+    def invalid(message):
+        return ValueError(f"JSON inválido na posição {offset + pos}: {message}")
+
+    while True:
+        # Pular os espaços até o próximo caractere
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buffer) or eof:
+                break
+            read_more()
+        if pos >= len(buffer):
+            if array and state != "closed":
+                raise invalid("fim do arquivo antes do \"]\"")
+            return
+
+        char = buffer[pos]
+        if array is None:
+            array = char == "["
+            if array:
+                pos += 1
+                continue
+        if array:
+            if state == "closed":
+                raise invalid("conteúdo depois do fim do array")
+            if state == "separator":
+                if char not in ",]":
+                    raise invalid("esperado \",\" ou \"]\" depois do objeto")
+                pos += 1
+                state = "value" if char == "," else "closed"
+                continue
+            if char == "]" and state == "first":
+                pos += 1
+                state = "closed"
+                continue
+        if char in ",]":
+            raise invalid(f"{char!r} inesperado")
+
+        try:
+            record, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            if eof:
+                raise ValueError(f"JSON inválido na posição {offset + e.pos}: {e.msg}") from None
+            if len(buffer) - pos > max_record_size:
+                raise invalid(f"objeto com mais de {max_record_size} caracteres ou sem fim") from None
+            # Objeto ainda incompleto no bloco: ler mais e tentar de novo
+            read_more()
+            continue
+
+        yield record
+        pos = end
+        state = "separator"
+        if pos >= chunk_size:
+            offset += pos
+            buffer, pos = buffer[pos:], 0
+
+
+def iter_csv_records(stream):
+    """Lê as linhas de um CSV com cabeçalho como dicionários"""
+    return csv.DictReader(stream)
+
+
+def normalize_task(record, default_column=None):
+    """Valida o registro e retorna a tarefa no formato do repositório.
+
+    Lança ValueError com o motivo quando o registro não pode ser importado.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("registro não é um objeto")
+
+    title = (record.get("title") or "").strip()
+    if not title:
+        raise ValueError("título vazio")
+
+    column = record.get("column") or record.get("column_id") or record.get("status") or ""
+    column = str(column).strip()
+    column = COLUMN_ALIASES.get(column.lower(), column)
+    if column not in COLUMNS:
+        if default_column is None:
+            raise ValueError(f"coluna inválida: {column!r}")
+        column = default_column
+
+    priority = str(record.get("priority") or "Baixa").strip()
+    priority = PRIORITY_ALIASES.get(priority.lower(), priority)
+    if priority not in PRIORITIES:
+        raise ValueError(f"prioridade inválida: {priority!r}")
+
+    task = {
+        "id": str(record.get("id") or "").strip() or new_task_id(),
+        "title": title,
+        "description": record.get("description") or "",
+        "priority": priority,
+        "column": column
+    }
+
+    position = record.get("position")
+    if position not in (None, ""):
+        try:
+            task["position"] = float(position)
+        except (TypeError, ValueError):
+            raise ValueError(f"posição inválida: {position!r}")
+        if not math.isfinite(task["position"]):
+            raise ValueError(f"posição inválida: {position!r}")
+    return task
+
+
+def parse_task_lines(text):
+    """Converte um texto colado em tarefas, uma por linha não vazia.
+
+    Uma palavra ``!alta``, ``!media`` ou ``!baixa`` (ou outro nome aceito
+    em PRIORITY_ALIASES) em qualquer lugar da linha define a prioridade e
+    é retirada do título; marcadores de lista no início ("-", "*", "•",
+    "- [ ]") também são ignorados. Retorna as tarefas sem id, coluna e
+    posição, na ordem do texto.
+    """
+    tasks = []
+    for line in text.splitlines():
+        words = line.split()
+        if words and words[0] in LINE_BULLETS:
+            del words[0]
+            if words[:2] == ["[", "]"]:
+                del words[:2]
+            elif words and words[0] in ("[]", "[x]", "[X]"):
+                del words[0]
+
+        priority = "Baixa"
+        title_words = []
+        for word in words:
+            if word.startswith("!") and word[1:].lower() in PRIORITY_ALIASES:
+                priority = PRIORITY_ALIASES[word[1:].lower()]
+            else:
+                title_words.append(word)
+
+        title = " ".join(title_words)
+        if title:
+            tasks.append({"title": title, "description": "", "priority": priority})
+    return tasks
+
+
+def import_tasks(path, repository=None, fmt=None, batch_size=IMPORT_BATCH_SIZE,
+                 replace=False, default_column=None, progress=None):
+    """Importa as tarefas do arquivo para o banco.
+
+    Tarefas sem posição vão para o fim da coluna, na ordem do arquivo.
+    ``progress``, se informado, é chamado após cada lote com o resultado
+    parcial. Retorna um dicionário com as contagens, o tempo e as linhas/s.
+    """
+    repository = repository or get_repository()
+    fmt = fmt or detect_format(path)
+
+    result = {
+        "read": 0,
+        "written": 0,
+        "skipped": 0,
+        "rejected": 0,
+        "errors": [],
+        "seconds": 0.0,
+        "rows_per_second": 0.0
+    }
+    next_positions = {
+        column: (position or 0.0) + POSITION_GAP
+        for column, position in repository.max_positions().items()
+    }
+    start = time.perf_counter()
+
+    def write(batch):
+        written = repository.insert_tasks(batch, replace=replace)
+        result["written"] += written
+        result["skipped"] += len(batch) - written
+        if progress is not None:
+            result["seconds"] = time.perf_counter() - start
+            progress(result)
+
+    with open_text(path) as stream:
+        records = iter_csv_records(stream) if fmt == "csv" else iter_json_records(stream)
+        batch = []
+        for number, record in enumerate(records, start=1):
+            result["read"] += 1
+            try:
+                task = normalize_task(record, default_column)
+            except ValueError as e:
+                result["rejected"] += 1
+                if len(result["errors"]) < MAX_REPORTED_ERRORS:
+                    result["errors"].append(f"registro {number}: {e}")
+                continue
+
+            if "position" not in task:
+                column = task["column"]
+                task["position"] = next_positions.get(column, POSITION_GAP)
+                next_positions[column] = task["position"] + POSITION_GAP
+
+            batch.append(task)
+            if len(batch) >= batch_size:
+                write(batch)
+                batch = []
+        if batch:
+            write(batch)
+
+    result["seconds"] = time.perf_counter() - start
+    if result["seconds"] > 0:
+        result["rows_per_second"] = result["read"] / result["seconds"]
+    logger.info("Importação de %s: %d lidas, %d gravadas, %d ignoradas, %d rejeitadas em %.2f s",
+                path, result["read"], result["written"], result["skipped"], result["rejected"],
+                result["seconds"])
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m app.utils.task_import",
+        description="Importa tarefas de arquivos JSON, NDJSON ou CSV para o banco de tarefas"
+    )
+    parser.add_argument("path", help="arquivo a importar (.json, .ndjson, .csv, opcionalmente .gz)")
+    parser.add_argument("--format", choices=("json", "csv"), help="formato do arquivo (padrão: pela extensão)")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE,
+                        help=f"tarefas por transação (padrão: {IMPORT_BATCH_SIZE})")
+    parser.add_argument("--replace", action="store_true",
+                        help="sobrescreve tarefas com o mesmo id (padrão: ignorá-las)")
+    parser.add_argument("--default-column", choices=list(COLUMNS),
+                        help="coluna usada para registros com coluna inválida (padrão: rejeitá-los)")
+    parser.add_argument("--db", help="arquivo do banco (padrão: o banco do usuário)")
+    args = parser.parse_args(argv)
+
+    repository = TaskRepository(args.db) if args.db else get_repository()
+
+    def progress(partial):
+        rate = partial["read"] / partial["seconds"] if partial["seconds"] else 0.0
+        print(f"\r{partial['read']} registros lidos ({rate:,.0f} linhas/s)", end="", file=sys.stderr)
+
+    try:
+        result = import_tasks(args.path, repository, fmt=args.format, batch_size=args.batch_size,
+                              replace=args.replace, default_column=args.default_column,
+                              progress=progress)
+    except (OSError, ValueError) as e:
+        print(f"\nErro ao importar {args.path}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        repository.close()
+
+    print(file=sys.stderr)
+    print(f"Registros lidos: {result['read']}")
+    print(f"Tarefas gravadas: {result['written']}")
+    print(f"Já existentes (ignoradas): {result['skipped']}")
+    print(f"Rejeitadas: {result['rejected']}")
+    for error in result["errors"]:
+        print(f"  {error}")
+    print(f"Tempo: {result['seconds']:.2f} s ({result['rows_per_second']:,.0f} linhas/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,977 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+import os
+import sqlite3
+import sys
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Configurações
+APP_NAME = "SnapDevTask"
+
+# Nome do arquivo do banco dentro da pasta de dados do usuário
+DB_FILE_NAME = "tasks.db"
+
+# Banco usado pelas versões anteriores, na pasta do aplicativo (ver
+# ``legacy_db_path``). Se ele existir e o banco na pasta de dados ainda não,
+# as tarefas são copiadas.
+LEGACY_DB_FILE = "tasks.db"
+
+# Modo de verificação: relê cada linha após gravá-la. Desligado por padrão;
+# ative com SNAPDEV_DB_VERIFY=1 para depurar problemas de persistência.
+VERIFY_WRITES = os.environ.get("SNAPDEV_DB_VERIFY", "") == "1"
+
+# Tamanho do cache de statements preparados de cada conexão
+STATEMENT_CACHE_SIZE = 64
+
+# Pragmas aplicados a cada conexão aberta. O WAL permite que leitores (um
+# script de relatório, uma segunda janela) não bloqueiem quem grava, e com
+# WAL o synchronous=NORMAL continua seguro contra corrupção.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -16000",  # 16 MB
+    "PRAGMA mmap_size = 268435456",  # 256 MB
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA busy_timeout = 5000",
+)
+
+# Colunas do Kanban
+COLUMNS = {
+    "to_do": {"name": "A Fazer", "color": "#2196f3"},
+    "doing": {"name": "Em Andamento", "color": "#ffc107"},
+    "done": {"name": "Concluído", "color": "#4caf50"}
+}
+
+# Prioridades aceitas para as tarefas
+PRIORITIES = ("Baixa", "Média", "Alta")
+
+# Distância entre as posições de tarefas vizinhas quando a coluna é numerada.
+# Uma tarefa reordenada recebe uma posição fracionária entre as vizinhas, de
+# modo que apenas ela precise ser regravada.
+POSITION_GAP = 1024.0
+
+# Número de tarefas carregadas por vez em cada coluna
+PAGE_SIZE = 50
+
+# Número de linhas buscadas por vez ao percorrer a tabela inteira
+ITER_FETCH_SIZE = 1000
+
+# Momento atual em segundos desde 1970 (com frações), usado nos eventos das
+# tarefas; o unixepoch('subsec') só existe a partir do SQLite 3.42
+SQL_NOW = "((julianday('now') - 2440587.5) * 86400.0)"
+
+# Coluna das tarefas concluídas e coluna em que o trabalho começa, usadas
+# nos agregados de cycle time e lead time
+DONE_COLUMN = "done"
+WORK_COLUMN = "doing"
+
+
+def sql_day(ts):
+    """Expressão SQL do dia local (AAAA-MM-DD) de um momento em segundos"""
+    return f"date({ts}, 'unixepoch', 'localtime')"
+
+
+def sql_days_between(start, end):
+    """Expressão SQL do número de dias do calendário de ``start`` a ``end``, contando os dois"""
+    return f"CAST(julianday({sql_day(end)}) - julianday({sql_day(start)}) AS INTEGER) + 1"
+
+
+def sql_completion_times(event, source=""):
+    """SELECT das linhas de cycle_time_daily (dia, métrica, dias, 1) das conclusões em ``event``.
+
+    O lead time conta desde o primeiro evento da tarefa e o cycle time desde
+    a primeira entrada em WORK_COLUMN (ou desde o primeiro evento, se a
+    tarefa não passou por ela); as buscas usam o índice (task_id, ts).
+    ``source`` é a cláusula FROM/WHERE que fornece ``event`` (vazia nos
+    triggers, onde ele é ``new``).
+    """
+    first_event = f"(SELECT MIN(ts) FROM task_events WHERE task_id = {event}.task_id AND ts <= {event}.ts)"
+    work_started = (
+        f"(SELECT MIN(ts) FROM task_events WHERE task_id = {event}.task_id AND ts <= {event}.ts "
+        f"AND kind IN ('create', 'move') AND to_column = '{WORK_COLUMN}')"
+    )
+    day = sql_day(f"{event}.ts")
+    return (
+        f"SELECT * FROM ("
+        f"SELECT {day} AS day, 'lead' AS metric, "
+        f"{sql_days_between(first_event, f'{event}.ts')} AS days, 1 AS count {source} "
+        f"UNION ALL "
+        f"SELECT {day}, 'cycle', "
+        f"{sql_days_between(f'COALESCE({work_started}, {first_event})', f'{event}.ts')}, 1 {source}"
+        f") WHERE true"
+    )
+
+
+# Migrações do esquema, na ordem em que devem ser aplicadas. A versão do
+# banco (PRAGMA user_version) é o número de migrações já aplicadas; novas
+# migrações devem ser sempre adicionadas ao final da lista.
+MIGRATIONS = [
+    # 1: tabela de tarefas original
+    (
+        '''
+        CREATE TABLE IF NOT EXISTS tasks (
+            id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            description TEXT,
+            priority TEXT,
+            column_id TEXT
+        )
+        ''',
+    ),
+    # 2: ordem das tarefas dentro da coluna
+    (
+        "ALTER TABLE tasks ADD COLUMN position REAL NOT NULL DEFAULT 0",
+        f"UPDATE tasks SET position = rowid * {POSITION_GAP}",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_column_position ON tasks (column_id, position)",
+    ),
+    # 3: id como desempate no índice, para a paginação por chave (position, id)
+    (
+        "DROP INDEX IF EXISTS idx_tasks_column_position",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_column_position_id ON tasks (column_id, position, id)",
+    ),
+    # 4: versão do quadro, incrementada a cada transação que altera as
+    # tarefas (usada como ETag pela API web). A época aleatória distingue
+    # bancos recriados, cujo contador recomeça do zero.
+    (
+        '''
+        CREATE TABLE IF NOT EXISTS board_revision (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            epoch TEXT NOT NULL,
+            revision INTEGER NOT NULL
+        )
+        ''',
+        "INSERT OR IGNORE INTO board_revision (id, epoch, revision) VALUES (1, lower(hex(randomblob(8))), 0)",
+    ),
+    # 5: índice de texto completo (FTS5) dos títulos e descrições. A tabela
+    # usa o conteúdo da própria tabela tasks (pelo rowid) e é mantida pelos
+    # triggers; a atualização só reindexa a tarefa quando o texto muda. As
+    # importações pausam o trigger de inserção dentro da própria transação e
+    # indexam o lote de uma vez (ver ``insert_tasks``).
+    (
+        '''
+        CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+            title, description,
+            content='tasks', content_rowid='rowid',
+            tokenize='unicode61 remove_diacritics 2'
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS tasks_fts_state (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            paused INTEGER NOT NULL
+        )
+        ''',
+        "INSERT OR IGNORE INTO tasks_fts_state (id, paused) VALUES (1, 0)",
+        '''
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks
+        WHEN (SELECT paused FROM tasks_fts_state WHERE id = 1) = 0 BEGIN
+            INSERT INTO tasks_fts (rowid, title, description) VALUES (new.rowid, new.title, new.description);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+            VALUES ('delete', old.rowid, old.title, old.description);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks
+        WHEN old.title IS NOT new.title OR old.description IS NOT new.description BEGIN
+            INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+            VALUES ('delete', old.rowid, old.title, old.description);
+            INSERT INTO tasks_fts (rowid, title, description) VALUES (new.rowid, new.title, new.description);
+        END
+        ''',
+        "INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')",
+    ),
+    # 6: histórico de eventos das tarefas (criação, mudança de coluna, edição
+    # e exclusão), usado para medir lead time e cycle time. Os eventos são
+    # gravados pelos triggers, na mesma transação da alteração, e a tabela só
+    # aceita inserções. A criação das tarefas importadas em lote é registrada
+    # pelo ``insert_tasks`` com um único INSERT ... SELECT, como no índice de
+    # texto, pausando o trigger de criação pelo indicador de
+    # task_events_state. As tarefas que já existiam recebem um evento de
+    # criação com o momento da migração, que serve de estado inicial do
+    # histórico.
+    (
+        '''
+        CREATE TABLE IF NOT EXISTS task_events (
+            id INTEGER PRIMARY KEY,
+            task_id TEXT NOT NULL,
+            ts REAL NOT NULL,
+            kind TEXT NOT NULL,
+            from_column TEXT,
+            to_column TEXT
+        )
+        ''',
+        "CREATE INDEX IF NOT EXISTS idx_task_events_task_ts ON task_events (task_id, ts)",
+        "CREATE INDEX IF NOT EXISTS idx_task_events_ts ON task_events (ts)",
+        '''
+        CREATE TABLE IF NOT EXISTS task_events_state (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            paused INTEGER NOT NULL
+        )
+        ''',
+        "INSERT OR IGNORE INTO task_events_state (id, paused) VALUES (1, 0)",
+        f'''
+        CREATE TRIGGER IF NOT EXISTS task_events_create AFTER INSERT ON tasks
+        WHEN (SELECT paused FROM task_events_state WHERE id = 1) = 0 BEGIN
+            INSERT INTO task_events (task_id, ts, kind, to_column)
+            VALUES (new.id, {SQL_NOW}, 'create', new.column_id);
+        END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS task_events_move AFTER UPDATE OF column_id ON tasks
+        WHEN old.column_id IS NOT new.column_id BEGIN
+            INSERT INTO task_events (task_id, ts, kind, from_column, to_column)
+            VALUES (new.id, {SQL_NOW}, 'move', old.column_id, new.column_id);
+        END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS task_events_edit AFTER UPDATE OF title, description, priority ON tasks
+        WHEN old.title IS NOT new.title OR old.description IS NOT new.description
+            OR old.priority IS NOT new.priority BEGIN
+            INSERT INTO task_events (task_id, ts, kind, from_column, to_column)
+            VALUES (new.id, {SQL_NOW}, 'edit', new.column_id, new.column_id);
+        END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS task_events_delete AFTER DELETE ON tasks BEGIN
+            INSERT INTO task_events (task_id, ts, kind, from_column)
+            VALUES (old.id, {SQL_NOW}, 'delete', old.column_id);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS task_events_no_update BEFORE UPDATE ON task_events BEGIN
+            SELECT RAISE(ABORT, 'task_events aceita apenas inserções');
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS task_events_no_delete BEFORE DELETE ON task_events BEGIN
+            SELECT RAISE(ABORT, 'task_events aceita apenas inserções');
+        END
+        ''',
+        f"INSERT INTO task_events (task_id, ts, kind, to_column) SELECT id, {SQL_NOW}, 'create', column_id FROM tasks",
+    ),
+    # 7: agregados diários do histórico, para a aba de análise. flow_daily
+    # guarda, por dia e coluna, quantas tarefas entraram e saíram (o total de
+    # cada coluna em um dia é a soma acumulada até ele); cycle_time_daily
+    # guarda, por dia de conclusão, quantas tarefas levaram cada número de
+    # dias, do início do trabalho ("cycle") ou da criação ("lead") até a
+    # conclusão. Só conta como conclusão a mudança para "done": tarefas
+    # criadas ou importadas direto na coluna (como o estado inicial da
+    # migração 6) entram apenas no fluxo. Os agregados são atualizados pelos
+    # triggers a cada evento, na mesma transação; as importações em lote
+    # agregam as criações de uma vez (ver ``insert_tasks``).
+    (
+        '''
+        CREATE TABLE IF NOT EXISTS flow_daily (
+            day TEXT NOT NULL,
+            column_id TEXT NOT NULL,
+            arrivals INTEGER NOT NULL DEFAULT 0,
+            departures INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, column_id)
+        ) WITHOUT ROWID
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS cycle_time_daily (
+            day TEXT NOT NULL,
+            metric TEXT NOT NULL,
+            days INTEGER NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, metric, days)
+        ) WITHOUT ROWID
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS task_events_flow AFTER INSERT ON task_events
+        WHEN new.kind <> 'edit'
+            AND (new.kind <> 'create' OR (SELECT paused FROM task_events_state WHERE id = 1) = 0) BEGIN
+            INSERT INTO flow_daily (day, column_id, arrivals)
+            SELECT {sql_day('new.ts')}, new.to_column, 1 WHERE new.to_column IS NOT NULL
+            ON CONFLICT (day, column_id) DO UPDATE SET arrivals = arrivals + 1;
+            INSERT INTO flow_daily (day, column_id, departures)
+            SELECT {sql_day('new.ts')}, new.from_column, 1 WHERE new.from_column IS NOT NULL
+            ON CONFLICT (day, column_id) DO UPDATE SET departures = departures + 1;
+        END
+        ''',
+        f'''
+        CREATE TRIGGER IF NOT EXISTS task_events_cycle_time AFTER INSERT ON task_events
+        WHEN new.kind = 'move' AND new.to_column = '{DONE_COLUMN}' BEGIN
+            INSERT INTO cycle_time_daily (day, metric, days, count)
+            {sql_completion_times('new')}
+            ON CONFLICT (day, metric, days) DO UPDATE SET count = count + 1;
+        END
+        ''',
+        f'''
+        INSERT INTO flow_daily (day, column_id, arrivals, departures)
+        SELECT day, column_id, SUM(arrivals), SUM(departures) FROM (
+            SELECT {sql_day('ts')} AS day, to_column AS column_id, 1 AS arrivals, 0 AS departures
+            FROM task_events WHERE kind <> 'edit' AND to_column IS NOT NULL
+            UNION ALL
+            SELECT {sql_day('ts')}, from_column, 0, 1
+            FROM task_events WHERE kind <> 'edit' AND from_column IS NOT NULL
+        ) GROUP BY day, column_id
+        ''',
+        f'''
+        INSERT INTO cycle_time_daily (day, metric, days, count)
+        SELECT day, metric, days, COUNT(*) FROM (
+            {sql_completion_times('e', f"FROM task_events AS e WHERE e.kind = 'move' AND e.to_column = '{DONE_COLUMN}'")}
+        ) GROUP BY day, metric, days
+        ''',
+    ),
+]
+
+# Comandos SQL usados pelo repositório. Manter o texto idêntico entre chamadas
+# permite que o sqlite3 reutilize o statement já preparado em cada conexão.
+SQL_SELECT_ALL = "SELECT id, title, description, priority, column_id, position FROM tasks"
+SQL_SELECT_COLUMN_TASKS = (
+    "SELECT id, title, description, priority, column_id, position FROM tasks "
+    "WHERE column_id = ? ORDER BY position, id"
+)
+SQL_SELECT_COLUMN_FIRST_PAGE = (
+    "SELECT id, title, description, priority, column_id, position FROM tasks "
+    "WHERE column_id = ? ORDER BY position, id LIMIT ?"
+)
+SQL_SELECT_COLUMN_NEXT_PAGE = (
+    "SELECT id, title, description, priority, column_id, position FROM tasks "
+    "WHERE column_id = ? AND (position, id) > (?, ?) ORDER BY position, id LIMIT ?"
+)
+SQL_SELECT_NEXT_POSITION = (
+    "SELECT position FROM tasks "
+    "WHERE column_id = ? AND (position, id) > (?, ?) ORDER BY position, id LIMIT 1"
+)
+SQL_COUNT_COLUMN = "SELECT COUNT(*) FROM tasks WHERE column_id = ?"
+SQL_SELECT_COLUMN = "SELECT column_id FROM tasks WHERE id = ?"
+SQL_UPSERT = '''
+    INSERT INTO tasks (id, title, description, priority, column_id, position) VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        title = excluded.title,
+        description = excluded.description,
+        priority = excluded.priority,
+        column_id = excluded.column_id,
+        position = excluded.position
+'''
+SQL_INSERT_NEW = (
+    "INSERT INTO tasks (id, title, description, priority, column_id, position) VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(id) DO NOTHING"
+)
+SQL_SELECT_REVISION = "SELECT epoch, revision FROM board_revision WHERE id = 1"
+# Executado uma vez por transação de escrita (e não por linha, como faria um
+# trigger, que deixaria as importações em massa bem mais lentas)
+SQL_BUMP_REVISION = "UPDATE board_revision SET revision = revision + 1 WHERE id = 1"
+SQL_PAUSE_FTS_INSERT = "UPDATE tasks_fts_state SET paused = 1 WHERE id = 1"
+SQL_RESUME_FTS_INSERT = "UPDATE tasks_fts_state SET paused = 0 WHERE id = 1"
+SQL_PAUSE_EVENT_INSERT = "UPDATE task_events_state SET paused = 1 WHERE id = 1"
+SQL_RESUME_EVENT_INSERT = "UPDATE task_events_state SET paused = 0 WHERE id = 1"
+SQL_MAX_ROWID = "SELECT COALESCE(MAX(rowid), 0) FROM tasks"
+SQL_INDEX_NEW_TASKS = (
+    "INSERT INTO tasks_fts (rowid, title, description) "
+    "SELECT rowid, title, description FROM tasks WHERE rowid > ?"
+)
+SQL_RECORD_NEW_TASKS = (
+    f"INSERT INTO task_events (task_id, ts, kind, to_column) "
+    f"SELECT id, {SQL_NOW}, 'create', column_id FROM tasks WHERE rowid > ?"
+)
+SQL_MAX_EVENT_ID = "SELECT COALESCE(MAX(id), 0) FROM task_events"
+SQL_ROLLUP_NEW_TASKS = (
+    f"INSERT INTO flow_daily (day, column_id, arrivals) "
+    f"SELECT {sql_day('ts')}, to_column, COUNT(*) FROM task_events WHERE id > ? AND kind = 'create' "
+    f"GROUP BY 1, 2 "
+    f"ON CONFLICT (day, column_id) DO UPDATE SET arrivals = arrivals + excluded.arrivals"
+)
+SQL_SELECT_TASK_EVENTS = (
+    "SELECT task_id, ts, kind, from_column, to_column FROM task_events "
+    "WHERE task_id = ? ORDER BY ts, id"
+)
+SQL_SELECT_EVENTS = (
+    "SELECT task_id, ts, kind, from_column, to_column FROM task_events "
+    "WHERE ts >= ? AND ts < ? ORDER BY ts, id"
+)
+SQL_FIRST_FLOW_DAY = "SELECT MIN(day) FROM flow_daily"
+SQL_SELECT_FLOW = (
+    "SELECT day, column_id, arrivals, departures FROM flow_daily "
+    "WHERE day >= ? AND day <= ? ORDER BY day"
+)
+SQL_FLOW_BEFORE = "SELECT column_id, SUM(arrivals - departures) FROM flow_daily WHERE day < ? GROUP BY column_id"
+SQL_COMPLETION_HISTOGRAM = (
+    "SELECT metric, days, SUM(count) FROM cycle_time_daily "
+    "WHERE day >= ? AND day <= ? GROUP BY metric, days"
+)
+SQL_COMPLETIONS_PER_DAY = (
+    "SELECT day, SUM(count) FROM cycle_time_daily "
+    "WHERE day >= ? AND day <= ? AND metric = 'cycle' GROUP BY day ORDER BY day"
+)
+SQL_COUNT_MATCHES = "SELECT COUNT(*) FROM tasks_fts WHERE tasks_fts MATCH ?"
+SQL_SEARCH = (
+    "SELECT id, title, description, priority, column_id, position FROM tasks "
+    "WHERE rowid IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?) "
+    "ORDER BY column_id, position, id"
+)
+SQL_SEARCH_COLUMN = (
+    "SELECT id, title, description, priority, column_id, position FROM tasks "
+    "WHERE column_id = ? AND rowid IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?) "
+    "ORDER BY position, id LIMIT ?"
+)
+SQL_COUNT_SEARCH = (
+    "SELECT column_id, COUNT(*) FROM tasks "
+    "WHERE rowid IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?) GROUP BY column_id"
+)
+SQL_MAX_POSITIONS = "SELECT column_id, MAX(position) FROM tasks GROUP BY column_id"
+SQL_MOVE = "UPDATE tasks SET column_id = ?, position = ? WHERE id = ?"
+SQL_DELETE = "DELETE FROM tasks WHERE id = ?"
+
+
+def user_data_dir():
+    """Retorna a pasta de dados do usuário para o aplicativo.
+
+    A variável de ambiente SNAPDEV_DATA_DIR, se definida, tem prioridade.
+    Apenas monta o caminho; a pasta é criada na primeira conexão.
+    """
+    configured = os.environ.get("SNAPDEV_DATA_DIR")
+    if configured:
+        return os.path.abspath(os.path.expanduser(configured))
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or os.path.expanduser(os.path.join("~", "AppData", "Roaming"))
+    elif sys.platform == "darwin":
+        base = os.path.expanduser(os.path.join("~", "Library", "Application Support"))
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser(os.path.join("~", ".local", "share"))
+    return os.path.join(base, APP_NAME)
+
+
+def app_dir():
+    """Pasta do aplicativo: a do executável, quando empacotado, ou a raiz do projeto"""
+    if getattr(sys, "frozen", False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def legacy_db_path():
+    """Caminho absoluto do banco das versões anteriores, independente do diretório atual"""
+    return os.path.join(app_dir(), LEGACY_DB_FILE)
+
+
+def default_db_path():
+    """Caminho absoluto do banco de tarefas na pasta de dados do usuário"""
+    return os.path.join(user_data_dir(), DB_FILE_NAME)
+
+
+class BoardChangedError(Exception):
+    """O quadro não está mais na versão esperada por ``apply_changes()``"""
+
+
+class TaskRepository:
+    """Acesso às tarefas no SQLite com conexões de longa duração.
+
+    Cada thread recebe uma única conexão, aberta na primeira utilização e
+    reutilizada até ``close()``, de modo que cada operação custe apenas a
+    execução do próprio statement.
+
+    O repositório também guarda uma fotografia do último estado gravado de
+    cada tarefa, usada por ``save_tasks()`` para reescrever apenas as linhas
+    que realmente mudaram.
+
+    Com ``verify`` ativo, os chamadores podem reler as linhas gravadas para
+    conferência; no modo normal cada escrita é um único statement e a
+    conferência é feita pelo número de linhas afetadas.
+
+    Criar o repositório não acessa o disco: a pasta de dados, a cópia do
+    banco antigo (``legacy_file``) e as migrações são feitas apenas na
+    primeira conexão.
+    """
+
+    def __init__(self, db_file=None, verify=VERIFY_WRITES, legacy_file=None):
+        self.db_file = os.path.abspath(db_file or default_db_path())
+        self.legacy_file = os.path.abspath(legacy_file) if legacy_file else None
+        self.verify = verify
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._bootstrap_lock = threading.Lock()
+        self._ready = False
+        self._connections = []
+        self._snapshot = {}
+
+    def connection(self):
+        """Retorna a conexão da thread atual, abrindo-a se necessário.
+
+        A primeira conexão do repositório prepara o banco (ver ``_bootstrap``).
+        """
+        if not self._ready:
+            self._bootstrap()
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+        return conn
+
+    def _open(self):
+        """Abre a conexão da thread atual e aplica os pragmas"""
+        conn = sqlite3.connect(
+            self.db_file,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            check_same_thread=False
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        self._local.conn = conn
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def _bootstrap(self):
+        """Cria a pasta de dados, copia o banco antigo e aplica as migrações"""
+        with self._bootstrap_lock:
+            if self._ready:
+                return
+            os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+            self._import_legacy_db()
+            conn = getattr(self._local, "conn", None) or self._open()
+            self._migrate(conn)
+            self._ready = True
+
+    def _import_legacy_db(self):
+        """Copia o banco antigo para o novo caminho, se este ainda não existir"""
+        legacy = self.legacy_file
+        if not legacy or legacy == self.db_file:
+            return
+        if os.path.exists(self.db_file) or not os.path.exists(legacy):
+            return
+
+        # A API de backup copia um banco consistente, inclusive o conteúdo
+        # que ainda estiver no arquivo WAL
+        source = sqlite3.connect(legacy)
+        target = sqlite3.connect(self.db_file)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+        logger.info("Tarefas copiadas de %s para %s", legacy, self.db_file)
+
+    def close(self):
+        """Fecha todas as conexões abertas pelo repositório"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+    def close_thread_connection(self):
+        """Fecha a conexão da thread atual, para threads de vida curta"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        self._local.conn = None
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        conn.close()
+
+    def init_schema(self):
+        """Aplica as migrações que ainda não foram aplicadas ao banco.
+
+        Com o banco já atualizado, o custo é apenas a leitura do user_version.
+        """
+        self._migrate(self.connection())
+
+    def _migrate(self, conn):
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= len(MIGRATIONS):
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Reler a versão dentro da transação, caso outro processo tenha migrado
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            for number, statements in enumerate(MIGRATIONS[version:], start=version + 1):
+                for statement in statements:
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {number}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def fetch_all(self):
+        """Retorna todas as linhas da tabela de tarefas"""
+        rows = self.connection().execute(SQL_SELECT_ALL).fetchall()
+        with self._lock:
+            self._snapshot = {row[0]: row[1:] for row in rows}
+        return rows
+
+    def iter_tasks(self, columns=None, priorities=None, fetch_size=ITER_FETCH_SIZE):
+        """Percorre as tarefas pelo cursor, ordenadas por coluna e posição.
+
+        As linhas são buscadas em blocos de ``fetch_size``, sem montar a
+        lista completa; ``columns`` e ``priorities`` filtram o resultado.
+        Não altera a fotografia usada por ``save_tasks()``.
+        """
+        sql = "SELECT id, title, description, priority, column_id, position FROM tasks"
+        conditions, params = [], []
+        if columns:
+            conditions.append(f"column_id IN ({', '.join('?' * len(columns))})")
+            params.extend(columns)
+        if priorities:
+            conditions.append(f"priority IN ({', '.join('?' * len(priorities))})")
+            params.extend(priorities)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY column_id, position, id"
+
+        cursor = self.connection().execute(sql, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    def fetch_column(self, column_id):
+        """Retorna as tarefas de uma coluna, já ordenadas pela posição"""
+        rows = self.connection().execute(SQL_SELECT_COLUMN_TASKS, (column_id,)).fetchall()
+        with self._lock:
+            for row in rows:
+                self._snapshot[row[0]] = row[1:]
+        return rows
+
+    def fetch_column_page(self, column_id, after=None, limit=PAGE_SIZE):
+        """Retorna uma página de tarefas da coluna, ordenada por (position, id).
+
+        ``after`` é a chave ``(position, id)`` da última tarefa já carregada;
+        a busca continua a partir dela pelo índice, sem usar OFFSET.
+        """
+        conn = self.connection()
+        if after is None:
+            rows = conn.execute(SQL_SELECT_COLUMN_FIRST_PAGE, (column_id, limit)).fetchall()
+        else:
+            rows = conn.execute(SQL_SELECT_COLUMN_NEXT_PAGE, (column_id, *after, limit)).fetchall()
+        with self._lock:
+            for row in rows:
+                self._snapshot[row[0]] = row[1:]
+        return rows
+
+    def next_position(self, column_id, after):
+        """Posição da primeira tarefa da coluna depois da chave ``after``, se houver"""
+        row = self.connection().execute(SQL_SELECT_NEXT_POSITION, (column_id, *after)).fetchone()
+        return row[0] if row else None
+
+    def count_column(self, column_id):
+        """Retorna o número de tarefas gravadas na coluna"""
+        return self.connection().execute(SQL_COUNT_COLUMN, (column_id,)).fetchone()[0]
+
+    def fix_invalid_columns(self, valid_columns, default_column):
+        """Move para ``default_column`` as tarefas com coluna desconhecida.
+
+        Retorna o número de tarefas corrigidas.
+        """
+        placeholders = ", ".join("?" for _ in valid_columns)
+        conn = self.connection()
+        with conn:
+            fixed = conn.execute(
+                f"UPDATE tasks SET column_id = ? WHERE column_id IS NULL OR column_id NOT IN ({placeholders})",
+                (default_column, *valid_columns)
+            ).rowcount
+            if fixed:
+                conn.execute(SQL_BUMP_REVISION)
+        return fixed
+
+    def get_column(self, task_id):
+        """Retorna a coluna gravada para a tarefa, ou None se ela não existir"""
+        row = self.connection().execute(SQL_SELECT_COLUMN, (task_id,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _task_row(task_data):
+        """Converte o dicionário da tarefa nos parâmetros do UPSERT"""
+        return (
+            task_data["id"],
+            task_data.get("title", ""),
+            task_data.get("description", ""),
+            task_data.get("priority", "Baixa"),
+            task_data.get("column"),
+            task_data.get("position", 0.0)
+        )
+
+    def save_task(self, task_data):
+        """Insere ou atualiza uma tarefa. Retorna True se ela já era conhecida."""
+        row = self._task_row(task_data)
+        conn = self.connection()
+        with conn:
+            conn.execute(SQL_UPSERT, row)
+            conn.execute(SQL_BUMP_REVISION)
+        with self._lock:
+            existed = row[0] in self._snapshot
+            self._snapshot[row[0]] = row[1:]
+        return existed
+
+    def save_tasks(self, tasks):
+        """Grava em uma única transação apenas as tarefas que mudaram.
+
+        Retorna o número de linhas efetivamente escritas.
+        """
+        with self._lock:
+            rows = [
+                row for row in map(self._task_row, tasks)
+                if self._snapshot.get(row[0]) != row[1:]
+            ]
+        if not rows:
+            return 0
+        conn = self.connection()
+        with conn:
+            conn.executemany(SQL_UPSERT, rows)
+            conn.execute(SQL_BUMP_REVISION)
+        with self._lock:
+            for row in rows:
+                self._snapshot[row[0]] = row[1:]
+        return len(rows)
+
+    def insert_tasks(self, tasks, replace=False, remember=False):
+        """Insere um lote de tarefas em uma única transação, para importações.
+
+        Tarefas com id já existente são ignoradas, ou sobrescritas com
+        ``replace``. Diferente de ``save_tasks()``, não compara nem guarda a
+        fotografia das linhas, que cresceria com todo o arquivo importado;
+        com ``remember`` a fotografia é guardada, para tarefas que ficam
+        carregadas no quadro (como as da adição rápida).
+        Retorna o número de linhas efetivamente escritas.
+        """
+        rows = [self._task_row(task) for task in tasks]
+        if not rows:
+            return 0
+        conn = self.connection()
+        with conn:
+            # Indexar as tarefas novas, registrar a sua criação e agregá-la no
+            # fluxo diário com um único INSERT ... SELECT cada é bem mais rápido
+            # que os triggers linha a linha; as alterações de tarefas
+            # existentes (com ``replace``) continuam com os triggers
+            conn.execute(SQL_PAUSE_FTS_INSERT)
+            conn.execute(SQL_PAUSE_EVENT_INSERT)
+            last_rowid = conn.execute(SQL_MAX_ROWID).fetchone()[0]
+            written = conn.executemany(SQL_UPSERT if replace else SQL_INSERT_NEW, rows).rowcount
+            conn.execute(SQL_INDEX_NEW_TASKS, (last_rowid,))
+            last_event_id = conn.execute(SQL_MAX_EVENT_ID).fetchone()[0]
+            conn.execute(SQL_RECORD_NEW_TASKS, (last_rowid,))
+            conn.execute(SQL_ROLLUP_NEW_TASKS, (last_event_id,))
+            conn.execute(SQL_RESUME_FTS_INSERT)
+            conn.execute(SQL_RESUME_EVENT_INSERT)
+            if written:
+                conn.execute(SQL_BUMP_REVISION)
+        if remember and (replace or written == len(rows)):
+            # Sem ``replace``, só é seguro guardar se nenhuma linha foi ignorada
+            with self._lock:
+                for row in rows:
+                    self._snapshot[row[0]] = row[1:]
+        elif replace:
+            with self._lock:
+                for row in rows:
+                    if row[0] in self._snapshot:
+                        self._snapshot[row[0]] = row[1:]
+        return written
+
+    def count_matches(self, match):
+        """Retorna o número de tarefas encontradas pela busca (consulta só o índice)"""
+        return self.connection().execute(SQL_COUNT_MATCHES, (match,)).fetchone()[0]
+
+    def search_tasks(self, match):
+        """Busca as tarefas pelo índice de texto completo.
+
+        ``match`` é uma expressão de busca do FTS5. Retorna as linhas de
+        todas as tarefas encontradas, em ordem de coluna e posição; rápida
+        quando a busca é seletiva.
+        """
+        return self.connection().execute(SQL_SEARCH, (match,)).fetchall()
+
+    def search_column(self, match, column_id, limit):
+        """Busca as tarefas da coluna pelo índice de texto completo.
+
+        ``match`` é uma expressão de busca do FTS5. Retorna as linhas das
+        primeiras ``limit`` tarefas encontradas, na ordem da coluna. Percorre
+        o índice da coluna, então é indicada quando a busca encontra muitas
+        tarefas.
+        """
+        return self.connection().execute(SQL_SEARCH_COLUMN, (column_id, match, limit)).fetchall()
+
+    def count_search(self, match):
+        """Retorna o número de tarefas encontradas pela busca em cada coluna"""
+        return dict(self.connection().execute(SQL_COUNT_SEARCH, (match,)).fetchall())
+
+    def task_history(self, task_id):
+        """Retorna os eventos da tarefa, do mais antigo ao mais recente.
+
+        Cada evento é uma tupla ``(task_id, ts, kind, from_column, to_column)``,
+        com ``ts`` em segundos desde 1970 e ``kind`` igual a ``"create"``,
+        ``"move"``, ``"edit"`` ou ``"delete"``.
+        """
+        return self.connection().execute(SQL_SELECT_TASK_EVENTS, (task_id,)).fetchall()
+
+    def iter_events(self, start=None, end=None, fetch_size=ITER_FETCH_SIZE):
+        """Percorre pelo cursor os eventos com ``start <= ts < end``, em ordem.
+
+        Os limites são em segundos desde 1970 (None para não limitar); a
+        busca usa o índice de ``ts``, então o custo depende apenas do
+        intervalo pedido.
+        """
+        start = float("-inf") if start is None else start
+        end = float("inf") if end is None else end
+        cursor = self.connection().execute(SQL_SELECT_EVENTS, (start, end))
+        try:
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    def first_flow_day(self):
+        """Primeiro dia (AAAA-MM-DD) com eventos agregados, ou None"""
+        return self.connection().execute(SQL_FIRST_FLOW_DAY).fetchone()[0]
+
+    def flow_days(self, start_day, end_day):
+        """Entradas e saídas de cada coluna por dia, de ``start_day`` a ``end_day``.
+
+        Lê apenas os agregados diários (``flow_daily``), sem percorrer os
+        eventos. Retorna tuplas ``(dia, coluna, entradas, saídas)``.
+        """
+        return self.connection().execute(SQL_SELECT_FLOW, (start_day, end_day)).fetchall()
+
+    def flow_totals_before(self, day):
+        """Número de tarefas em cada coluna no início do dia informado"""
+        return dict(self.connection().execute(SQL_FLOW_BEFORE, (day,)).fetchall())
+
+    def completion_histogram(self, start_day, end_day):
+        """Conclusões de ``start_day`` a ``end_day`` por tempo até a conclusão.
+
+        Retorna tuplas ``(métrica, dias, quantidade)``, em que a métrica é
+        ``"cycle"`` ou ``"lead"``; cada conclusão aparece uma vez em cada
+        métrica.
+        """
+        return self.connection().execute(SQL_COMPLETION_HISTOGRAM, (start_day, end_day)).fetchall()
+
+    def completions_per_day(self, start_day, end_day):
+        """Número de conclusões em cada dia de ``start_day`` a ``end_day`` (dias sem conclusões são omitidos)"""
+        return self.connection().execute(SQL_COMPLETIONS_PER_DAY, (start_day, end_day)).fetchall()
+
+    def board_version(self):
+        """Retorna um identificador da versão atual do quadro.
+
+        Muda a cada tarefa inserida, alterada ou excluída, por qualquer
+        processo que use o banco; a leitura custa uma única linha.
+        """
+        epoch, revision = self.connection().execute(SQL_SELECT_REVISION).fetchone()
+        return f"{epoch}-{revision}"
+
+    def task_locations(self, task_ids):
+        """Retorna a coluna e a posição atuais das tarefas, por id"""
+        task_ids = list(task_ids)
+        locations = {}
+        conn = self.connection()
+        # Consultas em blocos, abaixo do limite de parâmetros do SQLite
+        for start in range(0, len(task_ids), 500):
+            chunk = task_ids[start:start + 500]
+            rows = conn.execute(
+                f"SELECT id, column_id, position FROM tasks WHERE id IN ({', '.join('?' * len(chunk))})",
+                chunk
+            )
+            for task_id, column_id, position in rows:
+                locations[task_id] = (column_id, position)
+        return locations
+
+    def max_positions(self):
+        """Retorna a maior posição usada em cada coluna"""
+        return dict(self.connection().execute(SQL_MAX_POSITIONS).fetchall())
+
+    def move_task(self, task_id, column_id, position):
+        """Move a tarefa para a coluna e posição informadas.
+
+        Retorna o número de linhas afetadas.
+        """
+        conn = self.connection()
+        with conn:
+            affected = conn.execute(SQL_MOVE, (column_id, position, task_id)).rowcount
+            if affected:
+                conn.execute(SQL_BUMP_REVISION)
+        with self._lock:
+            row = self._snapshot.get(task_id)
+            if row is not None:
+                self._snapshot[task_id] = row[:3] + (column_id, position)
+        return affected
+
+    def apply_changes(self, changes, expected_versions=None):
+        """Aplica um lote de alterações em uma única transação.
+
+        ``changes`` mapeia o id da tarefa para uma tupla ``(operação, dados)``,
+        onde a operação é ``"save"`` (dados = dicionário da tarefa), ``"move"``
+        (dados = tupla com a nova coluna e a nova posição) ou ``"delete"``.
+        Retorna os ids das movimentações e exclusões que não encontraram a
+        tarefa no banco.
+
+        Com ``expected_versions``, a versão do quadro (``board_version()``) é
+        conferida dentro da própria transação, que reserva a escrita antes da
+        leitura; se não for uma das versões informadas, nada é gravado e é
+        lançado BoardChangedError.
+        """
+        missing = []
+        conn = self.connection()
+        with conn:
+            if expected_versions is not None:
+                conn.execute("BEGIN IMMEDIATE")
+                epoch, revision = conn.execute(SQL_SELECT_REVISION).fetchone()
+                if f"{epoch}-{revision}" not in expected_versions:
+                    raise BoardChangedError(f"{epoch}-{revision}")
+            if not changes:
+                return missing
+            for task_id, (operation, data) in changes.items():
+                if operation == "save":
+                    conn.execute(SQL_UPSERT, self._task_row(data))
+                elif operation == "move":
+                    if conn.execute(SQL_MOVE, (*data, task_id)).rowcount != 1:
+                        missing.append(task_id)
+                elif operation == "delete":
+                    if conn.execute(SQL_DELETE, (task_id,)).rowcount != 1:
+                        missing.append(task_id)
+            conn.execute(SQL_BUMP_REVISION)
+        with self._lock:
+            for task_id, (operation, data) in changes.items():
+                if operation == "save":
+                    self._snapshot[task_id] = self._task_row(data)[1:]
+                elif operation == "move":
+                    row = self._snapshot.get(task_id)
+                    if row is not None:
+                        self._snapshot[task_id] = row[:3] + data
+                else:
+                    self._snapshot.pop(task_id, None)
+        return missing
+
+    def delete_task(self, task_id):
+        """Remove a tarefa do banco. Retorna o número de linhas afetadas."""
+        conn = self.connection()
+        with conn:
+            affected = conn.execute(SQL_DELETE, (task_id,)).rowcount
+            if affected:
+                conn.execute(SQL_BUMP_REVISION)
+        with self._lock:
+            self._snapshot.pop(task_id, None)
+        return affected
+
+
+_repository = None
+_repository_lock = threading.Lock()
+
+
+def get_repository():
+    """Retorna o repositório compartilhado pela aplicação"""
+    global _repository
+    if _repository is None:
+        with _repository_lock:
+            if _repository is None:
+                _repository = TaskRepository(legacy_file=legacy_db_path())
+    return _repository
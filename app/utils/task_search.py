@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Busca de tarefas pelo índice de texto completo (FTS5) do banco.
+
+Cada palavra digitada é buscada como prefixo, sem diferenciar maiúsculas e
+acentos, e a tarefa precisa conter todas elas no título ou na descrição. As
+buscas rodam em uma thread própria; enquanto uma busca executa, apenas o
+texto mais recente fica aguardando, e os anteriores são descartados.
+"""
+
+import logging
+import threading
+import time
+
+from app.utils.task_repository import COLUMNS, get_repository
+
+logger = logging.getLogger(__name__)
+
+# Número máximo de tarefas encontradas exibidas em cada coluna
+SEARCH_LIMIT = 1000
+
+# Até este número de tarefas encontradas, todas são lidas em uma única
+# consulta pelo índice de texto; acima dele, cada coluna lê apenas as
+# primeiras SEARCH_LIMIT percorrendo o seu índice de posição
+SINGLE_QUERY_LIMIT = 20000
+
+
+def build_match_query(text):
+    """Converte o texto digitado em uma expressão de busca do FTS5.
+
+    Retorna None se o texto não tiver nenhuma palavra.
+    """
+    terms = []
+    for word in text.split():
+        # Cada palavra vira uma frase entre aspas (sem operadores do FTS5)
+        # buscada como prefixo
+        word = word.replace('"', '""')
+        terms.append(f'"{word}"*')
+    return " ".join(terms) or None
+
+
+def search_board(text, repository=None, limit=SEARCH_LIMIT):
+    """Busca as tarefas de todas as colunas.
+
+    Retorna None para um texto vazio; caso contrário, um dicionário com as
+    linhas das tarefas encontradas em cada coluna (``rows``, até ``limit``
+    por coluna, na ordem da coluna), o total encontrado em cada coluna
+    (``counts``) e o tempo da busca.
+    """
+    match = build_match_query(text)
+    if match is None:
+        return None
+    repository = repository or get_repository()
+
+    start = time.perf_counter()
+    if repository.count_matches(match) <= SINGLE_QUERY_LIMIT:
+        rows = {column_id: [] for column_id in COLUMNS}
+        counts = dict.fromkeys(COLUMNS, 0)
+        for row in repository.search_tasks(match):
+            column_id = row[4]
+            if column_id in rows:
+                counts[column_id] += 1
+                if len(rows[column_id]) < limit:
+                    rows[column_id].append(row)
+    else:
+        rows = {column_id: repository.search_column(match, column_id, limit) for column_id in COLUMNS}
+        counts = repository.count_search(match)
+    seconds = time.perf_counter() - start
+
+    logger.debug("Busca %r: %s em %.1f ms", text, counts, seconds * 1000)
+    return {"rows": rows, "counts": counts, "seconds": seconds}
+
+
+class SearchWorker:
+    """Executa as buscas em segundo plano, uma por vez.
+
+    ``callback(sequence, text, result)`` é chamado na thread da busca;
+    ``result`` é o retorno de ``search_board()`` ou a exceção lançada. O
+    número de sequência permite ignorar resultados de textos já alterados.
+    """
+
+    def __init__(self, callback, repository=None):
+        self.callback = callback
+        self.repository = repository or get_repository()
+        self._condition = threading.Condition()
+        self._pending = None
+        self._sequence = 0
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="task-search", daemon=True)
+        self._thread.start()
+
+    @property
+    def latest(self):
+        """Número de sequência da busca mais recente"""
+        return self._sequence
+
+    def submit(self, text):
+        """Agenda a busca do texto, substituindo a que ainda aguardava"""
+        with self._condition:
+            self._sequence += 1
+            self._pending = (self._sequence, text)
+            self._condition.notify()
+            return self._sequence
+
+    def close(self):
+        """Encerra a thread após a busca em andamento"""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._stopping:
+                    self._condition.wait()
+                if self._stopping:
+                    break
+                (sequence, text), self._pending = self._pending, None
+
+            try:
+                result = search_board(text, self.repository)
+            except Exception as e:
+                logger.exception("Erro ao buscar %r", text)
+                result = e
+            self.callback(sequence, text, result)
+        self.repository.close_thread_connection()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+import threading
+import time
+
+from app.utils.task_repository import get_repository
+
+logger = logging.getLogger(__name__)
+
+# Tempo (em segundos) que o worker espera por novas alterações antes de gravar,
+# para agrupar várias mudanças da mesma tarefa em uma única escrita
+COALESCE_WINDOW = 0.5
+
+# Tentativas de gravar um lote que falhou antes de gravar as suas alterações
+# uma a uma, descartando as que continuarem falhando. A espera entre as
+# tentativas dobra a cada falha, a partir de COALESCE_WINDOW.
+MAX_WRITE_ATTEMPTS = 3
+
+
+def merge_change(pending, operation, task_id, data):
+    """Combina a alteração com a que já está em ``pending`` para a mesma tarefa"""
+    current = pending.get(task_id)
+    if current is not None and current[0] == "delete":
+        # A exclusão é definitiva: alterações atrasadas não recriam a tarefa
+        return
+    if operation == "move" and current is not None and current[0] == "save":
+        # Mantém a gravação completa, apenas com a nova coluna e posição
+        task_data = dict(current[1])
+        task_data["column"], task_data["position"] = data
+        pending[task_id] = ("save", task_data)
+        return
+    pending[task_id] = (operation, data)
+
+
+class WriteBehindQueue:
+    """Fila de gravação em segundo plano para as alterações de tarefas.
+
+    A interface registra as alterações e retorna imediatamente; cada
+    alteração é combinada, já ao ser registrada, com a que estiver pendente
+    para a mesma tarefa, de modo que o que aguarda gravação nunca passa de
+    uma entrada por tarefa, mesmo com o worker parado em uma escrita lenta.
+    O worker espera ``COALESCE_WINDOW`` após a primeira alteração e grava
+    tudo o que estiver pendente em uma única transação.
+    """
+
+    def __init__(self, repository=None, window=COALESCE_WINDOW, max_attempts=MAX_WRITE_ATTEMPTS):
+        self.repository = repository or get_repository()
+        self.window = window
+        self.max_attempts = max_attempts
+        self._condition = threading.Condition()
+        self._pending = {}
+        # Número de alterações registradas e das que já tiveram a gravação tentada
+        self._received = 0
+        self._attempted = 0
+        self._failures = 0
+        self._dropped = False
+        self._urgent = False
+        self._stopping = False
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="task-write-behind", daemon=True)
+        self._thread.start()
+
+    def enqueue_save(self, task_data):
+        """Registra a gravação completa de uma tarefa"""
+        self._enqueue("save", task_data["id"], dict(task_data))
+
+    def enqueue_move(self, task_id, column_id, position):
+        """Registra a mudança de coluna ou de posição de uma tarefa"""
+        self._enqueue("move", task_id, (column_id, position))
+
+    def enqueue_delete(self, task_id):
+        """Registra a exclusão de uma tarefa"""
+        self._enqueue("delete", task_id, None)
+
+    def _enqueue(self, operation, task_id, data):
+        with self._condition:
+            merge_change(self._pending, operation, task_id, data)
+            self._received += 1
+            self._condition.notify_all()
+
+    def flush(self):
+        """Grava já as alterações registradas e espera a gravação terminar.
+
+        Retorna False se alguma alteração não pôde ser gravada (ainda
+        aguardando uma nova tentativa ou descartada desde o último flush).
+        """
+        with self._condition:
+            target = self._received
+            if self._attempted < target:
+                self._urgent = True
+                self._condition.notify_all()
+            while self._attempted < target and not self._stopped:
+                self._condition.wait()
+            dropped, self._dropped = self._dropped, False
+            return not self._failures and not dropped
+
+    def close(self):
+        """Grava as alterações pendentes e encerra o worker"""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _apply(self, changes):
+        """Grava as alterações em uma transação e registra as que não acharam a tarefa"""
+        for task_id in self.repository.apply_changes(changes):
+            if changes[task_id][0] == "delete":
+                # Tarefa excluída antes de ser gravada (ou já excluída): nada a fazer
+                logger.debug("Exclusão da tarefa %s, que não está no banco, ignorada", task_id)
+            else:
+                logger.error("Tarefa %s não encontrada no banco ao gravar alteração", task_id)
+
+    def _write(self, changes, final=False):
+        """Grava as alterações em uma única transação.
+
+        Se a transação falha, retorna as alterações para uma nova tentativa;
+        após ``max_attempts`` falhas (ou ao encerrar), elas são gravadas uma
+        a uma, e apenas as que falharem de novo são descartadas.
+        """
+        try:
+            self._apply(changes)
+            self._failures = 0
+            return None
+        except Exception as e:
+            self._failures += 1
+            if not final and self._failures < self.max_attempts:
+                logger.warning("Erro ao gravar %d alterações no banco (tentativa %d de %d): %s",
+                               len(changes), self._failures, self.max_attempts, e)
+                return changes
+            logger.error("Erro ao gravar %d alterações no banco: %s; gravando uma a uma", len(changes), e)
+
+        dropped = False
+        for task_id, change in changes.items():
+            try:
+                self._apply({task_id: change})
+            except Exception as e:
+                logger.error("Alteração da tarefa %s descartada: %s", task_id, e)
+                dropped = True
+        self._failures = 0
+        with self._condition:
+            self._dropped = self._dropped or dropped
+        return None
+
+    def _delay(self):
+        """Espera antes de gravar: a janela de agrupamento, dobrada a cada falha"""
+        return self.window * 2 ** max(self._failures - 1, 0)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopping:
+                    self._condition.wait()
+                if not self._pending:
+                    break
+                # Agrupar as alterações que chegarem durante a janela, a
+                # menos que um flush ou o encerramento peça a gravação já
+                deadline = time.monotonic() + self._delay()
+                while not self._stopping and not self._urgent:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                self._urgent = False
+                changes, self._pending = self._pending, {}
+                received = self._received
+                final = self._stopping
+
+            retry = self._write(changes, final)
+
+            with self._condition:
+                if retry:
+                    # As alterações registradas durante a escrita são mais novas
+                    for task_id, (operation, data) in self._pending.items():
+                        merge_change(retry, operation, task_id, data)
+                    self._pending = retry
+                self._attempted = received
+                self._condition.notify_all()
+
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+
+_write_queue = None
+_write_queue_lock = threading.Lock()
+
+
+def get_write_queue():
+    """Retorna a fila de gravação compartilhada pela aplicação"""
+    global _write_queue
+    if _write_queue is None:
+        with _write_queue_lock:
+            if _write_queue is None:
+                _write_queue = WriteBehindQueue()
+    return _write_queue
+
+
+def close_write_queue():
+    """Grava as alterações pendentes e encerra a fila, se ela foi criada"""
+    global _write_queue
+    with _write_queue_lock:
+        write_queue, _write_queue = _write_queue, None
+    if write_queue is not None:
+        write_queue.close()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Custo de abrir a aba de análise com um histórico longo.
+
+Grava anos de histórico sintético de eventos em um banco temporário e
+compara a montagem das métricas pelos agregados diários (o que a aba faz)
+com a releitura de todos os eventos, que calcula as mesmas séries em
+Python. Antes de medir, confere que os dois caminhos dão o mesmo resultado.
+
+Uso:
+    python benchmarks/bench_analytics.py --years 3 --arrivals 20
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import date, timedelta
+from statistics import median
+
+from common import enter_temp_dir, synthetic_history
+
+
+def replay_events(repository, days=90, today=None):
+    """Referência: as métricas de ``flow_metrics()`` relendo todos os eventos.
+
+    Separa as entradas e saídas de cada coluna por dia e calcula o cycle
+    time e o lead time de cada conclusão a partir dos eventos anteriores da
+    tarefa, com as mesmas regras dos agregados do banco.
+    """
+    from app.utils.flow_metrics import histogram_percentiles, week_start
+    from app.utils.task_repository import COLUMNS, DONE_COLUMN, WORK_COLUMN
+
+    today = today or date.today()
+    changes = {}
+    first_event, work_started = {}, {}
+    completions = []
+    for task_id, ts, kind, from_column, to_column in repository.iter_events():
+        day = date.fromtimestamp(ts)
+        first_event.setdefault(task_id, day)
+        if kind in ("create", "move") and to_column == WORK_COLUMN:
+            work_started.setdefault(task_id, day)
+        if kind == "edit":
+            continue
+        day_changes = changes.setdefault(day, {})
+        if from_column:
+            day_changes[from_column] = day_changes.get(from_column, 0) - 1
+        if to_column:
+            day_changes[to_column] = day_changes.get(to_column, 0) + 1
+        if kind == "move" and to_column == DONE_COLUMN:
+            started = work_started.get(task_id, first_event[task_id])
+            completions.append((day, (day - started).days + 1, (day - first_event[task_id]).days + 1))
+
+    if days is None:
+        start = min(changes) if changes else today
+    else:
+        start = today - timedelta(days=days - 1)
+    start = min(start, today)
+
+    totals = dict.fromkeys(COLUMNS, 0)
+    for day, day_changes in changes.items():
+        if day < start:
+            for column_id, change in day_changes.items():
+                if column_id in totals:
+                    totals[column_id] += change
+    period = [start + timedelta(days=offset) for offset in range((today - start).days + 1)]
+    columns = {column_id: [] for column_id in COLUMNS}
+    for day in period:
+        for column_id, change in changes.get(day, {}).items():
+            if column_id in totals:
+                totals[column_id] += change
+        for column_id in COLUMNS:
+            columns[column_id].append(totals[column_id])
+
+    cycle, lead, weekly = {}, {}, {}
+    for day, cycle_days, lead_days in completions:
+        if start <= day <= today:
+            cycle[cycle_days] = cycle.get(cycle_days, 0) + 1
+            lead[lead_days] = lead.get(lead_days, 0) + 1
+            weekly[week_start(day)] = weekly.get(week_start(day), 0) + 1
+    throughput = []
+    week = week_start(start)
+    while week <= today:
+        throughput.append((week, weekly.get(week, 0)))
+        week += timedelta(days=7)
+
+    return {
+        "days": period,
+        "columns": columns,
+        "throughput": throughput,
+        "cycle_time": {"histogram": cycle, "percentiles": histogram_percentiles(cycle), "count": sum(cycle.values())},
+        "lead_time": {"histogram": lead, "percentiles": histogram_percentiles(lead), "count": sum(lead.values())}
+    }
+
+
+def measure(function, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo das métricas da aba de análise")
+    parser.add_argument("--years", type=float, default=3.0, help="anos de histórico (padrão: 3)")
+    parser.add_argument("--arrivals", type=int, default=20, help="tarefas novas por dia (padrão: 20)")
+    parser.add_argument("--repeat", type=int, default=5, help="repetições de cada medição")
+    parser.add_argument("--json", action="store_true", help="imprime o resultado em JSON")
+    args = parser.parse_args()
+
+    enter_temp_dir()
+    from app.utils.flow_metrics import flow_metrics
+    from app.utils.task_repository import get_repository
+    repository = get_repository()
+
+    start = time.perf_counter()
+    events = synthetic_history(repository, int(args.years * 365), args.arrivals)
+    history_seconds = time.perf_counter() - start
+
+    # Os agregados precisam dar exatamente as séries da releitura
+    today = date.today()
+    for days in (90, None):
+        metrics = flow_metrics(repository, days, today)
+        del metrics["seconds"]
+        if metrics != replay_events(repository, days, today):
+            print(f"As métricas dos agregados ({days or 'todos os'} dias) diferem da releitura dos eventos",
+                  file=sys.stderr)
+            repository.close()
+            return 1
+
+    result = {
+        "benchmark": "analytics",
+        "events": events,
+        "history_seconds": round(history_seconds, 2),
+        "metrics_90_days_ms": round(measure(lambda: flow_metrics(repository, 90, today), args.repeat), 2),
+        "metrics_all_ms": round(measure(lambda: flow_metrics(repository, None, today), args.repeat), 2),
+        "replay_90_days_ms": round(measure(lambda: replay_events(repository, 90, today), args.repeat), 2),
+        "replay_all_ms": round(measure(lambda: replay_events(repository, None, today), args.repeat), 2)
+    }
+    repository.close()
+
+    if args.json:
+        print(json.dumps(result))
+        return 0
+
+    print(f"{events} eventos sintéticos gravados em {history_seconds:.2f} s")
+    print("  (métricas conferidas com a releitura de todos os eventos)")
+    print(f"  métricas dos últimos 90 dias:   {result['metrics_90_days_ms']:>9.2f} ms")
+    print(f"  métricas de todo o histórico:   {result['metrics_all_ms']:>9.2f} ms")
+    print(f"  releitura, últimos 90 dias:     {result['replay_90_days_ms']:>9.2f} ms")
+    print(f"  releitura, todo o histórico:    {result['replay_all_ms']:>9.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks do quadro Kanban com bancos sintéticos.
+
+Para cada tamanho de banco (por padrão 100, 1k, 10k e 50k tarefas) um
+processo separado cria o tasks.db sintético em um diretório temporário,
+monta o KanbanBoard em modo offscreen e mede:
+
+    construction                 KanbanBoard() até o primeiro frame
+    load_tasks                   KanbanBoard.load_tasks()
+    save_all_tasks_to_db         salvar sem alterações
+    save_all_tasks_to_db_dirty   salvar com todas as tarefas carregadas alteradas
+    move_task                    mover uma tarefa para outra coluna (move_task)
+    delete_task                  excluir uma tarefa (confirmação respondida)
+    edit_task                    editar o título de uma tarefa (diálogo aceito)
+
+Mover, excluir e editar incluem a gravação no banco: cada medição termina
+com o flush da fila de gravação em segundo plano.
+    search                       buscar um termo seletivo (FTS5) e exibir os resultados
+
+O resultado traz mediana e p95 de cada operação, em ms, e o pico de memória
+(RSS) de cada processo, em JSON, para comparar entre commits:
+
+    python benchmarks/bench_board.py --output antes.json
+    python benchmarks/bench_board.py --compare antes.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from statistics import median
+
+from common import enter_temp_dir, percentile, populate, settle, shutdown
+
+DEFAULT_SIZES = "100,1000,10000,50000"
+
+
+def peak_rss_mb():
+    """Pico de memória residente do processo, em MB (None se indisponível)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss é em KB no Linux e em bytes no macOS
+    if sys.platform == "darwin":
+        peak /= 1024
+    return round(peak / 1024, 1)
+
+
+def summarize(samples):
+    return {
+        "iterations": len(samples),
+        "median_ms": round(median(samples) * 1000, 3),
+        "p95_ms": round(percentile(samples, 0.95) * 1000, 3)
+    }
+
+
+def measure(samples, operation, app):
+    """Executa a operação, processa os eventos gerados e guarda o tempo"""
+    start = time.perf_counter()
+    operation()
+    app.processEvents()
+    samples.append(time.perf_counter() - start)
+
+
+def persisted(operation):
+    """A operação seguida da gravação das alterações que ela enfileirou"""
+    from app.utils.write_queue import get_write_queue
+
+    def run():
+        operation()
+        get_write_queue().flush()
+    return run
+
+
+def patch_dialogs():
+    """Responde automaticamente aos diálogos modais usados pelas operações"""
+    from PySide6.QtWidgets import QMessageBox, QDialog
+    from app.components import kanban_board
+
+    QMessageBox.question = staticmethod(lambda *args, **kwargs: QMessageBox.Yes)
+
+    def accept_edit(dialog):
+        dialog.title_input.setText(dialog.title_input.text() + " *")
+        return QDialog.Accepted
+    kanban_board.TaskDialog.exec = accept_edit
+
+
+def run_size(tasks, repeat, ops):
+    """Mede todas as operações em um banco com ``tasks`` tarefas"""
+    enter_temp_dir()
+
+    from PySide6.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+
+    from app.utils.task_repository import get_repository
+    populate_start = time.perf_counter()
+    populate(get_repository(), tasks)
+    populate_seconds = time.perf_counter() - populate_start
+
+    results = {}
+    from app.components.kanban_board import KanbanBoard
+    patch_dialogs()
+
+    # Construção do quadro, até o primeiro frame
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        board = KanbanBoard()
+        board.resize(1200, 800)
+        board.show()
+        app.processEvents()
+        samples.append(time.perf_counter() - start)
+        board.close()
+        board.deleteLater()
+        settle(app, 0.05)
+    results["construction"] = summarize(samples)
+
+    board = KanbanBoard()
+    board.resize(1200, 800)
+    board.show()
+    settle(app)
+
+    samples = []
+    for _ in range(repeat):
+        measure(samples, board.load_tasks, app)
+    results["load_tasks"] = summarize(samples)
+
+    samples = []
+    for _ in range(repeat):
+        measure(samples, board.save_all_tasks_to_db, app)
+    results["save_all_tasks_to_db"] = summarize(samples)
+
+    samples = []
+    for i in range(repeat):
+        for column in board.columns.values():
+            for task_id in column.model.task_ids():
+                column.model.store.get(task_id)["description"] = f"Alterada {i}"
+        measure(samples, board.save_all_tasks_to_db, app)
+    results["save_all_tasks_to_db_dirty"] = summarize(samples)
+
+    # Mover alternando entre duas colunas mantém o tamanho delas estável
+    samples = []
+    first, second = board.columns["to_do"], board.columns["doing"]
+    for i in range(ops):
+        source, destination = (first, second) if i % 2 == 0 else (second, first)
+        task_id = source.model.task_id_at(0)
+        if task_id is None:
+            break
+        measure(samples, persisted(lambda: source.move_task(task_id, destination.column_id)), app)
+    if samples:
+        results["move_task"] = summarize(samples)
+
+    # A busca roda aqui na mesma thread, para medir consulta e exibição juntas
+    from app.utils.task_search import search_board
+
+    def search(text):
+        board.search_sequence = 0
+        board.on_search_finished(0, text, search_board(text))
+
+    samples = []
+    for i in range(ops):
+        measure(samples, lambda: search(f"Tarefa {i % 10}{i % 7}{i % 3}"), app)
+    results["search"] = summarize(samples)
+    board.on_search_text_changed("")
+
+    samples = []
+    column = board.columns["done"]
+    for _ in range(ops):
+        task_id = column.model.task_id_at(0)
+        if task_id is None:
+            break
+        measure(samples, persisted(lambda: column.edit_task(task_id)), app)
+    if samples:
+        results["edit_task"] = summarize(samples)
+
+    samples = []
+    for _ in range(ops):
+        task_id = column.model.task_id_at(0)
+        if task_id is None:
+            break
+        measure(samples, persisted(lambda: column.delete_task(task_id)), app)
+    if samples:
+        results["delete_task"] = summarize(samples)
+
+    shutdown()
+
+    return {
+        "tasks": tasks,
+        "populate_s": round(populate_seconds, 3),
+        "operations": results,
+        "peak_rss_mb": peak_rss_mb()
+    }
+
+
+def run_child(tasks, args):
+    """Roda as medições de um tamanho em um processo separado"""
+    command = [sys.executable, os.path.abspath(__file__), "--child", str(tasks),
+               "--repeat", str(args.repeat), "--ops", str(args.ops)]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def environment():
+    """Dados do ambiente, para saber o que está sendo comparado"""
+    info = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+    try:
+        import PySide6
+        info["pyside6"] = PySide6.__version__
+    except ImportError:
+        pass
+    try:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        info["commit"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=root,
+            check=True, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass
+    return info
+
+
+def print_table(result, baseline=None):
+    """Imprime os resultados; com ``baseline``, também a razão atual/base"""
+    base_sizes = {entry["tasks"]: entry for entry in (baseline or {}).get("sizes", [])}
+    for entry in result["sizes"]:
+        print(f"\n{entry['tasks']} tarefas (pico de RSS: {entry['peak_rss_mb']} MB)")
+        header = f"  {'operação':<28} {'mediana (ms)':>13} {'p95 (ms)':>10}"
+        if baseline:
+            header += f" {'base (ms)':>10} {'razão':>7}"
+        print(header)
+        base_ops = base_sizes.get(entry["tasks"], {}).get("operations", {})
+        for name, stats in entry["operations"].items():
+            line = f"  {name:<28} {stats['median_ms']:>13.3f} {stats['p95_ms']:>10.3f}"
+            if baseline and name in base_ops:
+                base = base_ops[name]["median_ms"]
+                ratio = stats["median_ms"] / base if base else float("inf")
+                line += f" {base:>10.3f} {ratio:>7.2f}"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks do quadro Kanban com bancos sintéticos")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help=f"tamanhos dos bancos, separados por vírgula (padrão: {DEFAULT_SIZES})")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="repetições das operações sobre o quadro inteiro (construção, carga, salvamento)")
+    parser.add_argument("--ops", type=int, default=30,
+                        help="repetições das operações sobre uma tarefa (mover, editar, excluir)")
+    parser.add_argument("--output", metavar="ARQUIVO", help="grava o resultado em JSON")
+    parser.add_argument("--compare", metavar="ARQUIVO", help="compara com um resultado JSON anterior")
+    parser.add_argument("--json", action="store_true", help="imprime o resultado em JSON")
+    parser.add_argument("--child", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        print(json.dumps(run_size(args.child, args.repeat, args.ops)))
+        return 0
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    result = {
+        "benchmark": "board",
+        "environment": environment(),
+        "sizes": [run_child(size, args) for size in sizes]
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+    if args.json:
+        print(json.dumps(result))
+    else:
+        baseline = None
+        if args.compare:
+            with open(args.compare, encoding="utf-8") as f:
+                baseline = json.load(f)
+        print_table(result, baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark de regressão do drag and drop entre colunas.
+
+Mede o tempo de soltar um cartão em outra coluna (dropEvent da visão, mais o
+processamento de eventos de layout e pintura que ele gera) em um quadro
+pequeno e em um grande, com todas as tarefas carregadas nas colunas. Como o
+drop atualiza apenas a linha de origem, a de destino e os dois contadores,
+o custo não deve crescer com o tamanho do quadro.
+
+Cada tamanho roda em um processo separado, com seu próprio banco sintético.
+
+Uso:
+    python benchmarks/bench_drag_drop.py --small 5 --large 5000 --max-ratio 3
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from statistics import median
+
+from common import BENCH_COLUMNS, enter_temp_dir, percentile, populate, settle, shutdown
+
+
+def drop_card(app, source, destination):
+    """Arrasta o primeiro cartão visível de ``source`` para o topo de ``destination``"""
+    from PySide6.QtCore import Qt, QPointF
+    from PySide6.QtGui import QDropEvent
+
+    index = source.model.index(0)
+    mime = source.model.mimeData([index])
+
+    view = destination.task_list
+    target = view.visualRect(destination.model.index(0))
+    point = QPointF(target.center().x(), target.top() + 2) if target.isValid() else QPointF(10, 10)
+
+    event = QDropEvent(point, Qt.DropAction.MoveAction, mime,
+                       Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier)
+    view.dropEvent(event)
+    app.processEvents()
+
+
+def run_board(per_column, iterations, warmup):
+    """Mede os drops em um quadro com ``per_column`` tarefas em cada coluna"""
+    enter_temp_dir()
+
+    from PySide6.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+
+    from app.utils.task_repository import get_repository
+    populate(get_repository(), per_column * len(BENCH_COLUMNS))
+
+    from app.components.kanban_board import KanbanBoard
+    board = KanbanBoard()
+    board.resize(1200, 800)
+    board.show()
+
+    # Pior caso: todas as tarefas carregadas nos modelos das colunas
+    for column in board.columns.values():
+        column.load_all()
+    settle(app)
+
+    first, second = board.columns["to_do"], board.columns["doing"]
+    samples = []
+    for i in range(warmup + iterations):
+        # Alternar a direção mantém o tamanho das colunas estável
+        source, destination = (first, second) if i % 2 == 0 else (second, first)
+        start = time.perf_counter()
+        drop_card(app, source, destination)
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            samples.append(elapsed)
+
+    loaded = {column_id: column.model.rowCount() for column_id, column in board.columns.items()}
+    shutdown()
+
+    return {
+        "per_column": per_column,
+        "loaded": loaded,
+        "iterations": iterations,
+        "median_ms": round(median(samples) * 1000, 4),
+        "p95_ms": round(percentile(samples, 0.95) * 1000, 4)
+    }
+
+
+def run_child(per_column, args):
+    """Roda a medição de um tamanho em um processo separado"""
+    command = [sys.executable, os.path.abspath(__file__), "--child", str(per_column),
+               "--iterations", str(args.iterations), "--warmup", str(args.warmup)]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo do drag and drop em quadros pequenos e grandes")
+    parser.add_argument("--small", type=int, default=5, help="tarefas por coluna no quadro pequeno")
+    parser.add_argument("--large", type=int, default=5000, help="tarefas por coluna no quadro grande")
+    parser.add_argument("--iterations", type=int, default=200, help="drops medidos")
+    parser.add_argument("--warmup", type=int, default=20, help="drops descartados antes de medir")
+    parser.add_argument("--max-ratio", type=float, default=3.0,
+                        help="razão máxima aceita entre as medianas do quadro grande e do pequeno")
+    parser.add_argument("--json", action="store_true", help="imprime o resultado em JSON")
+    parser.add_argument("--child", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        print(json.dumps(run_board(args.child, args.iterations, args.warmup)))
+        return 0
+
+    small = run_child(args.small, args)
+    large = run_child(args.large, args)
+    ratio = large["median_ms"] / small["median_ms"] if small["median_ms"] else float("inf")
+    passed = ratio <= args.max_ratio
+
+    result = {
+        "benchmark": "drag_drop",
+        "small": small,
+        "large": large,
+        "ratio": round(ratio, 3),
+        "max_ratio": args.max_ratio,
+        "passed": passed
+    }
+    if args.json:
+        print(json.dumps(result))
+    else:
+        for label, data in (("Pequeno", small), ("Grande", large)):
+            print(f"{label}: 3x{data['per_column']} tarefas - "
+                  f"mediana {data['median_ms']} ms, p95 {data['p95_ms']} ms")
+        print(f"Razão grande/pequeno: {result['ratio']} (máximo {args.max_ratio}) - "
+              f"{'OK' if passed else 'FALHOU'}")
+
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
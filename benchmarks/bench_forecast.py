@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tempo da previsão de conclusão (simulação de Monte Carlo) com um histórico longo.
+
+Grava anos de histórico sintético de eventos em um banco temporário e mede
+a previsão completa (leitura da vazão diária, simulações e percentis) com a
+vazão dos últimos 90 dias e de todo o histórico, além da simulação sozinha
+para quantidades crescentes de tarefas.
+
+Uso:
+    python benchmarks/bench_forecast.py --years 10 --trials 10000
+"""
+
+import argparse
+import json
+import sys
+import time
+from statistics import median
+
+from common import enter_temp_dir, synthetic_history
+
+
+def measure(function, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tempo da previsão de conclusão por Monte Carlo")
+    parser.add_argument("--years", type=float, default=10.0, help="anos de histórico (padrão: 10)")
+    parser.add_argument("--arrivals", type=int, default=20, help="tarefas novas por dia (padrão: 20)")
+    parser.add_argument("--trials", type=int, default=10000, help="simulações (padrão: 10000)")
+    parser.add_argument("--items", default="40,400,4000", help="tarefas pendentes simuladas, separadas por vírgula")
+    parser.add_argument("--repeat", type=int, default=5, help="repetições de cada medição")
+    parser.add_argument("--json", action="store_true", help="imprime o resultado em JSON")
+    args = parser.parse_args()
+
+    enter_temp_dir()
+    from app.utils.forecast import daily_throughput, forecast, simulate_days
+    from app.utils.task_repository import get_repository
+    repository = get_repository()
+
+    start = time.perf_counter()
+    events = synthetic_history(repository, int(args.years * 365), args.arrivals)
+    history_seconds = time.perf_counter() - start
+
+    items = [int(value) for value in args.items.split(",") if value]
+    first = forecast(items[0], repository, history_days=None, trials=args.trials)
+    throughput = daily_throughput(repository, first["history_start"], first["history_end"])
+
+    result = {
+        "benchmark": "forecast",
+        "events": events,
+        "history_days": int(throughput.size),
+        "trials": args.trials,
+        "history_seconds": round(history_seconds, 2),
+        "forecast_90_days_ms": round(measure(
+            lambda: forecast(items[0], repository, history_days=90, trials=args.trials), args.repeat), 2),
+        "forecast_all_ms": round(measure(
+            lambda: forecast(items[0], repository, history_days=None, trials=args.trials), args.repeat), 2),
+        "simulate_ms": {
+            count: round(measure(lambda: simulate_days(throughput, count, args.trials), args.repeat), 2)
+            for count in items
+        }
+    }
+    repository.close()
+
+    if args.json:
+        print(json.dumps(result))
+        return 0
+
+    print(f"{events} eventos sintéticos ({result['history_days']} dias) gravados em {history_seconds:.2f} s")
+    print(f"  previsão com os últimos 90 dias ({args.trials} simulações): {result['forecast_90_days_ms']:>9.2f} ms")
+    print(f"  previsão com todo o histórico ({args.trials} simulações):   {result['forecast_all_ms']:>9.2f} ms")
+    for count, milliseconds in result["simulate_ms"].items():
+        print(f"  simulação de {count} tarefas: {milliseconds:>9.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
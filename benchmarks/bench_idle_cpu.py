@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Mede o uso de CPU do quadro Kanban parado.
+
+Cria um banco sintético em um diretório temporário, monta o KanbanBoard em
+modo offscreen e deixa o loop de eventos rodando sem nenhuma interação. Com
+o quadro ocioso o uso de CPU deve ficar próximo de 0%.
+
+Uso:
+    python benchmarks/bench_idle_cpu.py --tasks 3000 --seconds 10
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from common import enter_temp_dir, populate, settle, shutdown
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uso de CPU do quadro Kanban ocioso")
+    parser.add_argument("--tasks", type=int, default=3000, help="tarefas no banco sintético")
+    parser.add_argument("--seconds", type=float, default=10.0, help="tempo de medição")
+    parser.add_argument("--max-cpu", type=float, default=None,
+                        help="falha (código 1) se o uso de CPU passar deste percentual")
+    parser.add_argument("--json", action="store_true", help="imprime o resultado em JSON")
+    args = parser.parse_args()
+
+    enter_temp_dir()
+
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QTimer
+
+    app = QApplication(sys.argv)
+
+    from app.utils.task_repository import get_repository
+    populate(get_repository(), args.tasks)
+
+    from app.components.kanban_board import KanbanBoard
+    board = KanbanBoard()
+    board.resize(1200, 800)
+    board.show()
+
+    # Deixar a carga inicial terminar antes de medir
+    settle(app, 1.0)
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    QTimer.singleShot(int(args.seconds * 1000), app.quit)
+    app.exec()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+
+    shutdown()
+
+    result = {
+        "benchmark": "idle_cpu",
+        "tasks": args.tasks,
+        "seconds": round(wall, 3),
+        "cpu_seconds": round(cpu, 4),
+        "cpu_percent": round(100.0 * cpu / wall, 3)
+    }
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(f"Tarefas: {result['tasks']}")
+        print(f"Tempo medido: {result['seconds']} s")
+        print(f"CPU: {result['cpu_seconds']} s ({result['cpu_percent']}%)")
+
+    if args.max_cpu is not None and result["cpu_percent"] > args.max_cpu:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
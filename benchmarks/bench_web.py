@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Teste de carga da versão web (app.py).
+
+Cria um banco sintético em um diretório temporário, sobe o app.py em modo
+--serve-only com cada servidor (o de desenvolvimento do Flask e o waitress)
+e dispara requisições a /api/load a partir de vários clientes simultâneos,
+cada um com a sua conexão keep-alive:
+
+    load_gzip     quadro completo, compactado (Accept-Encoding: gzip)
+    load_plain    quadro completo, sem compressão
+    load_cached   If-None-Match com a versão atual (resposta 304)
+
+O resultado traz requisições/s, mediana e p95 da latência, em ms, e o
+tamanho médio das respostas.
+
+Uso:
+    python benchmarks/bench_web.py --tasks 2000 --clients 8 --duration 5
+    python benchmarks/bench_web.py --servers waitress --threads 16
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from statistics import median
+
+from common import enter_temp_dir, percentile, populate
+
+APP_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+SCENARIOS = {
+    "load_gzip": {"Accept-Encoding": "gzip"},
+    "load_plain": {"Accept-Encoding": "identity"},
+    "load_cached": {"Accept-Encoding": "gzip"}
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(server, port, threads):
+    """Sobe o app.py e espera até ele aceitar conexões"""
+    process = subprocess.Popen(
+        [sys.executable, APP_FILE, "--serve-only", "--server", server,
+         "--port", str(port), "--threads", str(threads)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.perf_counter() + 30
+    while time.perf_counter() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"o servidor {server} terminou ao iniciar")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return process
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError(f"o servidor {server} não respondeu")
+
+
+def current_etag(port):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    conn.request("GET", "/api/load", headers={"Accept-Encoding": "gzip"})
+    response = conn.getresponse()
+    response.read()
+    conn.close()
+    return response.getheader("ETag")
+
+
+def client(port, headers, stop, results):
+    """Repete a requisição até ``stop``; guarda latências e bytes recebidos"""
+    latencies, sizes, errors = [], [], 0
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            conn.request("GET", "/api/load", headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+            if response.status not in (200, 304):
+                errors += 1
+            if response.will_close:
+                conn.close()
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+            continue
+        latencies.append(time.perf_counter() - start)
+        sizes.append(len(body))
+    conn.close()
+    results.append((latencies, sizes, errors))
+
+
+def run_scenario(port, headers, clients, duration):
+    stop = threading.Event()
+    results = []
+    threads = [
+        threading.Thread(target=client, args=(port, headers, stop, results))
+        for _ in range(clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies = [value for result in results for value in result[0]]
+    sizes = [value for result in results for value in result[1]]
+    if not latencies:
+        return {"requests": 0, "errors": sum(result[2] for result in results)}
+    return {
+        "requests": len(latencies),
+        "errors": sum(result[2] for result in results),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "median_ms": round(median(latencies) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "bytes_per_response": round(sum(sizes) / len(sizes))
+    }
+
+
+def run_server(server, args):
+    port = free_port()
+    process = start_server(server, port, args.threads)
+    try:
+        results = {}
+        for name, headers in SCENARIOS.items():
+            headers = dict(headers)
+            if name == "load_cached":
+                headers["If-None-Match"] = current_etag(port)
+            results[name] = run_scenario(port, headers, args.clients, args.duration)
+        return results
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga de /api/load na versão web")
+    parser.add_argument("--servers", default="dev,waitress",
+                        help="servidores a comparar, separados por vírgula (padrão: dev,waitress)")
+    parser.add_argument("--tasks", type=int, default=2000, help="tarefas no banco sintético (padrão: 2000)")
+    parser.add_argument("--clients", type=int, default=8, help="clientes simultâneos (padrão: 8)")
+    parser.add_argument("--threads", type=int, default=4, help="threads do waitress (padrão: 4)")
+    parser.add_argument("--duration", type=float, default=5.0, help="segundos por cenário (padrão: 5)")
+    parser.add_argument("--json", action="store_true", help="imprime o resultado em JSON")
+    args = parser.parse_args()
+
+    enter_temp_dir()
+    from app.utils.task_repository import get_repository
+    repository = get_repository()
+    populate(repository, args.tasks)
+    repository.close()
+
+    result = {
+        "benchmark": "web",
+        "tasks": args.tasks,
+        "clients": args.clients,
+        "servers": {server: run_server(server, args) for server in args.servers.split(",") if server}
+    }
+
+    if args.json:
+        print(json.dumps(result))
+        return 0
+
+    print(f"{args.tasks} tarefas, {args.clients} clientes, {args.duration:g} s por cenário")
+    print(f"  {'servidor':<10} {'cenário':<12} {'req/s':>9} {'mediana (ms)':>13} {'p95 (ms)':>10} "
+          f"{'bytes/resp':>11} {'erros':>6}")
+    for server, scenarios in result["servers"].items():
+        for name, stats in scenarios.items():
+            if not stats["requests"]:
+                print(f"  {server:<10} {name:<12} {'-':>9}")
+                continue
+            print(f"  {server:<10} {name:<12} {stats['requests_per_second']:>9.1f} {stats['median_ms']:>13.2f} "
+                  f"{stats['p95_ms']:>10.2f} {stats['bytes_per_response']:>11} {stats['errors']:>6}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Funções compartilhadas pelos benchmarks.
+
+Os benchmarks rodam sem janela (QT_QPA_PLATFORM=offscreen) e sempre em um
+diretório temporário, que também é a pasta de dados (SNAPDEV_DATA_DIR),
+para não tocar no banco de tarefas do usuário.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Colunas usadas nos bancos sintéticos
+BENCH_COLUMNS = ("to_do", "doing", "done")
+
+
+def enter_temp_dir(prefix="snapdev_bench_"):
+    """Muda para um diretório temporário novo, usado também como pasta de dados"""
+    path = tempfile.mkdtemp(prefix=prefix)
+    os.chdir(path)
+    os.environ["SNAPDEV_DATA_DIR"] = path
+    return path
+
+
+def synthetic_tasks(count, columns=BENCH_COLUMNS):
+    """Gera ``count`` tarefas distribuídas igualmente entre as colunas"""
+    from app.utils.task_ids import new_task_ids
+    priorities = ("Baixa", "Média", "Alta")
+    for i, task_id in enumerate(new_task_ids(count)):
+        yield {
+            "id": task_id,
+            "title": f"Tarefa {i}",
+            "description": "Descrição da tarefa sintética",
+            "priority": priorities[i % len(priorities)],
+            "column": columns[i % len(columns)],
+            "position": float(i)
+        }
+
+
+def synthetic_history(repository, days, arrivals_per_day=20, seed=1):
+    """Grava ``days`` dias de histórico sintético de eventos, até hoje.
+
+    A cada dia chegam em média ``arrivals_per_day`` tarefas em "to_do", que
+    começam após alguns dias e são concluídas alguns dias depois; as mais
+    recentes ficam pelo caminho. Os eventos são inseridos diretamente em
+    task_events (com datas no passado), o que também atualiza os agregados
+    diários pelos triggers. Retorna o número de eventos gravados.
+    """
+    import random
+    from app.utils.task_ids import new_task_id
+    rng = random.Random(seed)
+    now = time.time()
+    start = now - days * 86400
+    events = []
+    for day in range(days):
+        for _ in range(rng.randint(arrivals_per_day // 2, arrivals_per_day * 3 // 2)):
+            task_id = new_task_id()
+            created = start + (day + rng.random()) * 86400
+            started = created + rng.expovariate(1 / 3) * 86400
+            done = started + rng.lognormvariate(1.2, 0.7) * 86400
+            events.append((task_id, created, "create", None, "to_do"))
+            if started < now:
+                events.append((task_id, started, "move", "to_do", "doing"))
+                if done < now:
+                    events.append((task_id, done, "move", "doing", "done"))
+    repository.init_schema()
+    conn = repository.connection()
+    with conn:
+        conn.executemany(
+            "INSERT INTO task_events (task_id, ts, kind, from_column, to_column) VALUES (?, ?, ?, ?, ?)",
+            events
+        )
+    return len(events)
+
+
+def populate(repository, count, columns=BENCH_COLUMNS):
+    """Cria o esquema e grava ``count`` tarefas sintéticas no repositório"""
+    repository.init_schema()
+    repository.save_tasks(list(synthetic_tasks(count, columns)))
+
+
+def settle(app, seconds=0.2):
+    """Processa eventos pendentes (layout, pintura) durante alguns instantes"""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        app.processEvents()
+
+
+def percentile(samples, fraction):
+    """Percentil por interpolação linear de uma lista de amostras"""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def shutdown():
+    """Grava as alterações pendentes e fecha a conexão com o banco"""
+    from app.utils.write_queue import close_write_queue
+    from app.utils.task_repository import get_repository
+    close_write_queue()
+    get_repository().close()